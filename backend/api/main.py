@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -13,8 +14,27 @@ load_dotenv()
 from api.routers.presentation.router import presentation_router
 from api.routers.config import router as config_router
 from api.services.database import sql_engine
+from api.services.http_client import http_clients
+from api.services.image_search_cache import image_search_cache
+from api.services.image_store import image_store
+from api.services.llm_clients import llm_clients
+from api.services.llm_response_cache import llm_response_cache
 from api.services.presentation_storage import presentation_storage
+from api.services.presentation_templates import presentation_templates
+from api.services.picture_render_pool import picture_render_pool
+from api.services.processed_image_cache import processed_image_cache
+from api.services.render_executor import render_executor
+from api.services.slide_part_cache import slide_part_cache
 from api.utils import update_env_with_user_config
+from image_processor.unsplash_client import SearchKeywordsBatch
+from ppt_config_generator.models import PresentationTitlesModel
+from ppt_generator.fix_validation_errors import schema_repair
+from ppt_generator.models.content_type_models import CONTENT_TYPE_MAPPING
+from ppt_generator.models.llm_models import (
+    LLM_CONTENT_TYPE_MAPPING,
+    LLMPresentationPlanModel,
+)
+from ppt_generator.models.other_models import SlideTypeModel
 
 # Import authentication components
 from auth.routes import router as auth_router
@@ -33,9 +53,33 @@ async def lifespan(_: FastAPI):
     
     # Create authentication database tables
     create_db_and_tables()
+
+    image_search_cache.purge_expired()
+
+    # Structured output schemas are generated once instead of per request
+    llm_clients.prepare_schemas(
+        [
+            *CONTENT_TYPE_MAPPING.values(),
+            *LLM_CONTENT_TYPE_MAPPING.values(),
+            LLMPresentationPlanModel,
+            PresentationTitlesModel,
+            SearchKeywordsBatch,
+            SlideTypeModel,
+        ]
+    )
+
+    # Exports clone the prepared base package instead of parsing the template
+    presentation_templates.get_template()
+
+    # Pooled outbound HTTP sessions shared by every request
+    await http_clients.start()
     
     yield
 
+    await http_clients.close()
+    render_executor.shutdown()
+    picture_render_pool.shutdown()
+
 
 app = FastAPI(lifespan=lifespan)
 origins = ["*"]
@@ -128,7 +172,48 @@ async def catch_static_errors(request: Request, call_next):
 @app.get("/storage/stats")
 async def get_storage_stats():
     """Get current storage statistics."""
-    return presentation_storage.get_storage_stats()
+    return {
+        **presentation_storage.get_storage_stats(),
+        "processed_image_cache": processed_image_cache.get_stats(),
+        "image_search_cache": image_search_cache.get_stats(),
+        "image_store": image_store.get_stats(),
+    }
+
+
+@app.delete("/storage/image_search_cache")
+async def invalidate_image_search_cache(
+    prompt: Optional[str] = None, kind: Optional[str] = None
+):
+    """Invalidate cached search keywords and results, optionally for one prompt or kind."""
+    removed = image_search_cache.invalidate(prompt=prompt, kind=kind)
+    return {"message": "Image search cache invalidated", "removed": removed}
+
+
+@app.get("/render/stats")
+async def get_render_stats():
+    """Get the render executor queue and reuse of templates and rendered slides."""
+    return {
+        **render_executor.get_stats(),
+        "templates": presentation_templates.get_stats(),
+        "slide_parts": slide_part_cache.get_stats(),
+    }
+
+
+@app.get("/llm/stats")
+async def get_llm_stats():
+    """Get reuse of LLM clients, cached LLM responses and local repairs of invalid ones."""
+    return {
+        "clients": llm_clients.get_stats(),
+        "response_cache": llm_response_cache.get_stats(),
+        "schema_repair": schema_repair.get_stats(),
+    }
+
+
+@app.delete("/llm/response_cache")
+async def clear_llm_response_cache():
+    """Drop every cached slide edit and slide type response."""
+    removed = llm_response_cache.clear()
+    return {"message": "LLM response cache cleared", "removed": removed}
 
 
 @app.post("/storage/cleanup")
@@ -142,6 +227,7 @@ async def manual_cleanup():
 async def delete_presentation(presentation_id: str):
     """Delete a specific presentation."""
     success = presentation_storage.delete_presentation(presentation_id)
+    slide_part_cache.remove(presentation_id)
     if success:
         return {"message": f"Presentation {presentation_id} deleted successfully"}
     else:
@@ -47,6 +47,41 @@ class SSEStatusResponse(BaseModel):
         ).to_string()
 
 
+class SSESlideResponse(BaseModel):
+    slide: dict
+
+    def to_string(self):
+        return SSEResponse(
+            event="response", data=json.dumps({"type": "slide", "slide": self.slide})
+        ).to_string()
+
+
+class SSEImageResponse(BaseModel):
+    slide_index: int
+    image_index: int
+    path: str
+
+    def to_string(self):
+        return SSEResponse(
+            event="response",
+            data=json.dumps(
+                {
+                    "type": "image",
+                    "slide_index": self.slide_index,
+                    "image_index": self.image_index,
+                    "path": self.path,
+                }
+            ),
+        ).to_string()
+
+
+class SSEHeartbeatResponse(BaseModel):
+
+    def to_string(self):
+        # Comment lines keep the connection alive and are ignored by EventSource
+        return ": keepalive\n\n"
+
+
 class SSECompleteResponse(BaseModel):
     key: str
     value: object
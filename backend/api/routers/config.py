@@ -2,6 +2,7 @@ import json
 import os
 from fastapi import APIRouter, HTTPException
 from api.models import UserConfig
+from api.services.llm_clients import llm_clients
 from api.utils import get_user_config
 
 router = APIRouter(prefix="/config", tags=["config"])
@@ -31,8 +32,9 @@ async def save_config(config: UserConfig):
         # Update environment variables
         if config.LLM:
             os.environ["LLM"] = config.LLM
-        if config.GOOGLE_API_KEY:
+        if config.GOOGLE_API_KEY and os.getenv("GOOGLE_API_KEY") != config.GOOGLE_API_KEY:
             os.environ["GOOGLE_API_KEY"] = config.GOOGLE_API_KEY
+            llm_clients.refresh()
             
         return {"message": "Configuration saved successfully"}
     except Exception as e:
@@ -1,5 +1,6 @@
 import os
-from fastapi import HTTPException, Response
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
 from api.services.logging import LoggingService
 from api.models import LogMetadata
 from api.utils import get_presentation_dir, sanitize_filename
@@ -47,27 +48,17 @@ class DownloadPptxHandler:
 
             filename = sanitize_filename(f"{title}.pptx")
             
-            # Read the file content
-            try:
-                with open(presentation.file, "rb") as file:
-                    file_content = file.read()
-            except Exception as e:
-                logging_service.logger.error(
-                    f"Error reading presentation file: {str(e)}",
-                    extra=log_metadata.model_dump(),
-                )
-                raise HTTPException(status_code=500, detail="Error reading presentation file")
+            file_path = presentation.file
 
-            logging_service.logger.info(
-                f"Successfully read presentation file for download: {filename}",
-                extra=log_metadata.model_dump(),
-            )
+        logging_service.logger.info(
+            f"Streaming presentation file for download: {filename}",
+            extra=log_metadata.model_dump(),
+        )
 
-            # Return the file as a downloadable attachment
-            return Response(
-                content=file_content,
-                media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"'
-                }
-            )
+        # Streamed in chunks with Content-Length, ETag and Range support so
+        # the deck is never held in memory and interrupted downloads can resume
+        return FileResponse(
+            path=file_path,
+            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            filename=filename,
+        )
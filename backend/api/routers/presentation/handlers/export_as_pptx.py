@@ -5,11 +5,16 @@ from api.routers.presentation.mixins.fetch_presentation_assets import (
     FetchPresentationAssetsMixin,
 )
 from api.routers.presentation.models import (
+    ExportAsPptxResponse,
     ExportAsRequest,
-    PresentationAndPath,
 )
 from api.services.logging import LoggingService
 from api.services.instances import temp_file_service
+from api.services.picture_render_pool import picture_render_pool
+from api.services.presentation_templates import presentation_templates
+from api.services.processed_image_cache import processed_image_cache
+from api.services.render_executor import render_executor
+from api.services.slide_part_cache import slide_part_cache
 from api.sql_models import PresentationSqlModel
 from api.utils import get_presentation_dir, sanitize_filename
 from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
@@ -35,6 +40,13 @@ class ExportAsPptxHandler(FetchPresentationAssetsMixin):
     def __del__(self):
         temp_file_service.cleanup_temp_dir(self.temp_dir)
 
+    def render_pptx(self, ppt_creator: PptxPresentationCreator, ppt_path: str):
+        ppt_creator.create_ppt(
+            picture_executor=picture_render_pool.executor,
+            picture_workers=picture_render_pool.workers,
+        )
+        ppt_creator.save(ppt_path)
+
     async def post(self, logging_service: LoggingService, log_metadata: LogMetadata):
         logging_service.logger.info(
             logging_service.message(self.data.model_dump(mode="json")),
@@ -66,15 +78,44 @@ class ExportAsPptxHandler(FetchPresentationAssetsMixin):
             self.presentation_dir,
             sanitize_filename(f"{title}.pptx")
         )
-        ppt_creator = PptxPresentationCreator(self.data.pptx_model, self.temp_dir)
-        ppt_creator.create_ppt()
-        ppt_creator.save(ppt_path)
+        previous_slides = None
+        if self.data.incremental:
+            previous_slides = slide_part_cache.get(self.data.presentation_id)
+
+        ppt_creator = PptxPresentationCreator(
+            self.data.pptx_model,
+            self.temp_dir,
+            image_cache=processed_image_cache,
+            template_cache=presentation_templates,
+            previous_slides=previous_slides,
+        )
+        # Rendering blocks, so it runs on the render executor instead of the event loop
+        await render_executor.run(self.render_pptx, ppt_creator, ppt_path)
+
+        if ppt_creator.rendered_slides is not None:
+            slides_reused = ppt_creator.slides_reused
+            slide_part_cache.put(
+                self.data.presentation_id,
+                ppt_creator.rendered_slides,
+                reused=slides_reused,
+                rebuilt=len(self.data.pptx_model.slides) - slides_reused,
+            )
+
+        if ppt_creator.render_stats:
+            logging_service.logger.info(
+                logging_service.message(
+                    ppt_creator.render_stats.model_dump(mode="json")
+                ),
+                extra=log_metadata.model_dump(),
+            )
 
         # Return just the filename instead of the full path for URL construction
         filename = sanitize_filename(f"{title}.pptx")
         
-        response = PresentationAndPath(
-            presentation_id=self.data.presentation_id, path=filename
+        response = ExportAsPptxResponse(
+            presentation_id=self.data.presentation_id,
+            path=filename,
+            render_stats=ppt_creator.render_stats,
         )
 
         with get_sql_session() as sql_session:
@@ -100,12 +141,9 @@ class ExportAsPptxHandler(FetchPresentationAssetsMixin):
                 extra=log_metadata.model_dump(),
             )
             try:
-                # Read the generated PPT file
-                with open(ppt_path, 'rb') as f:
-                    ppt_content = f.read()
-                
+                # The generated PPT file is streamed from disk, not read into memory
                 logging_service.logger.info(
-                    f"Read PPT file content, size: {len(ppt_content)} bytes",
+                    f"Saving PPT file, size: {os.path.getsize(ppt_path)} bytes",
                     extra=log_metadata.model_dump(),
                 )
                 
@@ -115,7 +153,7 @@ class ExportAsPptxHandler(FetchPresentationAssetsMixin):
                     user_presentation = await file_manager.save_presentation_async(
                         user_id=self.current_user.id,
                         title=title,
-                        file_content=ppt_content,
+                        file_path=ppt_path,
                         file_extension=".pptx",
                         session=auth_session,
                         use_uploadthing=True  # Use UploadThing for new presentations
@@ -8,6 +8,7 @@ from api.routers.presentation.models import (
 from api.services.logging import LoggingService
 from api.services.instances import temp_file_service
 from api.utils import get_presentation_dir, get_presentation_images_dir
+from image_processor.image_scheduler import INTERACTIVE_PRIORITY, image_scheduler
 from image_processor.images_finder import generate_image
 
 
@@ -29,7 +30,9 @@ class GenerateImageHandler:
         )
 
         images_directory = get_presentation_images_dir(self.data.presentation_id)
-        image_path = await generate_image(self.data.prompt, images_directory)
+        image_path = await image_scheduler.run_with_priority(
+            INTERACTIVE_PRIORITY, generate_image, self.data.prompt, images_directory
+        )
 
         response = PresentationAndPaths(
             presentation_id=self.data.presentation_id, paths=[image_path]
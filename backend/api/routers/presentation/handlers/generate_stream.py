@@ -1,12 +1,21 @@
 import asyncio
 import json
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlmodel import delete
 
-from api.models import LogMetadata, SSECompleteResponse, SSEResponse, SSEStatusResponse
+from api.models import (
+    LogMetadata,
+    SSECompleteResponse,
+    SSEHeartbeatResponse,
+    SSEImageResponse,
+    SSEResponse,
+    SSESlideResponse,
+    SSEStatusResponse,
+)
 
 from api.routers.presentation.models import (
     PresentationAndSlides,
@@ -16,11 +25,20 @@ from api.services.database import get_sql_session
 from api.services.logging import LoggingService
 from api.sql_models import KeyValueSqlModel, PresentationSqlModel, SlideSqlModel
 from api.utils import get_presentation_dir, get_presentation_images_dir
-from image_processor.images_finder import generate_image
-from ppt_generator.generator import generate_presentation_stream
-from ppt_generator.models.llm_models import LLMPresentationModel
+from image_processor.image_scheduler import image_scheduler
+from image_processor.images_finder import generate_image, generate_search_keywords
+from ppt_generator.generator import (
+    generate_presentation_slides,
+    generate_presentation_stream,
+    get_slide_generation_settings,
+)
+from ppt_generator.models.llm_models import LLMPresentationModel, LLMSlideModel
+from ppt_generator.models.query_and_prompt_models import (
+    ImagePromptWithThemeAndAspectRatio,
+)
 from ppt_generator.models.slide_model import SlideModel
 from ppt_generator.slide_model_utils import SlideModelUtils
+from ppt_generator.slides_stream_parser import SlidesStreamParser
 from api.services.instances import temp_file_service
 from langchain_core.output_parsers import JsonOutputParser
 
@@ -29,9 +47,23 @@ output_parser = JsonOutputParser(pydantic_object=LLMPresentationModel)
 
 class PresentationGenerateStreamHandler:
 
+    # Fetch images of each slide as soon as it is streamed instead of after
+    # the whole presentation is generated
+    pipeline_images = True
+    # Seconds without any event before a keep-alive heartbeat is sent
+    heartbeat_seconds = 10
+
     def __init__(self, presentation_id: str, session: str):
         self.session = session
         self.presentation_id = presentation_id
+        # Slide index -> (image prompts, task fetching their images)
+        self._image_jobs = {}
+        # Fetched images not yet sent to the client
+        self._image_events = []
+        self._image_events_ready = asyncio.Event()
+        self.generation_settings = get_slide_generation_settings()
+        # Slide contents generated by the LLM, in index order
+        self.slides_content: List[dict] = []
 
         self.temp_dir = temp_file_service.create_temp_dir(self.session)
         self.presentation_dir = get_presentation_dir(self.presentation_id)
@@ -86,31 +118,15 @@ class PresentationGenerateStreamHandler:
             event="response", data=json.dumps({"status": "Analyzing information 📊"})
         ).to_string()
 
-        presentation_text = ""
-        async for chunk in generate_presentation_stream(
-            self.titles,
-            presentation.prompt or "create presentation",
-            presentation.tone,
-            presentation.summary,
-        ):
-            presentation_text += chunk.content
-            yield SSEResponse(
-                event="response",
-                data=json.dumps({"type": "chunk", "chunk": chunk.content}),
-            ).to_string()
-
-        print("-" * 40)
-        print(presentation_text)
-        print("-" * 40)
-
-        presentation_json = output_parser.parse(presentation_text)
-
-        print("-" * 40)
-        print(presentation_json)
-        print("-" * 40)
+        if self.generation_settings.mode == "per_slide":
+            slides_stream = self.generate_slides_in_parallel(presentation)
+        else:
+            slides_stream = self.generate_slides_from_stream(presentation)
+        async for result in slides_stream:
+            yield result
 
         slide_models: List[SlideModel] = []
-        for i, content in enumerate(presentation_json["slides"]):
+        for i, content in enumerate(self.slides_content):
             content["index"] = i
             content["presentation"] = presentation.id
             slide_model = SlideModel(**content)
@@ -141,36 +157,228 @@ class PresentationGenerateStreamHandler:
 
         yield SSECompleteResponse(key="presentation", value=response).to_string()
 
-    async def fetch_slide_assets(self, slide_models: List[SlideModel]):
-        image_prompts = []
+    async def generate_slides_from_stream(self, presentation: PresentationSqlModel):
+        """Generate the whole presentation in one streamed LLM response."""
+        presentation_text = ""
+        slides_parser = SlidesStreamParser()
+        async for chunk in generate_presentation_stream(
+            self.titles,
+            presentation.prompt or "create presentation",
+            presentation.tone,
+            presentation.summary,
+        ):
+            presentation_text += chunk.content
+            yield SSEResponse(
+                event="response",
+                data=json.dumps({"type": "chunk", "chunk": chunk.content}),
+            ).to_string()
 
-        for each_slide_model in slide_models:
-            slide_model_utils = SlideModelUtils(self.theme, each_slide_model)
-            image_prompts.extend(slide_model_utils.get_image_prompts())
+            for each in self.pop_image_events():
+                yield each
 
-        images_directory = get_presentation_images_dir(self.presentation_id)
+            # Slides are handled as soon as they are complete in the stream,
+            # indexed by their position in the slides array
+            for index, content in slides_parser.feed(chunk.content):
+                slide_model = self.get_streamed_slide_model(content, index, presentation.id)
+                if not slide_model:
+                    continue
+
+                if self.pipeline_images:
+                    # Images of this slide are fetched while the rest is generated
+                    self.start_image_jobs([slide_model])
+
+                if self.matches_llm_slide_schema(content, slide_model.index):
+                    yield SSESlideResponse(
+                        slide=slide_model.model_dump(mode="json")
+                    ).to_string()
+
+        print("-" * 40)
+        print(presentation_text)
+        print("-" * 40)
+
+        presentation_json = output_parser.parse(presentation_text)
+
+        print("-" * 40)
+        print(presentation_json)
+        print("-" * 40)
+        self.slides_content = presentation_json["slides"]
+
+    async def generate_slides_in_parallel(self, presentation: PresentationSqlModel):
+        """Generate every slide with its own LLM call, several at once."""
+        slides_content: List[Optional[dict]] = [None] * len(self.titles)
+        # Slides are sent as chunks of the presentation JSON in index order,
+        # so clients reading the streamed document see the same shape
+        sent_count = 0
+        yield SSEResponse(
+            event="response", data=json.dumps({"type": "chunk", "chunk": '{"slides": ['})
+        ).to_string()
+
+        async for index, llm_slide_model in generate_presentation_slides(
+            self.titles,
+            presentation.prompt or "create presentation",
+            presentation.tone,
+            presentation.summary,
+            concurrency=self.generation_settings.concurrency,
+            retries=self.generation_settings.retries,
+        ):
+            content = llm_slide_model.model_dump(mode="json")
+            slides_content[index] = content
+
+            slide_model = self.get_streamed_slide_model(content, index, presentation.id)
+            if slide_model:
+                if self.pipeline_images:
+                    self.start_image_jobs([slide_model])
+                yield SSESlideResponse(slide=slide_model.model_dump(mode="json")).to_string()
+
+            for each in self.pop_image_events():
+                yield each
+
+            while sent_count < len(slides_content) and slides_content[sent_count]:
+                chunk = ", " if sent_count else ""
+                chunk += json.dumps(slides_content[sent_count])
+                yield SSEResponse(
+                    event="response", data=json.dumps({"type": "chunk", "chunk": chunk})
+                ).to_string()
+                sent_count += 1
 
-        coroutines = [
-            generate_image(
-                each,
-                images_directory,
+        yield SSEResponse(
+            event="response", data=json.dumps({"type": "chunk", "chunk": "]}"})
+        ).to_string()
+        self.slides_content = slides_content
+
+    def get_streamed_slide_model(
+        self, content: dict, index: int, presentation_id: str
+    ) -> Optional[SlideModel]:
+        try:
+            return SlideModel(**content, index=index, presentation=presentation_id)
+        except ValidationError as e:
+            print(f"Could not read streamed slide {index}: {e}")
+            return None
+
+    def matches_llm_slide_schema(self, content: dict, index: int) -> bool:
+        try:
+            LLMSlideModel(**content)
+            return True
+        except ValidationError as e:
+            # The slide is still sent with the complete presentation
+            print(f"Streamed slide {index} does not match slide schema: {e}")
+            return False
+
+    def start_image_jobs(self, slide_models: List[SlideModel]):
+        """Start fetching the images of ``slide_models`` unless already started."""
+        pending = []
+        for each_slide_model in slide_models:
+            image_prompts = SlideModelUtils(
+                self.theme, each_slide_model
+            ).get_image_prompts()
+            started = self._image_jobs.get(each_slide_model.index)
+            if started and started[0] == image_prompts:
+                continue
+            if started:
+                started[1].cancel()
+                del self._image_jobs[each_slide_model.index]
+            if image_prompts:
+                pending.append((each_slide_model.index, image_prompts))
+
+        if not pending:
+            return
+
+        # Slides started together share one keyword call
+        keywords_task = asyncio.ensure_future(
+            generate_search_keywords(
+                [each for _, image_prompts in pending for each in image_prompts]
+            )
+        )
+        offset = 0
+        for slide_index, image_prompts in pending:
+            # Provider calls are rate limited, earlier slides get their images first
+            task = asyncio.create_task(
+                image_scheduler.run_with_priority(
+                    slide_index,
+                    self.fetch_slide_images,
+                    slide_index,
+                    image_prompts,
+                    keywords_task,
+                    offset,
+                )
             )
-            for each in image_prompts
+            self._image_jobs[slide_index] = (image_prompts, task)
+            offset += len(image_prompts)
+
+    async def fetch_slide_images(
+        self,
+        slide_index: int,
+        image_prompts: List[ImagePromptWithThemeAndAspectRatio],
+        keywords_task: asyncio.Future,
+        offset: int,
+    ) -> List[str]:
+        images_directory = get_presentation_images_dir(self.presentation_id)
+        # Shielded as other slides still need the keywords if this one is cancelled
+        search_keywords = await asyncio.shield(keywords_task)
+        async def fetch_image(image_index: int, image_prompt, keywords) -> str:
+            image_path = await generate_image(image_prompt, images_directory, keywords)
+            self._image_events.append((image_prompts, slide_index, image_index, image_path))
+            self._image_events_ready.set()
+            return image_path
+
+        return await asyncio.gather(
+            *[
+                fetch_image(image_index, each, keywords)
+                for image_index, (each, keywords) in enumerate(
+                    zip(
+                        image_prompts,
+                        search_keywords[offset : offset + len(image_prompts)],
+                    )
+                )
+            ]
+        )
+
+    def pop_image_events(self) -> List[str]:
+        events = []
+        for image_prompts, slide_index, image_index, image_path in self._image_events:
+            started = self._image_jobs.get(slide_index)
+            # Images of jobs restarted with other prompts are outdated
+            if started and started[0] is image_prompts:
+                events.append(
+                    SSEImageResponse(
+                        slide_index=slide_index, image_index=image_index, path=image_path
+                    ).to_string()
+                )
+        self._image_events.clear()
+        self._image_events_ready.clear()
+        return events
+
+    async def fetch_slide_assets(self, slide_models: List[SlideModel]):
+        # Slides whose images were not started while streaming are started now
+        self.start_image_jobs(slide_models)
+        image_jobs = [
+            self._image_jobs[each.index][1] if each.index in self._image_jobs else None
+            for each in slide_models
         ]
 
-        assets_future = asyncio.gather(*coroutines)
+        yield SSEStatusResponse(status="Fetching slide assets").to_string()
 
-        while not assets_future.done():
-            status = SSEStatusResponse(status="Fetching slide assets").to_string()
-            yield status
-            await asyncio.sleep(5)
+        # Every image is sent as soon as it is fetched, and the stream moves on
+        # as soon as the last one is done
+        while True:
+            for each in self.pop_image_events():
+                yield each
 
-        assets = await assets_future
+            pending_jobs = [each for each in image_jobs if each and not each.done()]
+            if not pending_jobs:
+                break
 
-        images = assets
+            events_ready = asyncio.ensure_future(self._image_events_ready.wait())
+            done, _ = await asyncio.wait(
+                [*pending_jobs, events_ready],
+                timeout=self.heartbeat_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            events_ready.cancel()
+            if not done:
+                yield SSEHeartbeatResponse().to_string()
 
-        for each_slide_model in slide_models:
-            each_slide_model.images = images[: each_slide_model.images_count]
-            images = images[each_slide_model.images_count :]
+        for each_slide_model, each_job in zip(slide_models, image_jobs):
+            each_slide_model.images = each_job.result() if each_job else []
 
         yield SSEStatusResponse(status="Slide assets fetched").to_string()
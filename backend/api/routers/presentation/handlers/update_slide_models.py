@@ -9,6 +9,7 @@ from api.routers.presentation.models import (
     PresentationUpdateRequest,
     PresentationAndSlides,
 )
+from api.services.image_store import image_store
 from api.services.logging import LoggingService
 from api.sql_models import PresentationSqlModel, SlideSqlModel
 from api.utils import (
@@ -63,7 +64,10 @@ class UpdateSlideModelsHandler:
                     getattr(new_slide, "images")[i] = image_path
 
         if images_download_links:
-            await download_files(images_download_links, images_local_paths)
+            # Images of the deck are linked from the shared store
+            await download_files(
+                images_download_links, images_local_paths, store=image_store
+            )
 
         with get_sql_session() as sql_session:
             slide_sql_models = [
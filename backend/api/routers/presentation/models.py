@@ -2,6 +2,7 @@ from typing import List, Optional
 from pydantic import BaseModel
 
 from ppt_generator.models.pptx_models import PptxPresentationModel
+from ppt_generator.picture_transform import PictureRenderStats
 from ppt_generator.models.query_and_prompt_models import (
     ImagePromptWithThemeAndAspectRatio,
 )
@@ -48,6 +49,8 @@ class UpdatePresentationThemeRequest(BaseModel):
 class ExportAsRequest(BaseModel):
     presentation_id: str
     pptx_model: PptxPresentationModel
+    # Copy slides unchanged since the last export instead of rebuilding them
+    incremental: bool = True
 
 
 class PresentationAndSlides(BaseModel):
@@ -82,6 +85,10 @@ class PresentationAndPath(BaseModel):
     path: str
 
 
+class ExportAsPptxResponse(PresentationAndPath):
+    render_stats: Optional[PictureRenderStats] = None
+
+
 class PresentationAndPaths(BaseModel):
     presentation_id: str
     paths: List[str]
@@ -40,6 +40,7 @@ from api.routers.presentation.handlers.upload_presentation_thumbnail import (
 )
 from api.routers.presentation.models import (
     ExportAsRequest,
+    ExportAsPptxResponse,
     GenerateImageRequest,
     GeneratePresentationRequirementsRequest,
     PresentationAndPath,
@@ -192,7 +193,7 @@ async def generate_image(data: GenerateImageRequest):
 
 
 @presentation_router.post(
-    "/presentation/export_as_pptx", response_model=PresentationAndPath
+    "/presentation/export_as_pptx", response_model=ExportAsPptxResponse
 )
 async def export_as_pptx(
     data: ExportAsRequest,
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+from typing import Dict, List, Set, Tuple
+
+import aiohttp
+from pydantic import BaseModel
+
+
+class HttpClientConfig(BaseModel):
+    limit: int = 100
+    limit_per_host: int = 8
+    keepalive_timeout: float = 30
+    dns_cache_ttl: int = 300
+    total_timeout: float = 60
+    connect_timeout: float = 10
+
+
+class HttpClientRegistry:
+    """
+    Application scoped aiohttp sessions for outbound HTTP.
+
+    Every named client owns one pooled connector, so requests to the same host
+    reuse keep-alive connections and cached DNS lookups instead of paying for
+    DNS, TCP and TLS setup per call. Sessions are created in the app lifespan
+    and lazily for code running outside of it, like scripts.
+    """
+
+    def __init__(self):
+        self._configs: Dict[str, HttpClientConfig] = {}
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._session_loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        # Sessions replaced because the running loop changed, until closed
+        self._stale_sessions: List[
+            Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]
+        ] = []
+        self._closing_tasks: Set[asyncio.Task] = set()
+
+        # Try to read the per host limit from config, fallback to default
+        limit_per_host = 8
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    limit_per_host = config.get("http_limit_per_host", limit_per_host)
+        except Exception:
+            pass
+
+        self.register("default", HttpClientConfig(limit_per_host=limit_per_host))
+        # Presentation uploads are large and slow compared to API calls
+        self.register(
+            "uploadthing",
+            HttpClientConfig(limit_per_host=limit_per_host, total_timeout=300),
+        )
+
+    def register(self, name: str, config: HttpClientConfig):
+        self._configs[name] = config
+
+    def get(self, name: str = "default") -> aiohttp.ClientSession:
+        """Return the pooled session of client ``name``, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(name)
+        # A session is bound to the loop it was created on
+        if session is None or session.closed or self._session_loops[name] is not loop:
+            if session is not None and not session.closed:
+                self._close_stale_session(session, self._session_loops[name])
+            session = self._create_session(self._configs[name])
+            self._sessions[name] = session
+            self._session_loops[name] = loop
+        return session
+
+    def _close_stale_session(
+        self, session: aiohttp.ClientSession, session_loop: asyncio.AbstractEventLoop
+    ):
+        """Close ``session`` of an earlier loop so its pooled connections are released."""
+        self._stale_sessions = [
+            each for each in self._stale_sessions if not each[0].closed
+        ]
+        self._stale_sessions.append((session, session_loop))
+        if session_loop.is_running():
+            # Transports are not thread safe, close it on the loop that owns it
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        else:
+            # Connections of a loop that is closed already cannot be closed
+            # through it anymore, aiohttp drops them so they close when collected
+            task = asyncio.get_running_loop().create_task(session.close())
+            self._closing_tasks.add(task)
+            task.add_done_callback(self._closing_tasks.discard)
+
+    async def _close_session(
+        self, session: aiohttp.ClientSession, session_loop: asyncio.AbstractEventLoop
+    ):
+        if session.closed:
+            return
+        if session_loop is not asyncio.get_running_loop() and session_loop.is_running():
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            )
+        else:
+            await session.close()
+
+    def _create_session(self, config: HttpClientConfig) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=config.limit,
+            limit_per_host=config.limit_per_host,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=config.total_timeout, connect=config.connect_timeout
+            ),
+        )
+
+    async def start(self):
+        for name in self._configs:
+            self.get(name)
+
+    async def close(self):
+        sessions = [
+            (session, self._session_loops[name]) for name, session in self._sessions.items()
+        ]
+        sessions.extend(self._stale_sessions)
+        self._sessions.clear()
+        self._session_loops.clear()
+        self._stale_sessions.clear()
+        for session, session_loop in sessions:
+            await self._close_session(session, session_loop)
+
+
+# Global instance
+http_clients = HttpClientRegistry()
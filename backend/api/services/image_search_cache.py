@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func
+from sqlmodel import delete, select
+
+from api.services.database import get_sql_session
+from api.sql_models import ImageSearchCacheSqlModel
+
+KEYWORDS = "keywords"
+RESULTS = "results"
+
+
+class ImageSearchCache:
+    """
+    Two level cache for image search keywords and Unsplash results.
+
+    Entries are keyed by the normalized prompt plus search qualifiers like the
+    orientation. A bounded in-memory LRU sits in front of a database table
+    shared by every worker, and both levels expire entries after a TTL.
+    """
+
+    def __init__(self, max_memory_entries: int = 2048, ttl_hours: float = 7 * 24):
+        # Try to read cache TTL from config, fallback to default
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    ttl_hours = config.get("image_search_cache_ttl_hours", ttl_hours)
+        except Exception:
+            pass
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_memory_entries = max_memory_entries
+
+        self._lock = threading.Lock()
+        # key -> (kind, prompt hash, expires at, value)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters = {
+            kind: {"memory_hits": 0, "db_hits": 0, "misses": 0}
+            for kind in (KEYWORDS, RESULTS)
+        }
+
+    @staticmethod
+    def get_prompt_hash(prompt: str) -> str:
+        normalized = re.sub(r"\s+", " ", prompt).strip().lower()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get_key(self, kind: str, prompt: str, *qualifiers) -> str:
+        key_material = [kind, self.get_prompt_hash(prompt), *map(str, qualifiers)]
+        return hashlib.sha256("\n".join(key_material).encode("utf-8")).hexdigest()
+
+    def get(self, kind: str, prompt: str, *qualifiers) -> Optional[dict]:
+        key = self.get_key(kind, prompt, *qualifiers)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[2] > now:
+                self._memory.move_to_end(key)
+                self._counters[kind]["memory_hits"] += 1
+                return entry[3]
+            if entry:
+                del self._memory[key]
+
+        try:
+            with get_sql_session() as sql_session:
+                row = sql_session.get(ImageSearchCacheSqlModel, key)
+                if row and row.expires_at <= datetime.now():
+                    sql_session.delete(row)
+                    sql_session.commit()
+                    row = None
+                if row:
+                    value, expires_at = row.value, row.expires_at.timestamp()
+        except Exception as e:
+            print(f"Error reading image search cache: {e}")
+            row = None
+
+        with self._lock:
+            if not row:
+                self._counters[kind]["misses"] += 1
+                return None
+            self._counters[kind]["db_hits"] += 1
+            self._remember(key, (kind, self.get_prompt_hash(prompt), expires_at, value))
+        return value
+
+    def put(self, kind: str, prompt: str, value: dict, *qualifiers):
+        key = self.get_key(kind, prompt, *qualifiers)
+        prompt_hash = self.get_prompt_hash(prompt)
+        expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            self._remember(key, (kind, prompt_hash, expires_at, value))
+
+        try:
+            with get_sql_session() as sql_session:
+                sql_session.merge(
+                    ImageSearchCacheSqlModel(
+                        key=key,
+                        kind=kind,
+                        prompt_hash=prompt_hash,
+                        value=value,
+                        expires_at=datetime.fromtimestamp(expires_at),
+                    )
+                )
+                sql_session.commit()
+        except Exception as e:
+            print(f"Error writing image search cache: {e}")
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def invalidate(self, prompt: Optional[str] = None, kind: Optional[str] = None) -> int:
+        """Drop cached entries of ``prompt`` and/or ``kind``, or everything if neither is given."""
+        prompt_hash = self.get_prompt_hash(prompt) if prompt else None
+
+        def matches(entry_kind: str, entry_prompt_hash: str) -> bool:
+            return (not kind or entry_kind == kind) and (
+                not prompt_hash or entry_prompt_hash == prompt_hash
+            )
+
+        with self._lock:
+            for key in [
+                key for key, entry in self._memory.items() if matches(entry[0], entry[1])
+            ]:
+                del self._memory[key]
+
+        statement = delete(ImageSearchCacheSqlModel)
+        if kind:
+            statement = statement.where(ImageSearchCacheSqlModel.kind == kind)
+        if prompt_hash:
+            statement = statement.where(ImageSearchCacheSqlModel.prompt_hash == prompt_hash)
+        with get_sql_session() as sql_session:
+            removed = sql_session.exec(statement).rowcount
+            sql_session.commit()
+        return removed
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            now = time.time()
+            for key in [key for key, entry in self._memory.items() if entry[2] <= now]:
+                del self._memory[key]
+
+        with get_sql_session() as sql_session:
+            removed = sql_session.exec(
+                delete(ImageSearchCacheSqlModel).where(
+                    ImageSearchCacheSqlModel.expires_at <= datetime.now()
+                )
+            ).rowcount
+            sql_session.commit()
+        return removed
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = {"memory_entries": len(self._memory)}
+            for kind, counters in self._counters.items():
+                lookups = sum(counters.values())
+                hits = counters["memory_hits"] + counters["db_hits"]
+                stats[kind] = {
+                    **counters,
+                    "hit_rate": round(hits / lookups, 3) if lookups else 0,
+                }
+        try:
+            with get_sql_session() as sql_session:
+                stats["db_entries"] = sql_session.exec(
+                    select(func.count()).select_from(ImageSearchCacheSqlModel)
+                ).one()
+        except Exception:
+            pass
+        return stats
+
+
+# Global instance
+image_search_cache = ImageSearchCache()
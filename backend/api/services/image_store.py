@@ -0,0 +1,154 @@
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from typing import Optional
+
+from api.services.presentation_storage import presentation_storage
+
+
+class SharedImageStore:
+    """
+    Content-addressed store for downloaded images shared by all presentations.
+
+    Every image is stored once, keyed by its provider id (like the Unsplash
+    photo id) or the SHA-256 of its bytes. Presentation image directories hold
+    hardlinks to the stored blobs, so the link count of a blob is its
+    reference count: deleting a presentation drops its references, and blobs
+    no presentation links to anymore are garbage collected.
+    """
+
+    def __init__(self, store_dir: str, gc_grace_seconds: int = 3600):
+        self.store_dir = store_dir
+        os.makedirs(self.store_dir, exist_ok=True)
+        # Unreferenced blobs are kept for a while so a deck being generated
+        # can still link to a blob it just looked up
+        self.gc_grace_seconds = gc_grace_seconds
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_content_key(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _get_blob_path(self, key: str, extension: str) -> str:
+        # Keys end up in file names, anything unusual is hashed
+        if not re.fullmatch(r"[A-Za-z0-9_-]{1,128}", key):
+            key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.store_dir, f"{key}{extension.lower()}")
+
+    def _link(self, blob_path: str, output_path: str):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        try:
+            os.link(blob_path, output_path)
+        except FileExistsError:
+            os.remove(output_path)
+            os.link(blob_path, output_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # Filesystems without hardlinks get a copy, the blob still saves
+            # repeat downloads until it is garbage collected
+            shutil.copyfile(blob_path, output_path)
+
+    def link(self, key: str, output_path: str) -> Optional[str]:
+        """Link the blob of ``key`` to ``output_path`` if it is stored."""
+        blob_path = self._get_blob_path(key, os.path.splitext(output_path)[1])
+        try:
+            self._link(blob_path, output_path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            # Restart the grace period, the blob is referenced again
+            os.utime(blob_path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return output_path
+
+    def put(self, key: str, content: bytes, output_path: str) -> str:
+        """Store ``content`` under ``key`` unless already stored and link it to ``output_path``."""
+        blob_path = self._get_blob_path(key, os.path.splitext(output_path)[1])
+        # The blob may be garbage collected between the check and the link
+        for _ in range(2):
+            if not os.path.exists(blob_path):
+                # Write to a temporary name first so readers never see partial files
+                temp_path = os.path.join(self.store_dir, f".{uuid.uuid4()}")
+                with open(temp_path, "wb") as f:
+                    f.write(content)
+                os.replace(temp_path, blob_path)
+            try:
+                self._link(blob_path, output_path)
+                return output_path
+            except FileNotFoundError:
+                continue
+
+        with open(output_path, "wb") as f:
+            f.write(content)
+        return output_path
+
+    def collect_garbage(self) -> int:
+        """Remove blobs no presentation links to anymore."""
+        cutoff_timestamp = time.time() - self.gc_grace_seconds
+        removed_count = 0
+
+        for filename in os.listdir(self.store_dir):
+            if filename.startswith("."):
+                continue
+            blob_path = os.path.join(self.store_dir, filename)
+            try:
+                stat = os.stat(blob_path)
+                if stat.st_nlink <= 1 and stat.st_mtime < cutoff_timestamp:
+                    os.remove(blob_path)
+                    removed_count += 1
+            except FileNotFoundError:
+                continue
+
+        if removed_count > 0:
+            print(f"Image store cleanup: removed {removed_count} unreferenced images")
+        return removed_count
+
+    def get_stats(self) -> dict:
+        blob_count = 0
+        references = 0
+        total_size = 0
+        saved_size = 0
+
+        for filename in os.listdir(self.store_dir):
+            if filename.startswith("."):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.store_dir, filename))
+            except FileNotFoundError:
+                continue
+            blob_count += 1
+            references += stat.st_nlink - 1
+            total_size += stat.st_size
+            # Every reference past the first would otherwise be another copy
+            saved_size += stat.st_size * max(0, stat.st_nlink - 2)
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "images": blob_count,
+                "references": references,
+                "size_mb": round(total_size / (1024 * 1024), 2),
+                "saved_mb": round(saved_size / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+            }
+
+
+# Global instance
+image_store = SharedImageStore(presentation_storage.image_store_dir)
+presentation_storage.add_cleanup_hook(image_store.collect_garbage)
@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel
+
+
+def get_default_model_name() -> str:
+    return "gemini-2.0-flash" if os.getenv("LLM") == "google" else "gemini-2.0-flash-exp"
+
+
+class LLMClientRegistry:
+    """
+    Reusable Gemini chat clients and structured output chains.
+
+    Every ChatGoogleGenerativeAI builds its own gRPC transport, and binding a
+    schema converts it to a tool declaration again. Clients are kept per model
+    name and API key, and chains per prompt, schema class and client, so calls
+    reuse open connections instead of setting them up per request. Clients of
+    an old API key are dropped when the key changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (model name, api key hash) -> client
+        self._clients: Dict[Tuple[str, str], ChatGoogleGenerativeAI] = {}
+        # (prompt id, schema class, model name, api key hash) -> (prompt, chain),
+        # the prompt is kept so its id is not reused while cached
+        self._chains: Dict[tuple, Tuple[Optional[ChatPromptTemplate], Runnable]] = {}
+        # Schema class -> JSON schema text, schemas do not depend on the client
+        self._schema_texts: Dict[Type[BaseModel], str] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_api_key() -> Optional[str]:
+        return os.getenv("GOOGLE_API_KEY")
+
+    @staticmethod
+    def _get_api_key_hash(api_key: Optional[str]) -> str:
+        return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+    def _check_loop(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # Async gRPC channels are bound to the loop they were created on
+        if loop is not self._loop:
+            self._clients.clear()
+            self._chains.clear()
+            self._loop = loop
+
+    def get_schema(self, schema_class: Type[BaseModel]) -> dict:
+        """Return a copy of the JSON schema of ``schema_class``, generated once."""
+        schema_text = self._schema_texts.get(schema_class)
+        if schema_text is None:
+            schema_text = json.dumps(schema_class.model_json_schema())
+            self._schema_texts[schema_class] = schema_text
+        # Binding a schema as structured output changes it in place, every
+        # caller gets its own copy of the frozen text
+        return json.loads(schema_text)
+
+    def prepare_schemas(self, schema_classes: Iterable[Type[BaseModel]]):
+        """Generate the schemas of ``schema_classes`` ahead of the first request."""
+        for each in schema_classes:
+            self.get_schema(each)
+
+    def get_model(self, model_name: Optional[str] = None) -> ChatGoogleGenerativeAI:
+        """Return the shared client of ``model_name`` for the current API key."""
+        model_name = model_name or get_default_model_name()
+        api_key = self._get_api_key()
+        key = (model_name, self._get_api_key_hash(api_key))
+
+        with self._lock:
+            self._check_loop()
+            model = self._clients.get(key)
+            if model is None:
+                model = ChatGoogleGenerativeAI(model=model_name, google_api_key=api_key)
+                self._clients[key] = model
+            return model
+
+    def get_chain(
+        self,
+        schema_class: Type[BaseModel],
+        prompt: Optional[ChatPromptTemplate] = None,
+        model_name: Optional[str] = None,
+    ) -> Runnable:
+        """Return ``prompt`` piped into the model bound to the JSON schema of ``schema_class``."""
+        model_name = model_name or get_default_model_name()
+        model = self.get_model(model_name)
+        key = (
+            id(prompt),
+            schema_class,
+            model_name,
+            self._get_api_key_hash(self._get_api_key()),
+        )
+
+        with self._lock:
+            cached = self._chains.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        chain = model.with_structured_output(self.get_schema(schema_class))
+        if prompt is not None:
+            chain = prompt | chain
+
+        with self._lock:
+            self._chains[key] = (prompt, chain)
+        return chain
+
+    def refresh(self):
+        """Drop every client, e.g. after the API key changed."""
+        with self._lock:
+            self._clients.clear()
+            self._chains.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "clients": len(self._clients),
+                "chains": len(self._chains),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+            }
+
+
+# Global instance
+llm_clients = LLMClientRegistry()
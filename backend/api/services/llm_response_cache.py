@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+class LLMResponseCache:
+    """
+    In-memory cache of validated structured LLM responses.
+
+    Entries are keyed by a hash of the call name, the model name and the
+    canonical JSON of the call inputs, so retried slide edits and going back
+    and forth between versions skip the Gemini call. The cache is bounded in
+    entries, evicts least recently used entries first and expires entries
+    after a TTL. It can be turned off in config or per call.
+    """
+
+    def __init__(
+        self, max_entries: int = 512, ttl_hours: float = 24, enabled: bool = True
+    ):
+        # Try to read cache settings from config, fallback to defaults
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    enabled = config.get("llm_response_cache_enabled", enabled)
+                    max_entries = config.get("llm_response_cache_entries", max_entries)
+                    ttl_hours = config.get("llm_response_cache_ttl_hours", ttl_hours)
+        except Exception:
+            pass
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_hours * 3600
+
+        self._lock = threading.Lock()
+        # key -> (expires at, response JSON)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(kind: str, model_name: str, inputs: dict) -> str:
+        canonical = json.dumps(
+            {"kind": kind, "model": model_name, "inputs": inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, response_model: Type[ResponseModel]) -> Optional[ResponseModel]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                response_json = entry[1]
+            else:
+                if entry:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+        # Every caller gets its own copy to change
+        return response_model.model_validate_json(response_json)
+
+    def put(self, key: str, response: BaseModel):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, response.model_dump_json())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_create(
+        self,
+        kind: str,
+        model_name: str,
+        inputs: dict,
+        response_model: Type[ResponseModel],
+        create: Callable[[], Awaitable[ResponseModel]],
+        use_cache: bool = True,
+    ) -> ResponseModel:
+        """Return the cached response of these inputs or await ``create`` and cache it."""
+        if not (use_cache and self.enabled):
+            return await create()
+
+        key = self.get_key(kind, model_name, inputs)
+        response = self.get(key, response_model)
+        if response is None:
+            response = await create()
+            self.put(key, response)
+        return response
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+            }
+
+
+# Global instance
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+class PictureRenderPool:
+    """
+    Process pool shared by exports to decode, transform and encode pictures.
+
+    Picture processing is CPU bound and releases little of the GIL, so it runs
+    in worker processes. The pool is started on first use and reused by every
+    later export, and started again if a worker crashed.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        # Try to read worker count from config, fallback to the CPU count
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    workers = config.get("picture_render_workers", workers)
+        except Exception:
+            pass
+        self.workers = max(1, workers or os.cpu_count() or 1)
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.restarts = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # A worker that died (e.g. out of memory) breaks the pool for good,
+            # every later submit would raise BrokenProcessPool
+            if self._executor and self._executor._broken:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self.restarts += 1
+            if not self._executor:
+                # Spawned workers do not inherit the server's threads or sockets
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+# Global instance
+picture_render_pool = PictureRenderPool()
@@ -36,6 +36,18 @@ class PresentationStorageService:
             "deck_genie_presentations"
         )
         os.makedirs(self.presentation_base_dir, exist_ok=True)
+
+        # Internal directories are dot-prefixed so they are never mistaken
+        # for presentations by cleanup and stats
+        self.processed_images_dir = os.path.join(
+            self.presentation_base_dir, ".processed_images"
+        )
+        os.makedirs(self.processed_images_dir, exist_ok=True)
+        self.image_store_dir = os.path.join(self.presentation_base_dir, ".image_store")
+        os.makedirs(self.image_store_dir, exist_ok=True)
+
+        # Called after every cleanup, e.g. to collect images no presentation uses
+        self._cleanup_hooks = []
         
         # Start cleanup daemon thread
         self._start_cleanup_daemon()
@@ -55,6 +67,10 @@ class PresentationStorageService:
         cleanup_thread = threading.Thread(target=cleanup_daemon, daemon=True)
         cleanup_thread.start()
     
+    def add_cleanup_hook(self, hook):
+        """Register a callable to run after old presentations are cleaned up."""
+        self._cleanup_hooks.append(hook)
+    
     def get_presentation_dir(self, presentation_id: str) -> str:
         """Get the directory for a specific presentation, creating it if it doesn't exist."""
         presentation_dir = os.path.join(self.presentation_base_dir, presentation_id)
@@ -131,7 +147,7 @@ class PresentationStorageService:
         for presentation_id in os.listdir(self.presentation_base_dir):
             presentation_dir = os.path.join(self.presentation_base_dir, presentation_id)
             
-            if not os.path.isdir(presentation_dir):
+            if presentation_id.startswith(".") or not os.path.isdir(presentation_dir):
                 continue
             
             # Check timestamp file
@@ -166,6 +182,12 @@ class PresentationStorageService:
         
         if cleaned_count > 0:
             print(f"Cleanup completed: removed {cleaned_count} old presentations")
+
+        for hook in self._cleanup_hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"Cleanup hook error: {e}")
     
     def get_storage_stats(self) -> dict:
         """Get statistics about the current storage usage."""
@@ -178,11 +200,13 @@ class PresentationStorageService:
         
         total_size = 0
         presentation_count = 0
+        # Images hardlinked from the shared image store are only counted once
+        counted_files = set()
         
         for presentation_id in os.listdir(self.presentation_base_dir):
             presentation_dir = os.path.join(self.presentation_base_dir, presentation_id)
             
-            if os.path.isdir(presentation_dir):
+            if not presentation_id.startswith(".") and os.path.isdir(presentation_dir):
                 presentation_count += 1
                 
                 # Calculate directory size
@@ -190,7 +214,10 @@ class PresentationStorageService:
                     for file in files:
                         file_path = os.path.join(root, file)
                         if os.path.exists(file_path):
-                            total_size += os.path.getsize(file_path)
+                            stat = os.stat(file_path)
+                            if (stat.st_dev, stat.st_ino) not in counted_files:
+                                counted_files.add((stat.st_dev, stat.st_ino))
+                                total_size += stat.st_size
         
         return {
             "total_presentations": presentation_count,
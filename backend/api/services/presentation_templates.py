@@ -0,0 +1,83 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+
+class PresentationTemplateCache:
+    """
+    Prepared base packages that new presentations are cloned from.
+
+    ``Presentation()`` reads and parses python-pptx's default template from
+    disk for every export. The template is prepared once per set of theme
+    colors instead, sized to 1280x720 and with the colors applied, and every
+    export gets a deep copy of the parsed parts. Templates are never changed
+    after they are prepared, so exports can clone them concurrently.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        # theme colors key -> prepared presentation
+        self._templates: "OrderedDict[str, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.clones = 0
+        self.total_clone_time = 0.0
+
+    @staticmethod
+    def get_key(theme_colors: Optional[Dict[str, str]] = None) -> str:
+        return json.dumps(theme_colors or {}, sort_keys=True)
+
+    def get_template(self, theme_colors: Optional[Dict[str, str]] = None):
+        """Return the prepared template of ``theme_colors``, not to be changed."""
+        key = self.get_key(theme_colors)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        template = PptxPresentationCreator.get_base_presentation(theme_colors)
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_entries:
+                self._templates.popitem(last=False)
+        return template
+
+    def get_presentation(self, theme_colors: Optional[Dict[str, str]] = None):
+        """Return a new presentation cloned from the template of ``theme_colors``."""
+        template = self.get_template(theme_colors)
+        start = time.perf_counter()
+        presentation = copy.deepcopy(template)
+        clone_time = time.perf_counter() - start
+        with self._lock:
+            self.clones += 1
+            self.total_clone_time += clone_time
+        return presentation
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "templates": len(self._templates),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+                "average_clone_time": (
+                    round(self.total_clone_time / self.clones, 4) if self.clones else 0
+                ),
+            }
+
+
+# Global instance
+presentation_templates = PresentationTemplateCache()
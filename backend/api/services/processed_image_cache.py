@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from pydantic import BaseModel
+
+from api.services.presentation_storage import presentation_storage
+from ppt_generator.picture_transform import IMAGE_FORMAT_EXTENSIONS
+
+
+class ProcessedImageCache:
+    """
+    Content-addressed cache of pictures already processed for export.
+
+    Entries are keyed by a hash of the source image bytes plus the normalized
+    transform parameters, so re-exporting a deck only reprocesses pictures
+    whose source or transform changed. The cache directory is bounded in size
+    and evicts least recently used entries first.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 512):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Try to read cache size from config, fallback to default
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    max_size_mb = config.get("processed_image_cache_mb", max_size_mb)
+        except Exception:
+            pass
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self.hits = 0
+        self.misses = 0
+        self._load_entries()
+
+    def _load_entries(self):
+        """Rebuild the LRU order from the files left by previous runs."""
+        files = []
+        for filename in os.listdir(self.cache_dir):
+            file_path = os.path.join(self.cache_dir, filename)
+            if filename.startswith(".") or not os.path.isfile(file_path):
+                continue
+            stat = os.stat(file_path)
+            files.append((stat.st_mtime, filename, stat.st_size))
+
+        for _, filename, size in sorted(files):
+            self._entries[filename] = size
+            self._total_size += size
+
+    def get_key(self, source_path: str, *params: BaseModel) -> str:
+        """Hash of the source bytes combined with every normalized parameter model."""
+        source_hash = hashlib.sha256()
+        with open(source_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                source_hash.update(chunk)
+
+        key_hash = hashlib.sha256(source_hash.digest())
+        for each in params:
+            key_hash.update(each.model_dump_json().encode("utf-8"))
+        return key_hash.hexdigest()
+
+    @staticmethod
+    def _link(source_path: str, target_path: str):
+        """Hard link ``source_path`` to ``target_path``, copy across file systems."""
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copyfile(source_path, target_path)
+
+    def get(self, key: str, target_dir: str) -> Optional[str]:
+        """
+        Return a copy of the cached file for ``key`` in ``target_dir`` and mark
+        it as recently used. Cached files can be evicted by any later put, the
+        copy stays until the caller removes ``target_dir``.
+        """
+        with self._lock:
+            filename = self._find(key)
+            if not filename:
+                self.misses += 1
+                return None
+
+            file_path = os.path.join(self.cache_dir, filename)
+            target_path = os.path.join(target_dir, f"{uuid.uuid4()}_{filename}")
+            try:
+                # Linked under the lock so eviction cannot remove it meanwhile
+                self._link(file_path, target_path)
+            except OSError:
+                self._remove(filename)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(filename)
+            self.hits += 1
+
+        try:
+            # Persist recency so the LRU order survives restarts
+            os.utime(file_path)
+        except OSError:
+            pass
+        return target_path
+
+    def put(self, key: str, file_path: str) -> str:
+        """
+        Add an encoded picture to the cache under ``key``. Returns ``file_path``,
+        which stays with the caller, while the cache keeps its own link to it.
+        """
+        extension = os.path.splitext(file_path)[1].lstrip(".").lower()
+        filename = f"{key}.{extension}"
+        cached_path = os.path.join(self.cache_dir, filename)
+
+        # Link to a temporary name first so readers never see partial files
+        temp_path = os.path.join(self.cache_dir, f".{uuid.uuid4()}.{extension}")
+        self._link(file_path, temp_path)
+        os.replace(temp_path, cached_path)
+        size = os.path.getsize(cached_path)
+
+        with self._lock:
+            self._remove(filename, delete_file=False)
+            self._entries[filename] = size
+            self._total_size += size
+            self._evict()
+
+        return file_path
+
+    def _find(self, key: str) -> Optional[str]:
+        for extension in IMAGE_FORMAT_EXTENSIONS.values():
+            filename = f"{key}.{extension}"
+            if filename in self._entries:
+                return filename
+        return None
+
+    def _remove(self, filename: str, delete_file: bool = True):
+        size = self._entries.pop(filename, None)
+        if size is None:
+            return
+        self._total_size -= size
+        if delete_file:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        # Never evict the entry that was just added
+        while self._total_size > self.max_size_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self):
+        with self._lock:
+            for filename in list(self._entries):
+                self._remove(filename)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_mb": round(self._total_size / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+            }
+
+
+# Global instance
+processed_image_cache = ProcessedImageCache(presentation_storage.processed_images_dir)
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+
+class RenderExecutor:
+    """
+    Bounded executor for blocking presentation renders.
+
+    Renders run on dedicated threads so the event loop keeps serving other
+    requests, including in-flight SSE streams. At most ``max_concurrency``
+    renders run at once and at most ``max_queue_size`` wait behind them;
+    further renders are rejected with a 503 instead of piling up.
+    """
+
+    def __init__(self, max_concurrency: int = 2, max_queue_size: int = 16):
+        # Try to read limits from config, fallback to defaults
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    max_concurrency = config.get("render_concurrency", max_concurrency)
+                    max_queue_size = config.get("render_queue_size", max_queue_size)
+        except Exception:
+            pass
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue_size = max(0, max_queue_size)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="render"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_wait_time = 0.0
+        self.total_render_time = 0.0
+        self.max_render_time = 0.0
+
+    async def run(self, func, *args, **kwargs):
+        """Run ``func`` on a render thread and await its result."""
+        with self._lock:
+            if self.queued + self.running >= self.max_concurrency + self.max_queue_size:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many presentations are being exported, please try again shortly",
+                )
+            self.queued += 1
+
+        submitted_at = time.perf_counter()
+
+        def task():
+            started_at = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_time += started_at - submitted_at
+
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                render_time = time.perf_counter() - started_at
+                with self._lock:
+                    self.running -= 1
+                    if failed:
+                        self.failed += 1
+                    else:
+                        self.completed += 1
+                    self.total_render_time += render_time
+                    self.max_render_time = max(self.max_render_time, render_time)
+
+        future = self._executor.submit(task)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A render that never started will not release its queue slot itself
+            if future.cancel():
+                with self._lock:
+                    self.queued -= 1
+            raise
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue_size": self.max_queue_size,
+                "queue_depth": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_wait_time": round(self.total_wait_time / finished, 3) if finished else 0,
+                "avg_render_time": round(self.total_render_time / finished, 3) if finished else 0,
+                "max_render_time": round(self.max_render_time, 3),
+            }
+
+
+# Global instance
+render_executor = RenderExecutor()
@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+from ppt_generator.slide_parts import RenderedPart
+
+
+class SlidePartCache:
+    """
+    Rendered slide parts of the last export of every presentation.
+
+    Slides are keyed by a fingerprint of their model, so exporting a deck
+    again only rebuilds the slides that changed and copies the XML and media
+    of the others verbatim. Every export replaces the slides kept for its
+    presentation. The cache is bounded in presentations and total size and
+    evicts least recently exported presentations first.
+    """
+
+    def __init__(self, max_presentations: int = 16, max_size_mb: int = 256):
+        # Try to read cache limits from config, fallback to defaults
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    max_presentations = config.get(
+                        "slide_part_cache_presentations", max_presentations
+                    )
+                    max_size_mb = config.get("slide_part_cache_mb", max_size_mb)
+        except Exception:
+            pass
+        self.max_presentations = max_presentations
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        # presentation id -> (size, fingerprint -> rendered slide)
+        self._presentations: "OrderedDict[str, tuple]" = OrderedDict()
+        self._total_size = 0
+        self.reused_slides = 0
+        self.rebuilt_slides = 0
+
+    @staticmethod
+    def get_size(slides: Dict[str, RenderedPart]) -> int:
+        """Bytes held by ``slides``, media shared between slides counts once."""
+        size = 0
+        seen = set()
+        pending = list(slides.values())
+        while pending:
+            part = pending.pop()
+            if id(part.blob) in seen:
+                continue
+            seen.add(id(part.blob))
+            size += len(part.blob)
+            pending.extend(
+                each.target for each in part.relationships if not each.is_external and each.target
+            )
+        return size
+
+    def get(self, presentation_id: str) -> Dict[str, RenderedPart]:
+        """Return the slides of the last export of ``presentation_id``, may be empty."""
+        with self._lock:
+            entry = self._presentations.get(presentation_id)
+            if not entry:
+                return {}
+            self._presentations.move_to_end(presentation_id)
+            return dict(entry[1])
+
+    def put(
+        self,
+        presentation_id: str,
+        slides: Dict[str, RenderedPart],
+        reused: int = 0,
+        rebuilt: int = 0,
+    ):
+        size = self.get_size(slides)
+        with self._lock:
+            self.reused_slides += reused
+            self.rebuilt_slides += rebuilt
+            self._remove(presentation_id)
+            if size > self.max_size_bytes:
+                return
+            self._presentations[presentation_id] = (size, slides)
+            self._total_size += size
+            while (
+                len(self._presentations) > self.max_presentations
+                or self._total_size > self.max_size_bytes
+            ):
+                self._remove(next(iter(self._presentations)))
+
+    def _remove(self, presentation_id: str):
+        entry = self._presentations.pop(presentation_id, None)
+        if entry:
+            self._total_size -= entry[0]
+
+    def remove(self, presentation_id: str):
+        with self._lock:
+            self._remove(presentation_id)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            slides = self.reused_slides + self.rebuilt_slides
+            return {
+                "presentations": len(self._presentations),
+                "size_mb": round(self._total_size / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+                "reused_slides": self.reused_slides,
+                "rebuilt_slides": self.rebuilt_slides,
+                "reuse_rate": round(self.reused_slides / slides, 3) if slides else 0,
+            }
+
+
+# Global instance
+slide_part_cache = SlidePartCache()
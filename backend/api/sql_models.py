@@ -51,3 +51,11 @@ class KeyValueSqlModel(SQLModel, table=True):
 class PreferencesSqlModel(SQLModel, table=True):
     id: int = Field(default=0, primary_key=True)
     theme: Optional[dict] = Field(sa_column=Column(JSON, nullable=True), default=None)
+
+
+class ImageSearchCacheSqlModel(SQLModel, table=True):
+    key: str = Field(primary_key=True)
+    kind: str = Field(index=True)
+    prompt_hash: str = Field(index=True)
+    value: dict = Field(sa_column=Column(JSON, nullable=False), default=None)
+    expires_at: datetime = Field(index=True)
@@ -11,6 +11,9 @@ from fastapi import HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 
 from api.models import LogMetadata, UserConfig
+from api.services.http_client import http_clients
+from api.services.image_store import SharedImageStore
+from api.services.llm_clients import llm_clients
 from api.services.logging import LoggingService
 from api.services.presentation_storage import presentation_storage
 
@@ -45,8 +48,12 @@ def update_env_with_user_config():
     user_config = get_user_config()
     if user_config.LLM:
         os.environ["LLM"] = user_config.LLM
-    if user_config.GOOGLE_API_KEY:
+    if user_config.GOOGLE_API_KEY and (
+        os.getenv("GOOGLE_API_KEY") != user_config.GOOGLE_API_KEY
+    ):
         os.environ["GOOGLE_API_KEY"] = user_config.GOOGLE_API_KEY
+        # Clients made with the old key are not used anymore
+        llm_clients.refresh()
 
 
 def get_resource(relative_path):
@@ -76,34 +83,46 @@ def save_uploaded_files(
     return full_file_paths
 
 
-async def download_file(url: str, save_path: str, headers: Optional[dict] = None):
+async def download_file(
+    url: str,
+    save_path: str,
+    headers: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    store: Optional[SharedImageStore] = None,
+):
+    session = session or http_clients.get()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        while True:
-                            chunk = await response.content.read(1024)
-                            if not chunk:
-                                break
-                            file.write(chunk)
-                    print(f"File downloaded successfully to {save_path}")
-                    return True
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return False
+        async with session.get(url, headers=headers) as response:
+            if response.status == 200 and store:
+                # Keyed by content, the same image from any URL is stored once
+                content = await response.read()
+                store.put(store.get_content_key(content), content, save_path)
+                print(f"File downloaded successfully to {save_path}")
+                return True
+            elif response.status == 200:
+                with open(save_path, "wb") as file:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        file.write(chunk)
+                print(f"File downloaded successfully to {save_path}")
+                return True
+            else:
+                print(f"Failed to download file. HTTP status: {response.status}")
+                return False
     except Exception as e:
         print(f"Error while downloading file from {url} to {save_path}")
         return False
 
 
-async def download_files(urls: List[str], save_paths: List[str]):
+async def download_files(
+    urls: List[str], save_paths: List[str], store: Optional[SharedImageStore] = None
+):
     for url, save_path in zip(urls, save_paths):
         print(url)
         print(save_path)
         print("-" * 10)
     coroutines = [
-        download_file(url, save_paths[index]) for index, url in enumerate(urls)
+        download_file(url, save_paths[index], store=store)
+        for index, url in enumerate(urls)
     ]
     await asyncio.gather(*coroutines)
 
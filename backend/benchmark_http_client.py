@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare a new aiohttp session per request with the shared pooled session."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import aiohttp
+from aiohttp import web
+
+from api.services.http_client import HttpClientConfig, HttpClientRegistry
+
+REQUESTS = 300
+CONCURRENCY = 8
+PAYLOAD = os.urandom(64 * 1024)
+
+
+async def start_stub_server():
+    async def image(_):
+        return web.Response(body=PAYLOAD, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/image.jpg", image)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://localhost:{port}/image.jpg"
+
+
+async def fetch_with_new_session(url: str):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            await response.read()
+
+
+async def fetch_with_shared_session(session: aiohttp.ClientSession, url: str):
+    async with session.get(url) as response:
+        await response.read()
+
+
+async def run(fetch, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited():
+        async with semaphore:
+            await fetch()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[limited() for _ in range(REQUESTS)])
+    return time.perf_counter() - start
+
+
+async def main():
+    runner, url = await start_stub_server()
+    registry = HttpClientRegistry()
+    registry.register("benchmark", HttpClientConfig(limit_per_host=CONCURRENCY))
+    try:
+        print(
+            f"{'concurrency':>12} {'new session (ms/req)':>21} "
+            f"{'shared (ms/req)':>16} {'saving (ms/req)':>16}"
+        )
+        for concurrency in (1, CONCURRENCY):
+            new_time = await run(lambda: fetch_with_new_session(url), concurrency)
+            session = registry.get("benchmark")
+            shared_time = await run(
+                lambda: fetch_with_shared_session(session, url), concurrency
+            )
+            new_ms = new_time * 1000 / REQUESTS
+            shared_ms = shared_time * 1000 / REQUESTS
+            print(
+                f"{concurrency:>12} {new_ms:>21.2f} {shared_ms:>16.2f} "
+                f"{new_ms - shared_ms:>16.2f}"
+            )
+    finally:
+        await registry.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare the channel-based overlay recolor with the previous per-pixel loop."""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from ppt_generator.utils import change_image_color
+
+SIZES = [(256, 256), (800, 600), (1280, 720), (2000, 2000)]
+OVERLAY = "#1A2B3C"
+
+
+def change_image_color_loop(img: Image.Image, color: str) -> Image.Image:
+    """Previous implementation, kept here as the reference output."""
+    if color.startswith("#"):
+        color = color[1:]
+    r_new = int(color[:2], 16)
+    g_new = int(color[2:4], 16)
+    b_new = int(color[4:], 16)
+
+    new_data = []
+    for r, g, b, a in img.getdata():
+        if a != 0:
+            new_data.append((r_new, g_new, b_new, a))
+        else:
+            new_data.append((0, 0, 0, 0))
+
+    new_img = Image.new("RGBA", img.size)
+    new_img.putdata(new_data)
+    return new_img
+
+
+def make_test_image(size) -> Image.Image:
+    """Noise image whose alpha channel cycles through every value 0..255."""
+    width, height = size
+    rgb = Image.frombytes("RGB", size, os.urandom(width * height * 3))
+    alpha = Image.frombytes(
+        "L", size, bytes(i % 256 for i in range(width * height))
+    )
+    rgb.putalpha(alpha)
+    return rgb
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'size':>12} {'loop (ms)':>12} {'channels (ms)':>14} {'speedup':>9}")
+    for size in SIZES:
+        image = make_test_image(size)
+
+        expected = change_image_color_loop(image, OVERLAY)
+        actual = change_image_color(image, OVERLAY)
+        if expected.tobytes() != actual.tobytes():
+            raise SystemExit(f"Output mismatch at size {size}")
+
+        loop_time = time_call(change_image_color_loop, image, OVERLAY, repeat=1)
+        channel_time = time_call(change_image_color, image, OVERLAY)
+        print(
+            f"{size[0]}x{size[1]:<7} {loop_time * 1000:>12.1f} "
+            f"{channel_time * 1000:>14.2f} {loop_time / channel_time:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Compare a full export with an incremental re-export after editing one slide."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from graph_processor.models import (
+    BarGraphDataModel,
+    BarSeriesModel,
+    GraphModel,
+    GraphTypeEnum,
+)
+from ppt_generator.models.pptx_models import (
+    PptxFontModel,
+    PptxGraphBoxModel,
+    PptxParagraphModel,
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+    PptxTextBoxModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+SLIDES = 30
+EDITED_SLIDE = 12
+SOURCE_SIZE = (2400, 1600)
+
+
+def make_presentation(temp_dir: str, title_of_edited: str) -> PptxPresentationModel:
+    slides = []
+    for index in range(SLIDES):
+        source_path = os.path.join(temp_dir, f"source_{index}.jpg")
+        if not os.path.exists(source_path):
+            image = Image.linear_gradient("L").rotate(index * 12).resize(SOURCE_SIZE)
+            image.convert("RGB").save(source_path, quality=90)
+
+        title = title_of_edited if index == EDITED_SLIDE else f"Slide {index}"
+        shapes = [
+            PptxTextBoxModel(
+                position=PptxPositionModel(left=60, top=40, width=560, height=80),
+                paragraphs=[PptxParagraphModel(font=PptxFontModel(size=36), text=title)],
+            ),
+            PptxTextBoxModel(
+                position=PptxPositionModel(left=60, top=140, width=560, height=400),
+                paragraphs=[
+                    PptxParagraphModel(
+                        font=PptxFontModel(size=18),
+                        text=f"Point {line}: revenue grew **{index + line}%** and __costs__ fell",
+                    )
+                    for line in range(6)
+                ],
+            ),
+            PptxPictureBoxModel(
+                position=PptxPositionModel(left=680, top=40, width=540, height=640),
+                border_radius=[24, 24, 24, 24],
+                picture=PptxPictureModel(is_network=False, path=source_path),
+            ),
+        ]
+        if index % 5 == 0:
+            shapes.append(
+                PptxGraphBoxModel(
+                    position=PptxPositionModel(left=60, top=460, width=560, height=220),
+                    graph=GraphModel(
+                        name=f"Revenue {index}",
+                        type=GraphTypeEnum.bar,
+                        data=BarGraphDataModel(
+                            categories=["Q1", "Q2", "Q3", "Q4"],
+                            series=[BarSeriesModel(name="Revenue", data=[1, 2, 3, index])],
+                        ),
+                    ),
+                )
+            )
+        slides.append(PptxSlideModel(shapes=shapes))
+    return PptxPresentationModel(background_color="ffffff", slides=slides)
+
+
+def get_parts(pptx_path: str) -> dict:
+    # docProps and the workbooks embedded in charts carry timestamps and are
+    # expected to differ between runs
+    with zipfile.ZipFile(pptx_path) as archive:
+        return {
+            info.filename: hashlib.sha256(archive.read(info)).hexdigest()
+            for info in archive.infolist()
+            if not info.filename.startswith(("docProps/", "ppt/embeddings/"))
+        }
+
+
+def export(model, temp_dir: str, output_path: str, previous_slides=None):
+    start = time.perf_counter()
+    creator = PptxPresentationCreator(model, temp_dir, previous_slides=previous_slides)
+    creator.create_ppt()
+    creator.save(output_path)
+    return time.perf_counter() - start, creator
+
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+
+    # First export of the deck keeps its rendered slides
+    _, creator = export(
+        make_presentation(temp_dir, "Original title"),
+        temp_dir,
+        os.path.join(temp_dir, "first.pptx"),
+        previous_slides={},
+    )
+    previous_slides = creator.rendered_slides
+
+    full_path = os.path.join(temp_dir, "full.pptx")
+    full_time, _ = export(make_presentation(temp_dir, "Edited title"), temp_dir, full_path)
+
+    incremental_path = os.path.join(temp_dir, "incremental.pptx")
+    incremental_time, creator = export(
+        make_presentation(temp_dir, "Edited title"),
+        temp_dir,
+        incremental_path,
+        previous_slides=previous_slides,
+    )
+
+    if get_parts(incremental_path) != get_parts(full_path):
+        raise SystemExit("Incremental export differs from full export")
+    print(f"{SLIDES} slides, slide {EDITED_SLIDE} edited, output is identical")
+    print(f"{creator.slides_reused} slides reused")
+    print(f"{'':>12} {'export (s)':>11}")
+    print(f"{'full':>12} {full_time:>11.2f}")
+    print(f"{'incremental':>12} {incremental_time:>11.2f} ({incremental_time / full_time:.0%})")
+
+
+if __name__ == "__main__":
+    main()
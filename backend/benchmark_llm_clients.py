@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare per-call Gemini client and chain setup with the shared client registry."""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Clients are only built here, no request is sent
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-key")
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from api.services.llm_clients import LLMClientRegistry
+from ppt_generator.models.content_type_models import CONTENT_TYPE_MAPPING
+from ppt_generator.models.other_models import SlideType
+from ppt_generator.slide_generator import prompt_template_from_slide
+
+CALLS = 200
+
+
+def build_chain_per_call(schema_class):
+    model = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
+    return prompt_template_from_slide | model.with_structured_output(
+        schema_class.model_json_schema()
+    )
+
+
+def run(get_chain) -> tuple:
+    schema_classes = [CONTENT_TYPE_MAPPING[each] for each in SlideType]
+    tracemalloc.start()
+    start = time.perf_counter()
+    for index in range(CALLS):
+        get_chain(schema_classes[index % len(schema_classes)])
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def main():
+    registry = LLMClientRegistry()
+
+    per_call, per_call_peak = run(build_chain_per_call)
+    shared, shared_peak = run(
+        lambda schema_class: registry.get_chain(
+            schema_class, prompt_template_from_slide, "gemini-2.0-flash"
+        )
+    )
+
+    print(f"{CALLS} chain setups, {len(SlideType)} schemas")
+    print(f"{'':>10} {'total (s)':>10} {'per call (ms)':>14} {'peak alloc (MB)':>16}")
+    for name, elapsed, peak in (
+        ("per call", per_call, per_call_peak),
+        ("registry", shared, shared_peak),
+    ):
+        print(
+            f"{name:>10} {elapsed:>10.3f} {elapsed / CALLS * 1000:>14.3f} "
+            f"{peak / (1024 * 1024):>16.2f}"
+        )
+    print(registry.get_stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
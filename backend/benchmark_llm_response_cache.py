@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Compare repeated slide edits with and without the LLM response cache."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Gemini is replaced by a fake below, clients are only built
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-key")
+
+import ppt_generator.slide_generator as slide_generator
+from api.services.llm_response_cache import llm_response_cache
+from ppt_generator.models.content_type_models import Type1Content
+from ppt_generator.models.other_models import SlideType
+from ppt_generator.models.slide_model import SlideModel
+
+# Typical Gemini latency of a structured slide edit
+LLM_SECONDS = 1.5
+EDITS = 5
+
+SLIDE = SlideModel(
+    index=0,
+    type=SlideType.type1,
+    presentation="benchmark",
+    content=Type1Content(
+        title="Market Overview",
+        body="The market grew **12%** last year",
+        image_prompts=["a modern office"],
+    ),
+)
+
+
+async def fake_validated_response(chain, input_dict, response_model, retries=1):
+    await asyncio.sleep(LLM_SECONDS)
+    return response_model(**SLIDE.content.model_dump())
+
+
+async def run(use_cache: bool) -> float:
+    llm_response_cache.clear()
+    start = time.perf_counter()
+    # The user retries the same edit and goes back and forth between two
+    for index in range(EDITS):
+        prompt = "Make it shorter" if index % 2 == 0 else "Add a statistic"
+        await slide_generator.get_edited_slide_content_model(
+            prompt, SlideType.type1, SLIDE, tone="Professional", use_cache=use_cache
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    slide_generator.get_validated_response = fake_validated_response
+
+    uncached = asyncio.run(run(use_cache=False))
+    cached = asyncio.run(run(use_cache=True))
+    print(f"{EDITS} edits alternating between 2 prompts, {LLM_SECONDS:.1f}s per LLM call")
+    print(f"{'':>10} {'total (s)':>10}")
+    print(f"{'no cache':>10} {uncached:>10.2f}")
+    print(f"{'cache':>10} {cached:>10.2f}")
+    print(llm_response_cache.get_stats())
+
+
+if __name__ == "__main__":
+    main()
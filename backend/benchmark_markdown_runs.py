@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compare the previous markdown text run parser with the single pass one."""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ppt_generator.models.pptx_models import (
+    PptxFontModel,
+    PptxPresentationModel,
+    PptxTextRunModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+PARAGRAPHS = 300
+REPEATS = 5
+WORDS = "market revenue growth customers platform team launch quarter margin".split()
+
+
+def previous_parse_markdown_text_to_text_runs(font: PptxFontModel, text: str):
+    """The parser before the single pass tokenizer, kept for comparison."""
+    text_runs = []
+    for line in text.split("\n"):
+        current_pos = 0
+        while current_pos < len(line):
+            if line[current_pos:].startswith("***") and "***" in line[current_pos + 3 :]:
+                end_pos = line.find("***", current_pos + 3)
+                font_json = font.model_dump()
+                font_json["bold"] = True
+                font_json["italic"] = True
+                text_runs.append(
+                    PptxTextRunModel(
+                        text=line[current_pos + 3 : end_pos], font=PptxFontModel(**font_json)
+                    )
+                )
+                current_pos = end_pos + 3
+            elif line[current_pos:].startswith("**") and "**" in line[current_pos + 2 :]:
+                end_pos = line.find("**", current_pos + 2)
+                font_json = font.model_dump()
+                font_json["bold"] = True
+                text_runs.append(
+                    PptxTextRunModel(
+                        text=line[current_pos + 2 : end_pos], font=PptxFontModel(**font_json)
+                    )
+                )
+                current_pos = end_pos + 2
+            elif line[current_pos:].startswith("__") and "__" in line[current_pos + 2 :]:
+                end_pos = line.find("__", current_pos + 2)
+                font_json = font.model_dump()
+                font_json["italic"] = True
+                text_runs.append(
+                    PptxTextRunModel(
+                        text=line[current_pos + 2 : end_pos], font=PptxFontModel(**font_json)
+                    )
+                )
+                current_pos = end_pos + 2
+            else:
+                next_marker = float("inf")
+                for marker in ["***", "**", "__"]:
+                    pos = line.find(marker, current_pos)
+                    if pos != -1:
+                        next_marker = min(next_marker, pos)
+                end_pos = next_marker if next_marker != float("inf") else len(line)
+                text_content = line[current_pos:end_pos]
+                if text_content:
+                    text_runs.append(PptxTextRunModel(text=text_content, font=font))
+                current_pos = end_pos
+
+        if line != text.split("\n")[-1]:
+            text_runs.append(PptxTextRunModel(text="\n"))
+
+    return text_runs
+
+
+def make_paragraph(rng: random.Random) -> str:
+    """Long paragraph of several lines with closed bold, italic and bold italic spans."""
+    lines = []
+    for _ in range(rng.randint(4, 12)):
+        parts = []
+        for _ in range(rng.randint(20, 60)):
+            word = rng.choice(WORDS)
+            style = rng.random()
+            if style < 0.15:
+                word = f"**{word} {rng.randint(1, 99)}%**"
+            elif style < 0.25:
+                word = f"__{word}__"
+            elif style < 0.3:
+                word = f"***{word}***"
+            parts.append(word)
+        lines.append(" ".join(parts))
+    return "\n".join(lines)
+
+
+def run(parse, corpus, font) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for each in corpus:
+            parse(font, each)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(21)
+    corpus = [make_paragraph(rng) for _ in range(PARAGRAPHS)]
+    font = PptxFontModel(name="Inter", size=18, color="1A1A1A")
+    creator = PptxPresentationCreator(
+        PptxPresentationModel(background_color="FFFFFF", slides=[]), temp_dir="."
+    )
+
+    for each in corpus:
+        assert creator.parse_markdown_text_to_text_runs(
+            font, each
+        ) == previous_parse_markdown_text_to_text_runs(font, each), "runs differ"
+
+    characters = sum(len(each) for each in corpus)
+    previous = run(previous_parse_markdown_text_to_text_runs, corpus, font)
+    single_pass = run(creator.parse_markdown_text_to_text_runs, corpus, font)
+
+    print(f"{PARAGRAPHS} paragraphs, {characters / PARAGRAPHS:.0f} characters on average")
+    print("runs are identical")
+    print(f"{'':>12} {'total (s)':>10} {'per paragraph (us)':>19}")
+    for name, elapsed in (("previous", previous), ("single pass", single_pass)):
+        per_paragraph = elapsed / (PARAGRAPHS * REPEATS) * 1e6
+        print(f"{name:>12} {elapsed:>10.3f} {per_paragraph:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
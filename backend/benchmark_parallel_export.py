@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Compare sequential pptx export with picture processing in a process pool."""
+
+import hashlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from ppt_generator.models.pptx_models import (
+    PptxBoxShapeEnum,
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+SLIDES = 12
+SOURCE_SIZE = (3000, 2000)
+
+
+def make_presentation(temp_dir: str) -> PptxPresentationModel:
+    slides = []
+    for index in range(SLIDES):
+        source_path = os.path.join(temp_dir, f"source_{index}.jpg")
+        image = Image.linear_gradient("L").rotate(index * 30).resize(SOURCE_SIZE)
+        image.convert("RGB").save(source_path, quality=90)
+        picture = PptxPictureModel(is_network=False, path=source_path)
+        slides.append(
+            PptxSlideModel(
+                shapes=[
+                    PptxPictureBoxModel(
+                        position=PptxPositionModel(left=40, top=40, width=640, height=480),
+                        border_radius=[24, 24, 24, 24],
+                        picture=picture,
+                    ),
+                    PptxPictureBoxModel(
+                        position=PptxPositionModel(left=720, top=40, width=320, height=320),
+                        shape=PptxBoxShapeEnum.CIRCLE,
+                        picture=picture,
+                    ),
+                ]
+            )
+        )
+    return PptxPresentationModel(background_color="ffffff", slides=slides)
+
+
+def export(model, temp_dir: str, output_path: str, executor=None, workers: int = 1):
+    start = time.perf_counter()
+    creator = PptxPresentationCreator(model, temp_dir)
+    creator.create_ppt(picture_executor=executor, picture_workers=workers)
+    creator.save(output_path)
+    return time.perf_counter() - start, creator.render_stats
+
+
+def get_parts(pptx_path: str) -> dict:
+    # docProps carry timestamps and are expected to differ between runs
+    with zipfile.ZipFile(pptx_path) as archive:
+        return {
+            info.filename: hashlib.sha256(archive.read(info)).hexdigest()
+            for info in archive.infolist()
+            if not info.filename.startswith("docProps/")
+        }
+
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+    model = make_presentation(temp_dir)
+
+    sequential_path = os.path.join(temp_dir, "sequential.pptx")
+    sequential_time, _ = export(model, temp_dir, sequential_path)
+    expected = get_parts(sequential_path)
+    print(f"{'workers':>8} {'export (s)':>11} {'speedup':>8} {'per core':>9}")
+    print(f"{'-':>8} {sequential_time:>11.2f} {'1.0x':>8} {'-':>9}")
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in worker_counts:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            # Start the workers before timing, as the server's pool is long lived
+            list(executor.map(abs, range(workers)))
+
+            output_path = os.path.join(temp_dir, f"parallel_{workers}.pptx")
+            export_time, stats = export(model, temp_dir, output_path, executor, workers)
+
+        if get_parts(output_path) != expected:
+            raise SystemExit(f"Output with {workers} workers differs from sequential")
+        print(
+            f"{workers:>8} {export_time:>11.2f} {sequential_time / export_time:>7.1f}x "
+            f"{stats.speedup_per_core:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
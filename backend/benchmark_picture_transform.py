@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Compare the fused picture transform plan with the previous step-by-step chain."""
+
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image, ImageChops
+
+from ppt_generator.models.pptx_models import (
+    PptxBoxShapeEnum,
+    PptxObjectFitEnum,
+    PptxObjectFitModel,
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+)
+from ppt_generator.picture_transform import PictureTransformPlan
+from ppt_generator.utils import (
+    change_image_color,
+    clip_image,
+    create_circle_image,
+    fit_image,
+    round_image_corners,
+)
+
+SOURCE_SIZES = [(1080, 720), (3000, 2000), (6000, 4000)]
+
+# Both pipelines anti-alias rounded corners slightly differently, so a few
+# edge pixels may disagree. More than that means the shapes differ
+ALPHA_THRESHOLD = 64
+MAX_ALPHA_MISMATCH = 12
+
+CASES = {
+    "clip": dict(),
+    "cover+radius": dict(
+        object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.COVER, focus=[30, 50]),
+        border_radius=[24, 24, 24, 24],
+    ),
+    "contain+radius": dict(
+        object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.CONTAIN),
+        border_radius=[16, 0, 16, 0],
+    ),
+    "circle": dict(shape=PptxBoxShapeEnum.CIRCLE),
+    "clip+overlay": dict(overlay="ffffff"),
+}
+
+
+def legacy_transform(image: Image.Image, picture_model: PptxPictureBoxModel):
+    """Previous add_picture chain, kept here as the reference output."""
+    image = image.convert("RGBA")
+    if picture_model.border_radius:
+        image = round_image_corners(image, picture_model.border_radius)
+    if picture_model.object_fit:
+        image = fit_image(
+            image,
+            picture_model.position.width,
+            picture_model.position.height,
+            picture_model.object_fit,
+        )
+    elif picture_model.clip:
+        image = clip_image(
+            image, picture_model.position.width, picture_model.position.height
+        )
+    if picture_model.border_radius:
+        image = round_image_corners(image, picture_model.border_radius)
+    if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
+        image = create_circle_image(image)
+    if picture_model.overlay:
+        image = change_image_color(image, picture_model.overlay)
+    return image
+
+
+def make_jpeg(size) -> bytes:
+    width, height = size
+    image = Image.linear_gradient("L").resize(size).convert("RGB")
+    image.paste((200, 40, 90), (width // 4, height // 4, width // 2, height // 2))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def time_call(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(
+        f"{'source':>10} {'case':>15} {'legacy (ms)':>12} {'plan (ms)':>10} "
+        f"{'speedup':>8} {'alpha mismatch':>15}"
+    )
+    for size in SOURCE_SIZES:
+        jpeg = make_jpeg(size)
+        for name, fields in CASES.items():
+            picture_model = PptxPictureBoxModel(
+                position=PptxPositionModel(left=0, top=0, width=480, height=360),
+                picture=PptxPictureModel(is_network=False, path=""),
+                **fields,
+            )
+            plan = PictureTransformPlan.from_picture_box(picture_model)
+
+            legacy = legacy_transform(Image.open(io.BytesIO(jpeg)), picture_model)
+            fused = plan.apply(Image.open(io.BytesIO(jpeg)))
+            if legacy.size != fused.size:
+                raise SystemExit(f"Size mismatch for {name}: {legacy.size} != {fused.size}")
+            alpha_diff = ImageChops.difference(legacy.getchannel("A"), fused.getchannel("A"))
+            alpha_mismatch = alpha_diff.point(
+                lambda value: 255 if value > ALPHA_THRESHOLD else 0
+            ).histogram()[255]
+
+            legacy_time = time_call(
+                lambda: legacy_transform(Image.open(io.BytesIO(jpeg)), picture_model)
+            )
+            plan_time = time_call(lambda: plan.apply(Image.open(io.BytesIO(jpeg))))
+            print(
+                f"{size[0]}x{size[1]:<5} {name:>15} {legacy_time * 1000:>12.1f} "
+                f"{plan_time * 1000:>10.1f} {legacy_time / plan_time:>7.1f}x "
+                f"{alpha_mismatch:>15}"
+            )
+            if alpha_mismatch > MAX_ALPHA_MISMATCH:
+                raise SystemExit(
+                    f"Alpha of {name} differs in {alpha_mismatch} pixels for {size}"
+                )
+
+
+if __name__ == "__main__":
+    main()
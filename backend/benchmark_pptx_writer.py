@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare python-pptx's save plus reading the file back with the streaming writer."""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from ppt_generator.models.pptx_models import (
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+SLIDES = 20
+REPEATS = 3
+
+
+def make_presentation(temp_dir: str) -> PptxPresentationModel:
+    slides = []
+    for index in range(SLIDES):
+        # Noise compresses like a photo, i.e. hardly at all
+        image = Image.merge(
+            "RGB", [Image.effect_noise((640, 640), 40 + index + band) for band in range(3)]
+        )
+        source_path = os.path.join(temp_dir, f"source_{index}.jpg")
+        image.save(source_path, quality=90)
+        picture = PptxPictureModel(is_network=False, path=source_path)
+        slides.append(
+            PptxSlideModel(
+                shapes=[
+                    # Stays a JPEG
+                    PptxPictureBoxModel(
+                        position=PptxPositionModel(left=40, top=40, width=640, height=640),
+                        picture=picture,
+                    ),
+                    # Rounded corners make it a PNG
+                    PptxPictureBoxModel(
+                        position=PptxPositionModel(left=720, top=40, width=480, height=480),
+                        border_radius=[24, 24, 24, 24],
+                        picture=picture,
+                    ),
+                ]
+            )
+        )
+    return PptxPresentationModel(background_color="ffffff", slides=slides)
+
+
+def python_pptx_save(creator: PptxPresentationCreator, path: str) -> int:
+    """What the export handler used to do before uploading the deck."""
+    creator._ppt.save(path)
+    with open(path, "rb") as f:
+        ppt_content = f.read()
+    return len(ppt_content)
+
+
+def streaming_save(creator: PptxPresentationCreator, path: str) -> int:
+    creator.save(path)
+    return os.path.getsize(path)
+
+
+def measure(save, creator, path: str):
+    cpu_time = float("inf")
+    for _ in range(REPEATS):
+        start = time.process_time()
+        size = save(creator, path)
+        cpu_time = min(cpu_time, time.process_time() - start)
+
+    tracemalloc.start()
+    save(creator, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, cpu_time, peak
+
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+    creator = PptxPresentationCreator(make_presentation(temp_dir), temp_dir)
+    creator.create_ppt()
+
+    old_path = os.path.join(temp_dir, "python_pptx.pptx")
+    new_path = os.path.join(temp_dir, "streaming.pptx")
+    results = {
+        "python-pptx": measure(python_pptx_save, creator, old_path),
+        "streaming": measure(streaming_save, creator, new_path),
+    }
+
+    with zipfile.ZipFile(old_path) as old, zipfile.ZipFile(new_path) as new:
+        assert old.namelist() == new.namelist(), "members differ"
+        for name in old.namelist():
+            assert old.read(name) == new.read(name), f"{name} differs"
+        stored = sum(info.compress_type == zipfile.ZIP_STORED for info in new.infolist())
+    print(f"{SLIDES} slides, same members and content, {stored} media parts stored")
+
+    print(f"{'':>12} {'size (MB)':>10} {'cpu (s)':>8} {'peak memory (MB)':>17}")
+    for name, (size, cpu_time, peak) in results.items():
+        print(f"{name:>12} {size / 1e6:>10.2f} {cpu_time:>8.3f} {peak / 1e6:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
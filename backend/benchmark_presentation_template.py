@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare per export startup of parsing the default template with cloning a prepared one."""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from api.services.presentation_templates import PresentationTemplateCache
+from ppt_generator.models.pptx_models import (
+    PptxFontModel,
+    PptxParagraphModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+    PptxTextBoxModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+EXPORTS = 100
+THEME_COLORS = {"dk1": "#1A1A1A", "lt1": "#FFFFFF", "accent1": "#5E8CF0", "accent2": "#8800FF"}
+
+
+def make_presentation(theme_colors=None) -> PptxPresentationModel:
+    slides = [
+        PptxSlideModel(
+            shapes=[
+                PptxTextBoxModel(
+                    position=PptxPositionModel(left=80, top=60, width=600, height=120),
+                    paragraphs=[
+                        PptxParagraphModel(font=PptxFontModel(size=32), text=f"Slide **{index}**")
+                    ],
+                )
+            ]
+        )
+        for index in range(3)
+    ]
+    return PptxPresentationModel(
+        background_color="ffffff", slides=slides, theme_colors=theme_colors
+    )
+
+
+def get_parts(pptx_path: str) -> dict:
+    # docProps carry timestamps and are expected to differ between runs
+    with zipfile.ZipFile(pptx_path) as archive:
+        return {
+            info.filename: hashlib.sha256(archive.read(info)).hexdigest()
+            for info in archive.infolist()
+            if not info.filename.startswith("docProps/")
+        }
+
+
+def export(model, temp_dir: str, output_path: str, template_cache=None) -> dict:
+    creator = PptxPresentationCreator(model, temp_dir, template_cache=template_cache)
+    creator.create_ppt()
+    creator.save(output_path)
+    return get_parts(output_path)
+
+
+def time_startup(model, temp_dir: str, template_cache=None) -> float:
+    start = time.perf_counter()
+    for _ in range(EXPORTS):
+        PptxPresentationCreator(model, temp_dir, template_cache=template_cache)
+    return (time.perf_counter() - start) / EXPORTS
+
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+    cache = PresentationTemplateCache()
+
+    for theme_colors in (None, THEME_COLORS):
+        model = make_presentation(theme_colors)
+        parsed = export(model, temp_dir, os.path.join(temp_dir, "parsed.pptx"))
+        # Twice, so the second export clones a template another export used
+        export(model, temp_dir, os.path.join(temp_dir, "cloned.pptx"), cache)
+        cloned = export(model, temp_dir, os.path.join(temp_dir, "cloned.pptx"), cache)
+        assert cloned == parsed, "cloned template output differs"
+    print("output with cloned templates is identical")
+
+    print(f"{'':>10} {'parsed (ms)':>12} {'cloned (ms)':>12}")
+    for name, theme_colors in (("default", None), ("themed", THEME_COLORS)):
+        model = make_presentation(theme_colors)
+        parsed = time_startup(model, temp_dir)
+        cloned = time_startup(model, temp_dir, cache)
+        print(f"{name:>10} {parsed * 1000:>12.2f} {cloned * 1000:>12.2f}")
+    print(cache.get_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare building system prompts and schemas per request with the ones built at startup."""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from api.services.llm_clients import LLMClientRegistry
+from ppt_config_generator.models import PresentationTitlesModel
+from ppt_config_generator.ppt_title_summary_generator import get_prompt_template
+from ppt_generator.generator import (
+    CREATE_PRESENTATION_PROMPT,
+    PRESENTATION_SYSTEM_PROMPT,
+    get_user_message,
+)
+from ppt_generator.models.content_type_models import CONTENT_TYPE_MAPPING
+from ppt_generator.models.llm_models import LLMPresentationModel
+
+REQUESTS = 50
+TITLES = [f"Slide title {index}" for index in range(10)]
+SUMMARY = "Reference document " * 200
+
+
+def build_per_request():
+    """What every deck used to build before sending the first token."""
+    schema = LLMPresentationModel.model_json_schema()
+
+    system_prompt = f"{CREATE_PRESENTATION_PROMPT} -|0|--|0|- Follow this schema while giving out response: {schema}. Make description short and obey the character limits. Output should be in JSON format. Give out only JSON, nothing else."
+    system_prompt = SystemMessage(system_prompt.replace("-|0|-", "\n"))
+
+    user_message = f"Prompt: create presentation-|0|--|0|- Presentation Tone: Professional -|0|--|0|- Slide Titles: {TITLES} -|0|--|0|- Reference Document: {SUMMARY}"
+    user_message = HumanMessage(user_message.replace("-|0|-", "\n"))
+
+    get_prompt_template()
+    content_schemas = [each.model_json_schema() for each in CONTENT_TYPE_MAPPING.values()]
+    PresentationTitlesModel.model_json_schema()
+    return system_prompt, user_message, content_schemas
+
+
+def build_precomputed(registry: LLMClientRegistry):
+    system_prompt = SystemMessage(PRESENTATION_SYSTEM_PROMPT)
+    user_message = get_user_message(TITLES, "create presentation", "Professional", SUMMARY)
+    content_schemas = [registry.get_schema(each) for each in CONTENT_TYPE_MAPPING.values()]
+    registry.get_schema(PresentationTitlesModel)
+    return system_prompt, user_message, content_schemas
+
+
+def main():
+    registry = LLMClientRegistry()
+    start = time.perf_counter()
+    registry.prepare_schemas([*CONTENT_TYPE_MAPPING.values(), PresentationTitlesModel])
+    startup_seconds = time.perf_counter() - start
+
+    old_system, old_user, old_schemas = build_per_request()
+    new_system, new_user, new_schemas = build_precomputed(registry)
+    assert new_system.content == old_system.content, "system prompt changed"
+    assert new_user.content == old_user.content, "user message changed"
+    assert new_schemas == old_schemas, "content schemas changed"
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        build_per_request()
+    per_request = (time.perf_counter() - start) / REQUESTS
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        build_precomputed(registry)
+    precomputed = (time.perf_counter() - start) / REQUESTS
+
+    print(f"schemas prepared at startup in {startup_seconds * 1000:.1f} ms")
+    print(f"prompts are byte identical, {len(PRESENTATION_SYSTEM_PROMPT)} chars")
+    print(f"{'':>12} {'per request (ms)':>17}")
+    print(f"{'per request':>12} {per_request * 1000:>17.2f}")
+    print(f"{'precomputed':>12} {precomputed * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Measure local repair of invalid LLM responses that used to need an LLM round trip."""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pydantic import ValidationError
+
+from ppt_config_generator.models import PresentationTitlesModel
+from ppt_generator.fix_validation_errors import SchemaRepair
+from ppt_generator.models.llm_models import LLMType1Content, LLMType4Content
+
+REPEATS = 2000
+DESCRIPTION = "Revenue grew **42%** year over year " * 6
+
+CASES = [
+    (
+        "description over max_length",
+        LLMType4Content,
+        {
+            "title": "Growth",
+            "body": [{"heading": "Revenue", "description": DESCRIPTION}],
+            "image_prompts": ["office"],
+        },
+    ),
+    (
+        "too many image_prompts",
+        LLMType1Content,
+        {"title": "Intro", "body": "b" * 180, "image_prompts": ["one", "two", "three"]},
+    ),
+    (
+        "single value for a list",
+        LLMType1Content,
+        {"title": "Intro", "body": "b" * 180, "image_prompts": "one"},
+    ),
+    (
+        "misnamed key",
+        PresentationTitlesModel,
+        {"presentation_title": "Quarterly Review", "slide_titles": ["Intro", "Results"]},
+    ),
+    (
+        "description too short",
+        LLMType4Content,
+        {
+            "title": "Growth",
+            "body": [{"heading": "Revenue", "description": "Too short"}],
+            "image_prompts": ["office"],
+        },
+    ),
+]
+
+
+def main():
+    repair = SchemaRepair()
+    print(f"{'case':>30} {'repaired':>9} {'per repair (us)':>16}")
+    for name, response_model, response in CASES:
+        try:
+            response_model(**response)
+            raise AssertionError(f"{name} is valid")
+        except ValidationError as e:
+            error = e
+
+        repaired = repair.repair(response_model, response, error) is not None
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            repair.repair(response_model, response, error)
+        elapsed = (time.perf_counter() - start) / REPEATS
+        print(f"{name:>30} {str(repaired):>9} {elapsed * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Compare presentation stream time-to-complete with and without pipelined image fetching."""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Keep the benchmark away from real databases and app data
+BENCHMARK_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCHMARK_DIR, 'benchmark.db')}"
+os.environ["APP_DATA_DIRECTORY"] = BENCHMARK_DIR
+os.makedirs(os.path.join(BENCHMARK_DIR, "logs"), exist_ok=True)
+
+from langchain_core.messages import AIMessageChunk
+from sqlmodel import SQLModel
+
+import api.routers.presentation.handlers.generate_stream as generate_stream
+from api.models import LogMetadata
+from api.services.database import get_sql_session, sql_engine
+from api.services.logging import LoggingService
+from api.services.presentation_storage import presentation_storage
+from api.sql_models import KeyValueSqlModel, PresentationSqlModel
+
+SLIDES = 12
+LLM_SECONDS = 6.0
+IMAGE_SECONDS = 1.5
+# Providers serve a limited number of images at once, like the scheduler limits
+IMAGE_CONCURRENCY = 2
+CHUNK_SIZE = 40
+
+
+def make_presentation_text() -> str:
+    slides = []
+    for index in range(SLIDES):
+        title = f"Slide {index + 1}"
+        if index % 3 == 1:
+            slides.append(
+                {
+                    "type": 2,
+                    "content": {
+                        "title": title,
+                        "body": [{"heading": "Point", "description": "d" * 120}],
+                    },
+                }
+            )
+        else:
+            slides.append(
+                {
+                    "type": 1,
+                    "content": {
+                        "title": title,
+                        "body": "b" * 180,
+                        "image_prompts": [f"image for slide {index + 1}"],
+                    },
+                }
+            )
+    return json.dumps(
+        {
+            "title": "Benchmark",
+            "n_slides": SLIDES,
+            "titles": [each["content"]["title"] for each in slides],
+            "slides": slides,
+        }
+    )
+
+
+async def fake_presentation_stream(*args, **kwargs):
+    text = make_presentation_text()
+    chunks = [text[i : i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)]
+    for chunk in chunks:
+        await asyncio.sleep(LLM_SECONDS / len(chunks))
+        yield AIMessageChunk(content=chunk)
+
+
+image_provider_slots = None
+
+
+async def fake_generate_image(input, output_directory, search_keywords=None):
+    async with image_provider_slots:
+        await asyncio.sleep(IMAGE_SECONDS)
+    return os.path.join(output_directory, "image.jpg")
+
+
+async def fake_search_keywords(inputs):
+    await asyncio.sleep(0.5)
+    return [None] * len(inputs)
+
+
+async def run_stream(pipeline_images: bool) -> float:
+    global image_provider_slots
+    image_provider_slots = asyncio.Semaphore(IMAGE_CONCURRENCY)
+
+    with get_sql_session() as sql_session:
+        presentation = PresentationSqlModel(n_slides=SLIDES, prompt="benchmark")
+        sql_session.add(presentation)
+        sql_session.commit()
+        presentation_id = presentation.id
+        session = f"benchmark-{presentation_id}"
+        sql_session.add(
+            KeyValueSqlModel(
+                id=session,
+                key=session,
+                value={
+                    "presentation_id": presentation_id,
+                    "titles": [f"Slide {i + 1}" for i in range(SLIDES)],
+                },
+            )
+        )
+        sql_session.commit()
+
+    handler = generate_stream.PresentationGenerateStreamHandler(presentation_id, session)
+    handler.pipeline_images = pipeline_images
+    response = await handler.get(
+        logging_service=LoggingService("benchmark"), log_metadata=LogMetadata()
+    )
+
+    start = time.perf_counter()
+    # The handler prints the whole presentation, keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        async for _ in response.body_iterator:
+            pass
+    elapsed = time.perf_counter() - start
+
+    presentation_storage.delete_presentation(presentation_id)
+    return elapsed
+
+
+def main():
+    SQLModel.metadata.create_all(sql_engine)
+    generate_stream.generate_presentation_stream = fake_presentation_stream
+    generate_stream.generate_image = fake_generate_image
+    generate_stream.generate_search_keywords = fake_search_keywords
+
+    print(
+        f"{SLIDES} slides, LLM stream {LLM_SECONDS:.1f}s, "
+        f"{IMAGE_SECONDS:.1f}s per image, {IMAGE_CONCURRENCY} images at once, "
+        f"0.5s keyword call"
+    )
+    sequential = asyncio.run(run_stream(pipeline_images=False))
+    pipelined = asyncio.run(run_stream(pipeline_images=True))
+    print(f"{'after the stream (s)':>22} {'pipelined (s)':>14} {'saved (s)':>10}")
+    print(f"{sequential:>22.2f} {pipelined:>14.2f} {sequential - pipelined:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Check that picture render workers do not load the app.
+
+Spawned workers run the main module of the server again as __mp_main__. The
+first check runs server.py that way, the second asks a worker of the picture
+render pool which modules it has imported. Neither may import api.main, which
+would build another app with its own storage cleanup thread.
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from api.services.picture_render_pool import PictureRenderPool
+
+BACKEND_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# What a spawned worker does with the main module of its parent
+RUN_AS_WORKER_MAIN = """
+import runpy
+import sys
+
+runpy.run_path("server.py", run_name="__mp_main__")
+print("api.main" in sys.modules)
+"""
+
+
+def get_app_imported() -> bool:
+    return "api.main" in sys.modules
+
+
+def main():
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_AS_WORKER_MAIN],
+        cwd=BACKEND_DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    if output[-1] != "False":
+        raise SystemExit("server.py imports api.main when run by a spawned worker")
+    print("server.py does not import api.main in workers")
+
+    pool = PictureRenderPool(workers=1)
+    try:
+        if pool.executor.submit(get_app_imported).result():
+            raise SystemExit("Picture render worker imported api.main")
+    finally:
+        pool.shutdown()
+    print("Picture render worker did not import api.main")
+
+
+if __name__ == "__main__":
+    main()
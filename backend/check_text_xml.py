@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Check that text boxes built as XML match the python-pptx text objects.
+
+Every case renders one slide with both paths and compares the canonical XML
+of its shapes with the golden files in golden/text_xml, which hold the output
+of the python-pptx path. Run with --update to write the golden files again
+from the python-pptx path after an intended change.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lxml import etree
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.enum.text import PP_ALIGN
+
+from ppt_generator.models.pptx_models import (
+    PptxAutoShapeBoxModel,
+    PptxFillModel,
+    PptxFontModel,
+    PptxParagraphModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxShadowModel,
+    PptxSlideModel,
+    PptxSpacingModel,
+    PptxStrokeModel,
+    PptxTextBoxModel,
+    PptxTextRunModel,
+)
+from ppt_generator.pptx_presentation_creator import PptxPresentationCreator
+
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden", "text_xml")
+TIMED_SLIDES = 30
+TIMED_REPEATS = 3
+
+TITLE_FONT = PptxFontModel(name="Inter", size=40, bold=True, color="#1A1A1A")
+BODY_FONT = PptxFontModel(name="Lora", size=18, color="#333")
+POSITION = PptxPositionModel(left=80, top=60, width=600, height=120)
+
+
+def get_cases() -> dict:
+    return {
+        "markdown_paragraphs": [
+            PptxTextBoxModel(
+                position=POSITION,
+                margin=PptxSpacingModel(top=4, left=8, right=2),
+                fill=PptxFillModel(color="#f0f0f0"),
+                text_wrap=False,
+                paragraphs=[
+                    PptxParagraphModel(
+                        alignment=PP_ALIGN.CENTER,
+                        spacing=PptxSpacingModel(top=6, bottom=12),
+                        font=TITLE_FONT,
+                        text="Quarterly **Review**",
+                    ),
+                    PptxParagraphModel(
+                        font=BODY_FONT,
+                        text="Revenue grew **42%**, __margins__ held and ***costs*** fell\n"
+                        "second line with an **unclosed marker\n",
+                    ),
+                    PptxParagraphModel(font=BODY_FONT, text="same line\nsame line"),
+                ],
+            )
+        ],
+        "text_runs": [
+            PptxTextBoxModel(
+                position=POSITION,
+                paragraphs=[
+                    PptxParagraphModel(
+                        alignment=PP_ALIGN.RIGHT,
+                        text_runs=[
+                            PptxTextRunModel(text="plain <escaped> & \"quoted\" "),
+                            PptxTextRunModel(text="bold\ttab", font=TITLE_FONT),
+                            PptxTextRunModel(text="bell\x07 and form feed\x0c", font=BODY_FONT),
+                        ],
+                    ),
+                    PptxParagraphModel(text_runs=[]),
+                    PptxParagraphModel(spacing=PptxSpacingModel(bottom=3)),
+                    PptxParagraphModel(font=PptxFontModel(size=11, italic=True, color="zz")),
+                    PptxParagraphModel(text=""),
+                ],
+            )
+        ],
+        "empty_text_box": [PptxTextBoxModel(position=POSITION, paragraphs=[])],
+        "autoshape_paragraphs": [
+            PptxAutoShapeBoxModel(
+                type=MSO_AUTO_SHAPE_TYPE.ROUNDED_RECTANGLE,
+                position=POSITION,
+                margin=PptxSpacingModel.all(10),
+                fill=PptxFillModel(color="#204080"),
+                stroke=PptxStrokeModel(color="#ffffff", thickness=2),
+                shadow=PptxShadowModel(radius=8, offset=2),
+                border_radius=12,
+                paragraphs=[
+                    PptxParagraphModel(
+                        spacing=PptxSpacingModel(top=2, bottom=2),
+                        font=BODY_FONT,
+                        text="Inside a **shape**",
+                    ),
+                    PptxParagraphModel(
+                        alignment=PP_ALIGN.LEFT, font=BODY_FONT, text="__second__"
+                    ),
+                ],
+            ),
+            PptxAutoShapeBoxModel(
+                position=POSITION,
+                paragraphs=[PptxParagraphModel(alignment=PP_ALIGN.JUSTIFY, text="x", font=BODY_FONT)],
+            ),
+        ],
+    }
+
+
+def render_slide(shapes, direct_text_xml: bool, temp_dir: str):
+    model = PptxPresentationModel(
+        background_color="ffffff", slides=[PptxSlideModel(shapes=shapes)]
+    )
+    creator = PptxPresentationCreator(model, temp_dir, direct_text_xml=direct_text_xml)
+    creator.create_ppt()
+    return creator
+
+
+def get_shapes_xml(creator: PptxPresentationCreator) -> bytes:
+    slide = creator._ppt.slides[0]
+    return etree.tostring(slide.shapes._spTree, method="c14n")
+
+
+def get_text_heavy_deck() -> PptxPresentationModel:
+    slides = []
+    for index in range(TIMED_SLIDES):
+        paragraphs = [
+            PptxParagraphModel(
+                font=BODY_FONT,
+                spacing=PptxSpacingModel(bottom=8),
+                text=f"Point {line}: revenue grew **{index + line}%** while __costs__ "
+                "stayed flat and the ***team*** shipped the launch on time",
+            )
+            for line in range(8)
+        ]
+        slides.append(
+            PptxSlideModel(
+                shapes=[
+                    PptxTextBoxModel(
+                        position=POSITION,
+                        paragraphs=[PptxParagraphModel(font=TITLE_FONT, text=f"Slide {index}")],
+                    ),
+                    PptxTextBoxModel(position=POSITION, paragraphs=paragraphs),
+                    PptxAutoShapeBoxModel(position=POSITION, paragraphs=paragraphs[:3]),
+                ]
+            )
+        )
+    return PptxPresentationModel(background_color="ffffff", slides=slides)
+
+
+def time_text_heavy_deck(temp_dir: str):
+    model = get_text_heavy_deck()
+    print(f"{TIMED_SLIDES} slides of markdown text")
+    print(f"{'':>12} {'per deck (ms)':>14}")
+    for name, direct_text_xml in (("python-pptx", False), ("direct XML", True)):
+        best = float("inf")
+        for _ in range(TIMED_REPEATS):
+            deck = model.model_copy(deep=True)
+            start = time.perf_counter()
+            creator = PptxPresentationCreator(deck, temp_dir, direct_text_xml=direct_text_xml)
+            creator.create_ppt()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>12} {best * 1000:>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--update", action="store_true", help="write golden files from the python-pptx path"
+    )
+    parser.add_argument("--no-timing", action="store_true", help="skip timing a text heavy deck")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    os.makedirs(GOLDEN_DIRECTORY, exist_ok=True)
+
+    failures = 0
+    for name, shapes in get_cases().items():
+        golden_path = os.path.join(GOLDEN_DIRECTORY, f"{name}.xml")
+        python_pptx_xml = get_shapes_xml(render_slide(shapes, False, temp_dir))
+        direct_xml = get_shapes_xml(render_slide(shapes, True, temp_dir))
+
+        if args.update:
+            with open(golden_path, "wb") as f:
+                f.write(python_pptx_xml)
+
+        with open(golden_path, "rb") as f:
+            golden_xml = f.read()
+
+        if python_pptx_xml != golden_xml:
+            print(f"❌ {name}: python-pptx output differs from the golden file")
+            failures += 1
+        elif direct_xml != golden_xml:
+            print(f"❌ {name}: direct XML differs from the golden file")
+            failures += 1
+        else:
+            print(f"✅ {name}")
+
+    if failures:
+        sys.exit(f"{failures} case(s) differ")
+
+    if not args.no_timing:
+        print()
+        time_text_heavy_deck(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
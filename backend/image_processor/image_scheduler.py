@@ -0,0 +1,231 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from pydantic import BaseModel
+
+# Priority of the image job running in the current task, lower runs first
+_image_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "image_priority", default=0
+)
+
+# Images requested interactively go ahead of every deck being generated
+INTERACTIVE_PRIORITY = -1
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """Raised by provider calls for failures worth retrying, like HTTP 429."""
+
+
+class ProviderLimits(BaseModel):
+    concurrency: int = 4
+    rate_per_second: float = 5.0
+    burst: int = 10
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+
+DEFAULT_PROVIDER_LIMITS = {
+    # Keyword extraction calls
+    "gemini": ProviderLimits(concurrency=4, rate_per_second=4.0, burst=4),
+    "gemini_image": ProviderLimits(concurrency=2, rate_per_second=0.5, burst=2),
+    # Search and download tracking on the Unsplash API
+    "unsplash": ProviderLimits(concurrency=4, rate_per_second=5.0, burst=10),
+    # Image bytes come from the Unsplash CDN, which is not rate limited
+    "unsplash_cdn": ProviderLimits(concurrency=8, rate_per_second=50.0, burst=50),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate_per_second,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+
+class PrioritySlots:
+    """Semaphore that hands free slots to the waiter with the lowest priority value."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int):
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over right before the cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot over directly, active count stays the same
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+class _Provider:
+    def __init__(self, limits: ProviderLimits):
+        self.limits = limits
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._create_primitives()
+
+    def _create_primitives(self):
+        self.slots = PrioritySlots(self.limits.concurrency)
+        self.bucket = TokenBucket(self.limits.rate_per_second, self.limits.burst)
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """Use ``loop`` from now on, primitives of an earlier loop are replaced."""
+        # The lock and waiter futures are bound to the loop they were first
+        # used on, e.g. a loop of asyncio.run that has finished since
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._create_primitives()
+            self._loop = loop
+
+
+class ImageAcquisitionScheduler:
+    """
+    Schedules image provider calls made while fetching slide assets.
+
+    Every provider has a concurrency limit, a token bucket rate limit and
+    retries retryable failures with jittered exponential backoff. Waiting calls
+    are served by priority, which is the slide index for generated decks, so
+    earlier slides get their images first.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, ProviderLimits]] = None):
+        limits = dict(limits or DEFAULT_PROVIDER_LIMITS)
+
+        # Try to read provider limits from config, fallback to defaults
+        try:
+            config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+            if os.path.exists(config_path):
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    for name, overrides in config.get("image_providers", {}).items():
+                        base = limits.get(name, ProviderLimits())
+                        limits[name] = base.model_copy(update=overrides)
+        except Exception:
+            pass
+
+        self._providers = {name: _Provider(each) for name, each in limits.items()}
+
+    def _get_provider(self, name: str) -> _Provider:
+        if name not in self._providers:
+            self._providers[name] = _Provider(ProviderLimits())
+        provider = self._providers[name]
+        provider.bind(asyncio.get_running_loop())
+        return provider
+
+    async def run_with_priority(self, priority: int, func, *args, **kwargs):
+        """Await ``func`` with every provider call it makes scheduled at ``priority``."""
+        token = _image_priority.set(priority)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _image_priority.reset(token)
+
+    async def run(self, provider_name: str, func, *args, **kwargs):
+        """Await the provider call ``func`` within the limits of ``provider_name``."""
+        provider = self._get_provider(provider_name)
+        priority = _image_priority.get()
+
+        attempt = 0
+        while True:
+            await provider.slots.acquire(priority)
+            try:
+                await provider.bucket.acquire()
+                provider.calls += 1
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= provider.limits.max_retries or not is_retryable(e):
+                    provider.failures += 1
+                    raise
+            finally:
+                provider.slots.release()
+
+            # Full jitter keeps retries of parallel calls from lining up again
+            attempt += 1
+            provider.retries += 1
+            delay = min(
+                provider.limits.max_delay,
+                provider.limits.base_delay * 2 ** (attempt - 1),
+            )
+            await asyncio.sleep(random.uniform(0, delay))
+
+    def get_stats(self) -> dict:
+        return {
+            name: {
+                "active": provider.slots.active,
+                "waiting": provider.slots.waiting,
+                "calls": provider.calls,
+                "retries": provider.retries,
+                "failures": provider.failures,
+            }
+            for name, provider in self._providers.items()
+        }
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUSES
+
+    # LLM clients surface quota and overload errors with their own types
+    message = str(error).lower()
+    return any(
+        each in message
+        for each in ("429", "quota", "resource exhausted", "unavailable", "overloaded")
+    )
+
+
+# Global instance
+image_scheduler = ImageAcquisitionScheduler()
@@ -3,31 +3,50 @@ import base64
 import os
 import uuid
 import aiohttp
-from typing import List
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import List, Optional
 
 from ppt_generator.models.query_and_prompt_models import (
     ImagePromptWithThemeAndAspectRatio,
 )
+from api.services.llm_clients import llm_clients
 from api.utils import get_resource
+from image_processor.image_scheduler import image_scheduler
 from image_processor.unsplash_client import unsplash_client, UnsplashImage
 
 
-async def generate_image(
-    input: ImagePromptWithThemeAndAspectRatio,
-    output_directory: str,
-) -> str:
+def get_enhanced_image_prompt(input: ImagePromptWithThemeAndAspectRatio) -> str:
     # Enhance prompt with more context for better relevance
-    image_prompt = (
+    return (
         f"{input.image_prompt}, theme: {input.theme_prompt}, "
         f"style: high quality, professional, relevant, "
         f"aspect ratio: {input.aspect_ratio.value}"
     )
+
+
+async def generate_search_keywords(
+    inputs: List[ImagePromptWithThemeAndAspectRatio],
+) -> List[Optional[str]]:
+    """Generate Unsplash search keywords for every image of a deck in one LLM call"""
+    if not unsplash_client or not unsplash_client.api_key:
+        return [None] * len(inputs)
+    return await unsplash_client.generate_search_keywords_batch(
+        [get_enhanced_image_prompt(each) for each in inputs]
+    )
+
+
+async def generate_image(
+    input: ImagePromptWithThemeAndAspectRatio,
+    output_directory: str,
+    search_keywords: Optional[str] = None,
+) -> str:
+    image_prompt = get_enhanced_image_prompt(input)
     print(f"Request - Finding Image for {image_prompt}")
 
     try:
         # Use Unsplash to find high-quality images
-        image_path = await search_and_download_image(image_prompt, output_directory, input.aspect_ratio.value)
+        image_path = await search_and_download_image(
+            image_prompt, output_directory, input.aspect_ratio.value, search_keywords
+        )
         if image_path and os.path.exists(image_path):
             print(f"Successfully found image from Unsplash: {image_path}")
             return image_path
@@ -45,7 +64,12 @@ async def generate_image(
         return get_resource("assets/images/placeholder.jpg")
 
 
-async def search_and_download_image(prompt: str, output_directory: str, aspect_ratio: str) -> str:
+async def search_and_download_image(
+    prompt: str,
+    output_directory: str,
+    aspect_ratio: str,
+    search_keywords: Optional[str] = None,
+) -> str:
     """Search for images on Unsplash and download the best match"""
     try:
         # Check if Unsplash client is available
@@ -65,7 +89,8 @@ async def search_and_download_image(prompt: str, output_directory: str, aspect_r
             query=prompt,
             page=1,
             per_page=3,  # Get top 3 results
-            orientation=orientation
+            orientation=orientation,
+            search_keywords=search_keywords,
         )
         
         if not images:
@@ -122,9 +147,12 @@ async def search_images_for_selection(prompt: str, page: int = 1, limit: int = 1
 async def generate_image_google(prompt: str, output_directory: str) -> str:
     """Fallback image generation using Google Gemini"""
     try:
-        response = await ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash-preview-image-generation"
-        ).ainvoke([prompt], generation_config={"response_modalities": ["TEXT", "IMAGE"]})
+        response = await image_scheduler.run(
+            "gemini_image",
+            llm_clients.get_model("gemini-2.0-flash-preview-image-generation").ainvoke,
+            [prompt],
+            generation_config={"response_modalities": ["TEXT", "IMAGE"]},
+        )
 
         image_block = next(
             block
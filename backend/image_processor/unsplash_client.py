@@ -1,9 +1,24 @@
 import os
 import asyncio
-import aiohttp
-from typing import List, Optional
+import json
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
-from langchain_google_genai import ChatGoogleGenerativeAI
+
+from api.services.http_client import HttpClientRegistry, http_clients
+from api.services.image_search_cache import (
+    KEYWORDS,
+    RESULTS,
+    ImageSearchCache,
+    image_search_cache,
+)
+from api.services.image_store import SharedImageStore, image_store
+from api.services.llm_clients import llm_clients
+from image_processor.image_scheduler import (
+    RETRYABLE_STATUSES,
+    ImageAcquisitionScheduler,
+    RetryableError,
+    image_scheduler,
+)
 
 
 class UnsplashImage(BaseModel):
@@ -15,8 +30,27 @@ class UnsplashImage(BaseModel):
     download_url: str
 
 
+class PromptSearchKeywords(BaseModel):
+    index: int
+    keywords: str
+
+
+class SearchKeywordsBatch(BaseModel):
+    items: List[PromptSearchKeywords]
+
+
 class UnsplashClient:
-    def __init__(self):
+    def __init__(
+        self,
+        http_client_registry: HttpClientRegistry = http_clients,
+        scheduler: ImageAcquisitionScheduler = image_scheduler,
+        cache: ImageSearchCache = image_search_cache,
+        store: SharedImageStore = image_store,
+    ):
+        self.http_clients = http_client_registry
+        self.scheduler = scheduler
+        self.cache = cache
+        self.store = store
         self.api_key = os.getenv("UNSPLASH_API_KEY")
         if not self.api_key:
             print("Warning: UNSPLASH_API_KEY environment variable not found")
@@ -28,8 +62,26 @@ class UnsplashClient:
             "Accept": "application/json"
         }
 
+    async def _get(self, provider: str, url: str, **kwargs) -> Tuple[int, bytes]:
+        """GET ``url`` within the scheduler limits of ``provider``."""
+
+        async def request():
+            session = self.http_clients.get()
+            async with session.get(url, **kwargs) as response:
+                if response.status in RETRYABLE_STATUSES:
+                    raise RetryableError(f"Unsplash responded with {response.status}")
+                return response.status, await response.read()
+
+        return await self.scheduler.run(provider, request)
+
     async def generate_search_keywords(self, prompt: str) -> str:
         """Use Gemini to generate relevant keywords for Unsplash search"""
+        cached = self.cache.get(KEYWORDS, prompt)
+        if cached:
+            return cached["keywords"]
+        return await self._generate_search_keywords(prompt)
+
+    async def _generate_search_keywords(self, prompt: str) -> str:
         try:
             keyword_prompt = f"""
             Given this image prompt, generate 3-5 relevant keywords that would help find high-quality stock photos on Unsplash.
@@ -44,11 +96,12 @@ class UnsplashClient:
             - "technology laptop workspace" for tech-related images
             """
             
-            llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
-            response = await llm.ainvoke([keyword_prompt])
+            llm = llm_clients.get_model("gemini-2.0-flash")
+            response = await self.scheduler.run("gemini", llm.ainvoke, [keyword_prompt])
             
             # Extract keywords from response
             keywords = response.content.strip()
+            self.cache.put(KEYWORDS, prompt, {"keywords": keywords})
             return keywords
             
         except Exception as e:
@@ -56,12 +109,66 @@ class UnsplashClient:
             # Fallback to using the original prompt
             return prompt[:100]  # Limit length for API
 
+    async def generate_search_keywords_batch(self, prompts: List[str]) -> List[str]:
+        """Use a single Gemini call to generate Unsplash search keywords for every prompt"""
+        keywords_by_prompt = {}
+        for each in dict.fromkeys(prompts):
+            cached = self.cache.get(KEYWORDS, each)
+            if cached:
+                keywords_by_prompt[each] = cached["keywords"]
+
+        unique_prompts = [
+            each for each in dict.fromkeys(prompts) if each not in keywords_by_prompt
+        ]
+        if not unique_prompts:
+            return [keywords_by_prompt[each] for each in prompts]
+
+        try:
+            numbered_prompts = "\n".join(
+                f"{index}. {prompt}" for index, prompt in enumerate(unique_prompts)
+            )
+            keyword_prompt = f"""
+            For each numbered image prompt below, generate 3-5 relevant keywords that would help find high-quality stock photos on Unsplash.
+            Focus on concrete, visual elements that photographers would capture.
+            
+            Image prompts:
+            {numbered_prompts}
+            
+            Return one item per image prompt with its number as index and only the keywords separated by spaces.
+            Examples:
+            - "business meeting office" for corporate scenes
+            - "nature landscape mountains" for outdoor scenes
+            - "technology laptop workspace" for tech-related images
+            """
+
+            llm = llm_clients.get_chain(SearchKeywordsBatch, model_name="gemini-2.0-flash")
+            response = await self.scheduler.run("gemini", llm.ainvoke, [keyword_prompt])
+
+            for item in SearchKeywordsBatch(**response).items:
+                if 0 <= item.index < len(unique_prompts) and item.keywords.strip():
+                    prompt = unique_prompts[item.index]
+                    keywords_by_prompt[prompt] = item.keywords.strip()
+                    self.cache.put(KEYWORDS, prompt, {"keywords": keywords_by_prompt[prompt]})
+
+        except Exception as e:
+            print(f"Error generating batched keywords with Gemini: {e}")
+
+        # Prompts missing from the batch response fall back to one call each
+        missing_prompts = [each for each in unique_prompts if each not in keywords_by_prompt]
+        fallback_keywords = await asyncio.gather(
+            *[self._generate_search_keywords(each) for each in missing_prompts]
+        )
+        keywords_by_prompt.update(zip(missing_prompts, fallback_keywords))
+
+        return [keywords_by_prompt[each] for each in prompts]
+
     async def search_images(
         self, 
         query: str, 
         page: int = 1, 
         per_page: int = 10,
-        orientation: str = "landscape"
+        orientation: str = "landscape",
+        search_keywords: Optional[str] = None,
     ) -> List[UnsplashImage]:
         """Search for images on Unsplash"""
         try:
@@ -70,8 +177,13 @@ class UnsplashClient:
                 print("Unsplash API key not available, returning empty results")
                 return []
             
-            # Generate better search keywords using Gemini
-            search_keywords = await self.generate_search_keywords(query)
+            cached = self.cache.get(RESULTS, query, orientation, page, per_page)
+            if cached:
+                return [UnsplashImage(**each) for each in cached["images"]]
+
+            # Generate better search keywords using Gemini, unless batched beforehand
+            if not search_keywords:
+                search_keywords = await self.generate_search_keywords(query)
             
             url = f"{self.base_url}/search/photos"
             params = {
@@ -83,36 +195,49 @@ class UnsplashClient:
                 "content_filter": "high"  # Filter out potentially inappropriate content
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status != 200:
-                        print(f"Unsplash API error: {response.status} - {await response.text()}")
-                        return []
-                    
-                    data = await response.json()
-                    results = data.get("results", [])
-                    
-                    images = []
-                    for result in results:
-                        try:
-                            # Use regular quality for better performance
-                            image_url = result["urls"]["regular"]
-                            download_url = result["links"]["download"]
-                            
-                            images.append(UnsplashImage(
-                                id=result["id"],
-                                url=image_url,
-                                alt_description=result.get("alt_description"),
-                                width=result["width"],
-                                height=result["height"],
-                                download_url=download_url
-                            ))
-                        except KeyError as e:
-                            print(f"Error parsing Unsplash result: {e}")
-                            continue
-                    
-                    return images
+            status, body = await self._get(
+                "unsplash", url, headers=self.headers, params=params
+            )
+            if status != 200:
+                print(f"Unsplash API error: {status} - {body.decode(errors='replace')}")
+                return []
+            
+            data = json.loads(body)
+            results = data.get("results", [])
+            
+            images = []
+            for result in results:
+                try:
+                    # Use regular quality for better performance
+                    image_url = result["urls"]["regular"]
+                    download_url = result["links"]["download"]
                     
+                    images.append(UnsplashImage(
+                        id=result["id"],
+                        url=image_url,
+                        alt_description=result.get("alt_description"),
+                        width=result["width"],
+                        height=result["height"],
+                        download_url=download_url
+                    ))
+                except KeyError as e:
+                    print(f"Error parsing Unsplash result: {e}")
+                    continue
+            
+            if images:
+                self.cache.put(
+                    RESULTS,
+                    query,
+                    {
+                        "keywords": search_keywords,
+                        "images": [each.model_dump(mode="json") for each in images],
+                    },
+                    orientation,
+                    page,
+                    per_page,
+                )
+            return images
+                
         except Exception as e:
             print(f"Error searching Unsplash: {e}")
             return []
@@ -123,25 +248,25 @@ class UnsplashClient:
             # Normalize path for cross-platform compatibility
             output_path = os.path.normpath(output_path)
             
-            async with aiohttp.ClientSession() as session:
-                # First, trigger the download endpoint to credit the photographer
-                try:
-                    async with session.get(unsplash_image.download_url, headers=self.headers):
-                        pass  # Just trigger the download tracking
-                except:
-                    pass  # Don't fail if tracking fails
-                
-                # Download the actual image
-                async with session.get(unsplash_image.url) as response:
-                    if response.status == 200:
-                        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                        with open(output_path, 'wb') as f:
-                            f.write(await response.read())
-                        return output_path
-                    else:
-                        print(f"Failed to download image: {response.status}")
-                        return ""
-                        
+            # First, trigger the download endpoint to credit the photographer
+            try:
+                await self._get("unsplash", unsplash_image.download_url, headers=self.headers)
+            except:
+                pass  # Don't fail if tracking fails
+            
+            # Photos used by earlier decks are linked from the shared store
+            store_key = f"unsplash_{unsplash_image.id}"
+            if self.store.link(store_key, output_path):
+                return output_path
+            
+            # Download the actual image
+            status, body = await self._get("unsplash_cdn", unsplash_image.url)
+            if status == 200:
+                return self.store.put(store_key, body, output_path)
+            else:
+                print(f"Failed to download image: {status}")
+                return ""
+                    
         except Exception as e:
             print(f"Error downloading image: {e}")
             return ""
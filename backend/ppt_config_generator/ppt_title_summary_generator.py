@@ -1,9 +1,8 @@
-import os
 import asyncio
 from typing import Optional
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
 
+from api.services.llm_clients import llm_clients
 from ppt_config_generator.models import PresentationTitlesModel
 from ppt_generator.fix_validation_errors import get_validated_response
 
@@ -85,6 +84,9 @@ def get_prompt_template():
     )
 
 
+prompt_template = get_prompt_template()
+
+
 async def generate_ppt_titles(
     prompt: Optional[str],
     content: Optional[str],
@@ -97,13 +99,7 @@ async def generate_ppt_titles(
     
     for attempt in range(max_retries):
         try:
-            model = (
-                ChatGoogleGenerativeAI(model="gemini-2.0-flash")
-                if os.getenv("LLM") == "google"
-                else ChatGoogleGenerativeAI(model="gemini-2.0-flash-exp")
-            ).with_structured_output(PresentationTitlesModel.model_json_schema())
-
-            chain = get_prompt_template() | model
+            chain = llm_clients.get_chain(PresentationTitlesModel, prompt_template)
 
             response = await get_validated_response(
                 chain,
@@ -1,10 +1,16 @@
-import os
+import copy
+import difflib
+import re
+import threading
+import types
+from typing import List, Optional, Set, Type, Union, get_args, get_origin
+
 from fastapi import HTTPException
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, ValidationError
 
+from api.services.llm_clients import llm_clients
+
 
 def get_prompt_template():
     return ChatPromptTemplate(
@@ -37,16 +43,186 @@ def get_prompt_template():
     )
 
 
-async def fix_validation_errors(response_model: BaseModel, response, errors):
-    model = (
-        ChatGoogleGenerativeAI(model="gemini-2.0-flash")
-        if os.getenv("LLM") == "google"
-        else ChatGoogleGenerativeAI(model="gemini-2.0-flash-exp")
-    )
+class SchemaRepair:
+    """
+    Deterministic local fixes for common validation errors of LLM responses.
 
-    chain = get_prompt_template() | model.with_structured_output(
-        response_model.model_json_schema()
-    )
+    Strings and lists over their maximum length are shortened, single values
+    are wrapped where a list is expected and misnamed keys are renamed to the
+    missing field they most likely are. Responses that still do not validate
+    are sent back to the LLM. Counters show which error types were repaired
+    locally and which were escalated.
+    """
+
+    REPAIRABLE_TYPES = {"string_too_long", "too_long", "list_type", "missing"}
+
+    def __init__(self, max_passes: int = 3):
+        # Fixing one error can surface another one below it
+        self.max_passes = max_passes
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def repair(
+        self, response_model: Type[BaseModel], response: dict, error: ValidationError
+    ) -> Optional[BaseModel]:
+        """Return the validated ``response`` after local fixes, or None if it can not be fixed."""
+        if not isinstance(response, dict):
+            return None
+
+        data = copy.deepcopy(response)
+        errors = error.errors()
+        error_types = [each["type"] for each in errors]
+        repaired_types = []
+
+        for _ in range(self.max_passes):
+            for each in errors:
+                if not self._repair_error(response_model, data, each):
+                    self._count(error_types, "escalated")
+                    return None
+                repaired_types.append(each["type"])
+            try:
+                validated_response = response_model(**data)
+            except ValidationError as e:
+                errors = e.errors()
+                continue
+            self._count(repaired_types, "repaired")
+            return validated_response
+
+        self._count(error_types, "escalated")
+        return None
+
+    def _repair_error(self, response_model: Type[BaseModel], data: dict, error: dict) -> bool:
+        if error["type"] not in self.REPAIRABLE_TYPES or not error["loc"]:
+            return False
+
+        path, key = error["loc"][:-1], error["loc"][-1]
+        # Errors inside unions are reported for every member, the intended
+        # member is not known
+        field_names = self._get_field_names(response_model, path)
+        if field_names is None:
+            return False
+        container = self._get_container(data, path)
+        if container is None:
+            return False
+
+        if error["type"] == "missing":
+            return self._rename_key(container, key, field_names)
+
+        try:
+            value = container[key]
+        except (KeyError, IndexError, TypeError):
+            return False
+
+        if error["type"] == "string_too_long" and isinstance(value, str):
+            container[key] = self._truncate(value, error["ctx"]["max_length"])
+        elif error["type"] == "too_long" and isinstance(value, list):
+            container[key] = value[: error["ctx"]["max_length"]]
+        elif error["type"] == "list_type" and not isinstance(value, list) and value is not None:
+            container[key] = [value]
+        else:
+            return False
+        return True
+
+    @staticmethod
+    def _truncate(text: str, max_length: int) -> str:
+        truncated = text[:max_length]
+        # Prefer cutting at a word boundary if it does not lose much
+        cut_index = truncated.rstrip().rfind(" ")
+        if cut_index >= max_length * 0.8:
+            truncated = truncated[:cut_index]
+        return truncated.rstrip(" ,;:-")
+
+    @staticmethod
+    def _normalize_key(key) -> str:
+        return re.sub(r"[^a-z0-9]", "", str(key).lower()).rstrip("s")
+
+    def _rename_key(self, container, field_name, field_names: Set[str]) -> bool:
+        if not isinstance(container, dict) or not isinstance(field_name, str):
+            return False
+
+        unknown_keys = [each for each in container if each not in field_names]
+        normalized_field_name = self._normalize_key(field_name)
+        matches = [
+            each for each in unknown_keys if self._normalize_key(each) == normalized_field_name
+        ]
+        if not matches and normalized_field_name:
+            # Like "slide_titles" for "titles"
+            matches = [
+                each
+                for each in unknown_keys
+                if self._normalize_key(each).startswith(normalized_field_name)
+                or self._normalize_key(each).endswith(normalized_field_name)
+            ]
+        if not matches:
+            close_matches = difflib.get_close_matches(
+                field_name.lower(), [str(each).lower() for each in unknown_keys], n=2, cutoff=0.8
+            )
+            matches = [
+                each for each in unknown_keys if str(each).lower() in close_matches
+            ]
+        if len(matches) != 1:
+            return False
+
+        container[field_name] = container.pop(matches[0])
+        return True
+
+    @staticmethod
+    def _get_container(data, path):
+        for part in path:
+            try:
+                data = data[part]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return data
+
+    def _get_field_names(self, response_model: Type[BaseModel], path) -> Optional[Set[str]]:
+        """Field names of the model at ``path`` or None if it is not a plain model path."""
+        annotation = response_model
+        for part in path:
+            annotation = self._unwrap_optional(annotation)
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                if part not in annotation.model_fields:
+                    return None
+                annotation = annotation.model_fields[part].annotation
+            elif get_origin(annotation) in (list, List) and isinstance(part, int):
+                annotation = get_args(annotation)[0]
+            else:
+                return None
+
+        annotation = self._unwrap_optional(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return set(annotation.model_fields)
+        # Values of list items and plain fields are repaired in their container
+        return set()
+
+    @staticmethod
+    def _unwrap_optional(annotation):
+        if get_origin(annotation) in (Union, types.UnionType):
+            members = [each for each in get_args(annotation) if each is not type(None)]
+            if len(members) == 1:
+                return members[0]
+        return annotation
+
+    def _count(self, error_types: List[str], outcome: str):
+        with self._lock:
+            for each in error_types:
+                counters = self._counters.setdefault(each, {"repaired": 0, "escalated": 0})
+                counters[outcome] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {each: dict(counters) for each, counters in self._counters.items()}
+
+
+# Global instance
+schema_repair = SchemaRepair()
+
+
+prompt_template = get_prompt_template()
+
+
+async def fix_validation_errors(response_model: BaseModel, response, errors):
+    chain = llm_clients.get_chain(response_model, prompt_template)
     return await chain.ainvoke({"input": response, "errors": errors})
 
 
@@ -65,6 +241,11 @@ async def get_validated_response(
             validated_response = response_model(**response)
             return validated_response
         except ValidationError as e:
+            # Trivial errors are fixed locally instead of another LLM round trip
+            validated_response = schema_repair.repair(response_model, response, e)
+            if validated_response is not None:
+                return validated_response
+
             if retries < attempt:
                 break
 
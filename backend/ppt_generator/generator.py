@@ -1,10 +1,21 @@
+import asyncio
+import json
 import os
-from typing import AsyncIterator, List
+from types import MappingProxyType
+from typing import AsyncIterator, List, Mapping, Optional, Tuple
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_google_genai import ChatGoogleGenerativeAI
+from fastapi import HTTPException
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessageChunk
-from ppt_generator.models.llm_models import LLMPresentationModel
+from pydantic import BaseModel
+from api.services.llm_clients import llm_clients
+from ppt_generator.fix_validation_errors import get_validated_response
+from ppt_generator.models.llm_models import (
+    LLM_CONTENT_TYPE_MAPPING,
+    LLMPresentationModel,
+    LLMPresentationPlanModel,
+    LLMSlideModel,
+)
+from ppt_generator.models.other_models import SlideType
 
 CREATE_PRESENTATION_PROMPT = """
                 You're an expert presentation designer specializing in transforming tech company ideas into compelling, industry-standard presentations that rival those from top consulting firms and Fortune 500 companies.
@@ -83,25 +94,185 @@ CREATE_PRESENTATION_PROMPT = """
 """
 
 
+# System prompts are built once at startup and are the same bytes for every
+# request, so provider side context caching can apply to them
+PRESENTATION_SYSTEM_PROMPT = f"{CREATE_PRESENTATION_PROMPT} -|0|--|0|- Follow this schema while giving out response: {llm_clients.get_schema(LLMPresentationModel)}. Make description short and obey the character limits. Output should be in JSON format. Give out only JSON, nothing else.".replace(
+    "-|0|-", "\n"
+)
+
+PLAN_SYSTEM_PROMPT = f"{CREATE_PRESENTATION_PROMPT} -|0|--|0|- Only select a slide type for every slide title, keep the order of the titles. Slide content is generated later.".replace(
+    "-|0|-", "\n"
+)
+
+SLIDE_SYSTEM_PROMPTS: Mapping[SlideType, str] = MappingProxyType(
+    {
+        slide_type: f"{CREATE_PRESENTATION_PROMPT} -|0|--|0|- Generate content of a single slide of the presentation. Slide type is already selected as **{slide_type.value}**. {content_model.get_notes()} -|0|- Make description short and obey the character limits.".replace(
+            "-|0|-", "\n"
+        )
+        for slide_type, content_model in LLM_CONTENT_TYPE_MAPPING.items()
+    }
+)
+
+
+def get_user_message(
+    titles: List[str],
+    prompt: str,
+    tone: str,
+    summary: str,
+    slide_index: Optional[int] = None,
+) -> HumanMessage:
+    parts = [f"Prompt: {prompt}", f" Presentation Tone: {tone} ", f" Slide Titles: {titles} "]
+    if slide_index is not None:
+        parts.append(f" Slide Number: {slide_index + 1} ")
+        parts.append(f" Slide Title: {titles[slide_index]} ")
+    parts.append(f" Reference Document: {summary}")
+    return HumanMessage("\n\n".join(parts))
+
+
+class SlideGenerationSettings(BaseModel):
+    # "stream" generates the whole presentation in one response, "per_slide"
+    # plans the slide types first and generates the slides in parallel
+    mode: str = "stream"
+    concurrency: int = 4
+    retries: int = 2
+
+
+def get_slide_generation_settings() -> SlideGenerationSettings:
+    settings = SlideGenerationSettings()
+    # Try to read generation settings from config, fallback to defaults
+    try:
+        config_path = os.path.join(os.getenv("APP_DATA_DIRECTORY", ""), "config.json")
+        if os.path.exists(config_path):
+            with open(config_path, "r") as f:
+                config = json.load(f)
+                settings = settings.model_copy(
+                    update=config.get("slide_generation", {})
+                )
+    except Exception:
+        pass
+    return settings
+
+
 def generate_presentation_stream(
     titles: List[str],
     prompt: str,
     tone: str,
     summary: str,
 ) -> AsyncIterator[AIMessageChunk]:
+    system_prompt = SystemMessage(PRESENTATION_SYSTEM_PROMPT)
+    user_message = get_user_message(titles, prompt, tone, summary)
+
+    return llm_clients.get_model().astream([system_prompt, user_message])
+
+
+async def generate_presentation_plan(
+    titles: List[str],
+    prompt: str,
+    tone: str,
+    summary: str,
+) -> LLMPresentationPlanModel:
+    system_prompt = SystemMessage(PLAN_SYSTEM_PROMPT)
+    user_message = get_user_message(titles, prompt, tone, summary)
+
+    chain = llm_clients.get_chain(LLMPresentationPlanModel)
+    return await get_validated_response(
+        chain, [system_prompt, user_message], LLMPresentationPlanModel
+    )
+
+
+def get_planned_slide_types(
+    plan: Optional[LLMPresentationPlanModel], n_slides: int
+) -> List[SlideType]:
+    slide_types = []
+    for index in range(n_slides):
+        if plan and index < len(plan.slides) and plan.slides[index].type != SlideType.type3:
+            slide_types.append(plan.slides[index].type)
+        elif index == 0 or index == n_slides - 1:
+            # Introductions and conclusions favor type 1
+            slide_types.append(SlideType.type1)
+        else:
+            slide_types.append(SlideType.type2)
+    return slide_types
 
-    schema = LLMPresentationModel.model_json_schema()
 
-    system_prompt = f"{CREATE_PRESENTATION_PROMPT} -|0|--|0|- Follow this schema while giving out response: {schema}. Make description short and obey the character limits. Output should be in JSON format. Give out only JSON, nothing else."
-    system_prompt = SystemMessage(system_prompt.replace("-|0|-", "\n"))
+async def generate_slide_content(
+    index: int,
+    slide_type: SlideType,
+    titles: List[str],
+    prompt: str,
+    tone: str,
+    summary: str,
+) -> LLMSlideModel:
+    content_model = LLM_CONTENT_TYPE_MAPPING[slide_type]
 
-    user_message = f"Prompt: {prompt}-|0|--|0|- Presentation Tone: {tone} -|0|--|0|- Slide Titles: {titles} -|0|--|0|- Reference Document: {summary}"
-    user_message = HumanMessage(user_message.replace("-|0|-", "\n"))
+    system_prompt = SystemMessage(SLIDE_SYSTEM_PROMPTS[slide_type])
+    user_message = get_user_message(titles, prompt, tone, summary, index)
 
-    model = (
-        ChatGoogleGenerativeAI(model="gemini-2.0-flash")
-        if os.getenv("LLM") == "google" 
-        else ChatGoogleGenerativeAI(model="gemini-2.0-flash-exp")
+    chain = llm_clients.get_chain(content_model)
+    content = await get_validated_response(
+        chain, [system_prompt, user_message], content_model
     )
+    return LLMSlideModel(type=slide_type, content=content)
+
+
+async def generate_presentation_slides(
+    titles: List[str],
+    prompt: str,
+    tone: str,
+    summary: str,
+    concurrency: int = 4,
+    retries: int = 2,
+) -> AsyncIterator[Tuple[int, LLMSlideModel]]:
+    """
+    Generate every slide with its own LLM call and yield ``(index, slide)`` as
+    slides are done, not in index order.
+
+    Slide types are planned in one lightweight call first. A failed slide does
+    not fail the others, only failed slides are generated again.
+    """
+    try:
+        plan = await generate_presentation_plan(titles, prompt, tone, summary)
+    except Exception as e:
+        print(f"Error planning presentation, using default slide types: {e}")
+        plan = None
+    slide_types = get_planned_slide_types(plan, len(titles))
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def generate_slide(index: int) -> Tuple[int, Optional[LLMSlideModel]]:
+        async with semaphore:
+            try:
+                slide = await generate_slide_content(
+                    index, slide_types[index], titles, prompt, tone, summary
+                )
+                return index, slide
+            except Exception as e:
+                print(f"Error generating slide {index}: {e}")
+                return index, None
+
+    pending = list(range(len(titles)))
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            print(f"Slide generation retry attempt - {attempt}, slides {pending}")
+
+        tasks = [asyncio.create_task(generate_slide(index)) for index in pending]
+        pending = []
+        try:
+            for each in asyncio.as_completed(tasks):
+                index, slide = await each
+                if slide:
+                    yield index, slide
+                else:
+                    pending.append(index)
+        finally:
+            # Slides still generating are not needed if the caller went away
+            for task in tasks:
+                task.cancel()
 
-    return model.astream([system_prompt, user_message])
+    if pending:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Error while generating slides {sorted(pending)}",
+        )
@@ -213,3 +213,12 @@ class LLMPresentationModel(BaseModel):
     n_slides: int
     titles: list[str]
     slides: list[LLMSlideModel]
+
+
+class LLMSlidePlanModel(BaseModel):
+    title: str = Field(description="Title of the slide")
+    type: SlideType = Field(description="Slide type selected for the slide")
+
+
+class LLMPresentationPlanModel(BaseModel):
+    slides: list[LLMSlidePlanModel]
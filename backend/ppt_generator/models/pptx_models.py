@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional
 from annotated_types import Len
 from pydantic import BaseModel
 from pptx.util import Pt
@@ -167,5 +167,7 @@ class PptxPresentationModel(BaseModel):
     # theme: PresentationTheme
     # watermark: bool
     background_color: str
+    # Theme clrScheme color name, e.g. accent1, -> hex color
+    theme_colors: Optional[Dict[str, str]] = None
     shapes: Optional[List[PptxShapeModel]] = None
     slides: List[PptxSlideModel]
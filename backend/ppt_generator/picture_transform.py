@@ -0,0 +1,418 @@
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from PIL import Image, ImageChops, ImageDraw
+from pydantic import BaseModel
+
+from ppt_generator.models.pptx_models import (
+    PptxBoxShapeEnum,
+    PptxObjectFitEnum,
+    PptxPictureBoxModel,
+)
+
+
+def _clamp_focus(value: Optional[float]) -> float:
+    if value is None:
+        return 50.0
+    return max(0.0, min(100.0, value))
+
+
+def _parse_overlay(color: str) -> Tuple[int, int, int]:
+    if color.startswith("#"):
+        color = color[1:]
+    return int(color[:2], 16), int(color[2:4], 16), int(color[4:], 16)
+
+
+def _quarter_ellipse(rx: int, ry: int, corner: int) -> Image.Image:
+    """Quarter of an ellipse inscribed in (2rx, 2ry), matching round_image_corners."""
+    ellipse = Image.new("L", (rx * 2, ry * 2), 0)
+    ImageDraw.Draw(ellipse).ellipse((0, 0, rx * 2 - 1, ry * 2 - 1), fill=255)
+    crop_boxes = [
+        (0, 0, rx, ry),
+        (rx, 0, rx * 2, ry),
+        (rx, ry, rx * 2, ry * 2),
+        (0, ry, rx, ry * 2),
+    ]
+    return ellipse.crop(crop_boxes[corner])
+
+
+def _round_mask_corners(
+    mask: Image.Image,
+    rect: Tuple[int, int, int, int],
+    radii: List[Tuple[int, int]],
+):
+    """Cut rounded corners of ``rect`` out of ``mask`` in place.
+
+    ``radii`` holds (rx, ry) for top-left, top-right, bottom-right and
+    bottom-left. ``rect`` may extend beyond the mask, in which case only
+    the visible part of each corner is touched.
+    """
+    left, top, right, bottom = rect
+    mask_width, mask_height = mask.size
+
+    for corner, (rx, ry) in enumerate(radii):
+        if rx <= 0 or ry <= 0:
+            continue
+
+        x = left if corner in (0, 3) else right - rx
+        y = top if corner in (0, 1) else bottom - ry
+
+        # Intersect the corner square with the mask bounds
+        visible = (max(x, 0), max(y, 0), min(x + rx, mask_width), min(y + ry, mask_height))
+        if visible[0] >= visible[2] or visible[1] >= visible[3]:
+            continue
+
+        quarter = _quarter_ellipse(rx, ry, corner).crop(
+            (visible[0] - x, visible[1] - y, visible[2] - x, visible[3] - y)
+        )
+        region = mask.crop(visible)
+        mask.paste(ImageChops.darker(region, quarter), visible[:2])
+
+
+class PictureGeometry(NamedTuple):
+    # Size of the processed picture
+    size: Tuple[int, int]
+    # Region of the source that is resampled
+    source_box: Tuple[float, float, float, float]
+    # Size the source region is resampled to
+    resampled_size: Tuple[int, int]
+    # Where the resampled image is pasted on the output
+    paste_at: Tuple[int, int]
+    # Rectangle the whole, uncropped source covers in output coordinates
+    placed: Tuple[int, int, int, int]
+    # Output pixels per point of the picture box
+    density: float
+
+
+class PictureTransformPlan(BaseModel):
+    """
+    Normalized description of every transform applied to a picture box.
+
+    The plan resizes the source straight to the target box (cropping during
+    the resample for cover/clip) and then folds border radius, circle shape
+    and overlay into a single alpha mask, so a picture costs one full-size
+    color buffer plus one 8-bit mask instead of one image per step.
+    """
+
+    width: int
+    height: int
+    fit: Optional[PptxObjectFitEnum] = None
+    focus: Tuple[float, float] = (50.0, 50.0)
+    border_radius: Optional[List[int]] = None
+    circle: bool = False
+    overlay: Optional[str] = None
+    # Upper bound of output pixels per point; sources with less detail are
+    # never upscaled beyond the box size
+    max_density: float = 1.0
+
+    @classmethod
+    def from_picture_box(
+        cls, picture_model: PptxPictureBoxModel, max_density: float = 1.0
+    ) -> Optional["PictureTransformPlan"]:
+        """Build a plan for ``picture_model`` or None if the picture is used as is."""
+        if not (
+            picture_model.clip
+            or picture_model.border_radius
+            or picture_model.overlay
+            or picture_model.object_fit
+            or picture_model.shape
+        ):
+            return None
+
+        fit = None
+        focus = (50.0, 50.0)
+        if picture_model.object_fit:
+            fit = picture_model.object_fit.fit
+            if picture_model.object_fit.focus and len(picture_model.object_fit.focus) == 2:
+                focus = (
+                    _clamp_focus(picture_model.object_fit.focus[0]),
+                    _clamp_focus(picture_model.object_fit.focus[1]),
+                )
+        elif picture_model.clip:
+            # Clipping is a centered cover
+            fit = PptxObjectFitEnum.COVER
+
+        if picture_model.border_radius and len(picture_model.border_radius) != 4:
+            raise ValueError(
+                "Image Border Radius - radii must contain exactly 4 values for each corner"
+            )
+
+        return cls(
+            width=picture_model.position.width,
+            height=picture_model.position.height,
+            fit=fit,
+            focus=focus,
+            border_radius=(
+                picture_model.border_radius if any(picture_model.border_radius or []) else None
+            ),
+            circle=picture_model.shape == PptxBoxShapeEnum.CIRCLE,
+            overlay=picture_model.overlay,
+            max_density=max_density,
+        )
+
+    def get_geometry(self, source_size: Tuple[int, int]) -> PictureGeometry:
+        """Resolve the plan against a source size."""
+        if not self.fit:
+            full = (0, 0, *source_size)
+            return PictureGeometry(source_size, full, source_size, (0, 0), full, 1.0)
+
+        geometry = self._get_box_geometry(source_size, self.width, self.height, 1.0)
+
+        # Render above one pixel per point only as far as the source has detail
+        placed = geometry.placed
+        source_density = min(
+            source_size[0] / max(placed[2] - placed[0], 1),
+            source_size[1] / max(placed[3] - placed[1], 1),
+        )
+        density = max(1.0, min(self.max_density, source_density))
+        if density == 1.0:
+            return geometry
+
+        return self._get_box_geometry(
+            source_size,
+            round(self.width * density),
+            round(self.height * density),
+            density,
+        )
+
+    def _get_box_geometry(
+        self,
+        source_size: Tuple[int, int],
+        width: int,
+        height: int,
+        density: float,
+    ) -> PictureGeometry:
+        img_width, img_height = source_size
+        focus_x, focus_y = self.focus
+
+        if self.fit == PptxObjectFitEnum.FILL:
+            full = (0, 0, width, height)
+            return PictureGeometry(
+                (width, height), (0, 0, *source_size), (width, height), (0, 0), full, density
+            )
+
+        img_aspect = img_width / img_height
+        box_aspect = width / height
+
+        if self.fit == PptxObjectFitEnum.CONTAIN:
+            if img_aspect > box_aspect:
+                new_width = width
+                new_height = int(width / img_aspect)
+            else:
+                new_height = height
+                new_width = int(height * img_aspect)
+            paste_x = int((width - new_width) * (focus_x / 100.0))
+            paste_y = int((height - new_height) * (focus_y / 100.0))
+            return PictureGeometry(
+                (width, height),
+                (0, 0, *source_size),
+                (new_width, new_height),
+                (paste_x, paste_y),
+                (paste_x, paste_y, paste_x + new_width, paste_y + new_height),
+                density,
+            )
+
+        # Cover: only resample the part of the source that survives the crop
+        if img_aspect > box_aspect:
+            new_height = height
+            new_width = int(height * img_aspect)
+        else:
+            new_width = width
+            new_height = int(width / img_aspect)
+        crop_x = int((new_width - width) * (focus_x / 100.0))
+        crop_y = int((new_height - height) * (focus_y / 100.0))
+
+        scale_x = img_width / new_width
+        scale_y = img_height / new_height
+        source_box = (
+            crop_x * scale_x,
+            crop_y * scale_y,
+            (crop_x + width) * scale_x,
+            (crop_y + height) * scale_y,
+        )
+        return PictureGeometry(
+            (width, height),
+            source_box,
+            (width, height),
+            (0, 0),
+            (-crop_x, -crop_y, new_width - crop_x, new_height - crop_y),
+            density,
+        )
+
+    def build_mask(
+        self, geometry: PictureGeometry, source_size: Tuple[int, int]
+    ) -> Image.Image:
+        """Single 8-bit mask combining placement, border radius and shape."""
+        size = geometry.size
+        placed = geometry.placed
+
+        mask = Image.new("L", size, 0)
+        mask.paste(255, placed)
+
+        if self.border_radius:
+            # Source corners are rounded at the source scale and then scaled
+            # with the picture, box corners are rounded at the box scale
+            scale_x = (placed[2] - placed[0]) / source_size[0]
+            scale_y = (placed[3] - placed[1]) / source_size[1]
+            _round_mask_corners(
+                mask,
+                placed,
+                [(round(r * scale_x), round(r * scale_y)) for r in self.border_radius],
+            )
+            box_radii = [round(r * geometry.density) for r in self.border_radius]
+            _round_mask_corners(mask, (0, 0, *size), [(r, r) for r in box_radii])
+
+        if self.circle:
+            radius = min(size) // 2
+            center_x = size[0] // 2
+            center_y = size[1] // 2
+            circle = Image.new("L", size, 0)
+            ImageDraw.Draw(circle).ellipse(
+                (
+                    center_x - radius,
+                    center_y - radius,
+                    center_x + radius,
+                    center_y + radius,
+                ),
+                fill=255,
+            )
+            mask = ImageChops.darker(mask, circle)
+
+        return mask
+
+    def apply(self, image: Image.Image) -> Image.Image:
+        """Run the whole plan on ``image`` and return an RGBA image."""
+        # Border radii are in the pixels of the source as stored, not as decoded
+        original_size = image.size
+        if self.fit and image.format == "JPEG":
+            # Let the decoder skip resolution that the resize would discard
+            placed = self.get_geometry(image.size).placed
+            image.draft("RGB", (placed[2] - placed[0], placed[3] - placed[1]))
+
+        source_size = image.size
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        if self.overlay:
+            # Only the alpha channel survives an overlay
+            image = image.convert("RGBA").getchannel("A") if has_alpha else None
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        geometry = self.get_geometry(source_size)
+
+        if image is not None:
+            if (
+                geometry.resampled_size != source_size
+                or geometry.source_box != (0, 0, *source_size)
+            ):
+                image = image.resize(
+                    geometry.resampled_size, Image.LANCZOS, box=geometry.source_box
+                )
+            if geometry.resampled_size != geometry.size:
+                canvas = Image.new(image.mode, geometry.size, 0)
+                canvas.paste(image, geometry.paste_at)
+                image = canvas
+
+        alpha = self.build_mask(geometry, original_size)
+        if image is not None and image.mode != "RGB":
+            source_alpha = image if image.mode == "L" else image.getchannel("A")
+            alpha = ImageChops.darker(source_alpha, alpha)
+
+        if self.overlay:
+            r_new, g_new, b_new = _parse_overlay(self.overlay)
+            channels = [
+                alpha.point([0] + [value] * 255) for value in (r_new, g_new, b_new)
+            ]
+            return Image.merge("RGBA", (*channels, alpha))
+
+        image.putalpha(alpha)
+        return image
+
+
+class PictureOutputPolicy(BaseModel):
+    """
+    Resolution and encoding rules for pictures embedded in an exported deck.
+
+    Pictures are rendered at no more than ``max_density`` pixels per point of
+    their box. Opaque results are stored as JPEG, anything with transparency
+    as PNG.
+    """
+
+    max_density: float = 2.0
+    jpeg_quality: int = 85
+
+    def get_downscale_plan(
+        self, picture_model: PptxPictureBoxModel, source_size: Tuple[int, int]
+    ) -> Optional[PictureTransformPlan]:
+        """Plan for an otherwise untransformed picture that is larger than needed."""
+        width = picture_model.position.width
+        height = picture_model.position.height
+        if width <= 0 or height <= 0:
+            return None
+        if (
+            source_size[0] <= width * self.max_density
+            and source_size[1] <= height * self.max_density
+        ):
+            return None
+
+        # The picture is stretched to its box, so filling the box is lossless
+        return PictureTransformPlan(
+            width=width,
+            height=height,
+            fit=PptxObjectFitEnum.FILL,
+            max_density=self.max_density,
+        )
+
+    def prepare(self, image: Image.Image) -> Tuple[Image.Image, str, dict]:
+        """Return the image to save together with its format and save options."""
+        if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] == 255:
+            image = image.convert("RGB")
+
+        if image.mode == "RGB":
+            return image, "JPEG", {"quality": self.jpeg_quality, "optimize": True}
+        return image, "PNG", {}
+
+
+IMAGE_FORMAT_EXTENSIONS = {"JPEG": "jpg", "PNG": "png"}
+
+
+class PictureRenderStats(BaseModel):
+    pictures: int = 0
+    rendered: int = 0
+    cached: int = 0
+    # Processed in the export's own process after the worker pool broke
+    rendered_in_process: int = 0
+    failed: int = 0
+    workers: int = 1
+    wall_time: float = 0.0
+    busy_time: float = 0.0
+    speedup: float = 0.0
+    speedup_per_core: float = 0.0
+
+
+def render_picture(
+    image_path: str,
+    transform_plan: PictureTransformPlan,
+    output_policy: PictureOutputPolicy,
+    output_base_path: str,
+) -> Tuple[Optional[str], float]:
+    """
+    Process one picture and save it next to ``output_base_path``.
+
+    Returns the saved path (None if the source could not be opened) and the
+    time spent. Kept at module level so it can run in a process pool.
+    """
+    start = time.perf_counter()
+    try:
+        image = Image.open(image_path)
+    except:
+        print(f"Could not open image: {image_path}")
+        return None, time.perf_counter() - start
+
+    image = transform_plan.apply(image)
+    image, image_format, save_params = output_policy.prepare(image)
+
+    output_path = f"{output_base_path}.{IMAGE_FORMAT_EXTENSIONS[image_format]}"
+    image.save(output_path, format=image_format, **save_params)
+    return output_path, time.perf_counter() - start
@@ -1,5 +1,10 @@
+import copy
+import hashlib
 import os
-from typing import List, Optional
+import time
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from typing import IO, Dict, List, Optional, Union
 import uuid
 import re
 from lxml import etree
@@ -15,7 +20,12 @@ from pptx.enum.chart import (
     XL_LEGEND_POSITION,
     XL_LABEL_POSITION,
 )
+from pptx.enum.text import PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import oxml_parser
+from pptx.oxml.ns import qn
+from pptx.oxml.simpletypes import ST_TextFontSize, ST_TextSpacingPoint, XsdBoolean
+from pptx.oxml.text import CT_RegularTextRun
 from lxml.etree import fromstring, tostring
 from PIL import Image
 
@@ -30,7 +40,6 @@ from graph_processor.models import (
 from pptx.dml.color import RGBColor
 from ppt_generator.models.pptx_models import (
     PptxAutoShapeBoxModel,
-    PptxBoxShapeEnum,
     PptxConnectorModel,
     PptxFillModel,
     PptxFontModel,
@@ -46,13 +55,14 @@ from ppt_generator.models.pptx_models import (
     PptxTextBoxModel,
     PptxTextRunModel,
 )
-from ppt_generator.utils import (
-    clip_image,
-    fit_image,
-    round_image_corners,
-    create_circle_image,
-    change_image_color,
+from ppt_generator.picture_transform import (
+    PictureOutputPolicy,
+    PictureRenderStats,
+    PictureTransformPlan,
+    render_picture,
 )
+from ppt_generator.pptx_writer import write_presentation
+from ppt_generator.slide_parts import RenderedPart, add_rendered_slide, get_rendered_part
 
 BLANK_SLIDE_LAYOUT = 6
 
@@ -97,54 +107,198 @@ def sanitize_hex_color(color: str) -> str:
         return color[:6]
 
 
+# Formatted spans in the order they are tried at every position, markers
+# without a closing marker are kept as text
+MARKDOWN_RUN_PATTERN = re.compile(r"\*\*\*(.*?)\*\*\*|\*\*(.*?)\*\*|__(.*?)__")
+
+# DrawingML tags of the paragraphs emitted directly as XML
+A_P = qn("a:p")
+A_PPR = qn("a:pPr")
+A_SPC_BEF = qn("a:spcBef")
+A_SPC_AFT = qn("a:spcAft")
+A_SPC_PTS = qn("a:spcPts")
+A_DEF_RPR = qn("a:defRPr")
+A_R = qn("a:r")
+A_RPR = qn("a:rPr")
+A_T = qn("a:t")
+A_SOLID_FILL = qn("a:solidFill")
+A_SRGB_CLR = qn("a:srgbClr")
+A_LATIN = qn("a:latin")
+
+# Colors of a theme's clrScheme that can be replaced
+THEME_COLOR_NAMES = (
+    "dk1",
+    "lt1",
+    "dk2",
+    "lt2",
+    "accent1",
+    "accent2",
+    "accent3",
+    "accent4",
+    "accent5",
+    "accent6",
+    "hlink",
+    "folHlink",
+)
+
+
 class PptxPresentationCreator:
 
-    def __init__(self, ppt_model: PptxPresentationModel, temp_dir: str):
+    def __init__(
+        self,
+        ppt_model: PptxPresentationModel,
+        temp_dir: str,
+        image_cache=None,
+        output_policy: Optional[PictureOutputPolicy] = None,
+        direct_text_xml: bool = True,
+        template_cache=None,
+        previous_slides: Optional[Dict[str, RenderedPart]] = None,
+    ):
         self._temp_dir = temp_dir
+        # Optional ProcessedImageCache used to skip reprocessing unchanged pictures
+        self._image_cache = image_cache
+        self._output_policy = output_policy or PictureOutputPolicy()
+        # Pictures processed ahead of slide assembly, keyed by id() of their model
+        self._rendered_pictures = {}
+        self.render_stats: Optional[PictureRenderStats] = None
+        # (id of base font, bold, italic) -> (base font, derived font)
+        self._font_variants = {}
+        # Build paragraphs as XML instead of through python-pptx text objects
+        self._direct_text_xml = direct_text_xml
+        # (id of font, tag) -> (font, rPr or defRPr element copied into every run)
+        self._font_elements = {}
+        # Rendered slides of the previous export by fingerprint. When given,
+        # unchanged slides are copied from it and rendered_slides holds the
+        # slides of this export for the next one
+        self._previous_slides = previous_slides
+        self.rendered_slides: Optional[Dict[str, RenderedPart]] = (
+            None if previous_slides is None else {}
+        )
+        # Index -> fingerprint of the slides copied from previous_slides
+        self._reused_slides: Dict[int, str] = {}
+        # Image path -> hash of its bytes, for slide fingerprints
+        self._source_hashes = {}
 
         self._ppt_model = ppt_model
         self._slide_models = ppt_model.slides
-        # self._theme = ppt_model.theme
         # self._watermark = ppt_model.watermark
 
-        self._ppt = Presentation()
-        self._ppt.slide_width = Pt(1280)
-        self._ppt.slide_height = Pt(720)
+        # Optional PresentationTemplateCache that clones a prepared base package
+        if template_cache:
+            self._ppt = template_cache.get_presentation(ppt_model.theme_colors)
+        else:
+            self._ppt = self.get_base_presentation(ppt_model.theme_colors)
+        self._blank_layout = self._ppt.slide_layouts[BLANK_SLIDE_LAYOUT]
 
         self._slide_fill = PptxFillModel(color=ppt_model.background_color)
 
-    def create_ppt(self):
-        # self.set_presentation_theme()
-
+    @classmethod
+    def get_base_presentation(cls, theme_colors: Optional[Dict[str, str]] = None):
+        """Return python-pptx's default template sized to 1280x720 with ``theme_colors``."""
+        presentation = Presentation()
+        presentation.slide_width = Pt(1280)
+        presentation.slide_height = Pt(720)
+        if theme_colors:
+            cls.set_presentation_theme(presentation, theme_colors)
+        return presentation
+
+    def create_ppt(
+        self, picture_executor: Optional[Executor] = None, picture_workers: int = 1
+    ):
         for slide_model in self._slide_models:
             # Adding global shapes to slide
             if self._ppt_model.shapes:
                 slide_model.shapes.append(self._ppt_model.shapes)
 
-            self.add_and_populate_slide(slide_model)
-
-    def set_presentation_theme(self):
-        slide_master = self._ppt.slide_master
+        fingerprints = []
+        if self.rendered_slides is not None:
+            fingerprints = [self.get_slide_fingerprint(each) for each in self._slide_models]
+            self._reused_slides = {
+                index: fingerprint
+                for index, fingerprint in enumerate(fingerprints)
+                if fingerprint in self._previous_slides
+            }
+
+        if picture_executor:
+            self.render_pictures(picture_executor, picture_workers)
+
+        for index, slide_model in enumerate(self._slide_models):
+            if index in self._reused_slides:
+                rendered = self._previous_slides[fingerprints[index]]
+                add_rendered_slide(self._ppt, self._blank_layout, rendered)
+                self.rendered_slides[fingerprints[index]] = rendered
+                continue
+
+            slide = self.add_and_populate_slide(slide_model)
+            if fingerprints:
+                rendered = get_rendered_part(slide.part)
+                if rendered:
+                    self.rendered_slides[fingerprints[index]] = rendered
+
+    @property
+    def slides_reused(self) -> int:
+        return len(self._reused_slides)
+
+    def get_slide_fingerprint(self, slide_model: PptxSlideModel) -> str:
+        """Hash of everything the XML and media of ``slide_model`` depend on."""
+        fingerprint = hashlib.sha256()
+        fingerprint.update(self._ppt_model.background_color.encode("utf-8"))
+        fingerprint.update(self._output_policy.model_dump_json().encode("utf-8"))
+        # Downloaded pictures get a new path on every export, so pictures
+        # count by their bytes instead
+        fingerprint.update(
+            slide_model.model_dump_json(
+                exclude={"shapes": {"__all__": {"picture": {"path"}}}}
+            ).encode("utf-8")
+        )
+        for shape_model in slide_model.shapes:
+            if type(shape_model) is PptxPictureBoxModel:
+                fingerprint.update(self.get_source_hash(shape_model.picture.path))
+        return fingerprint.hexdigest()
+
+    def get_source_hash(self, image_path: str) -> bytes:
+        source_hash = self._source_hashes.get(image_path)
+        if source_hash is None:
+            digest = hashlib.sha256()
+            try:
+                with open(image_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            except OSError:
+                digest.update(image_path.encode("utf-8"))
+            source_hash = digest.digest()
+            self._source_hashes[image_path] = source_hash
+        return source_hash
+
+    @staticmethod
+    def set_presentation_theme(presentation, theme_colors: Dict[str, str]):
+        slide_master = presentation.slide_master
         slide_master_part = slide_master.part
 
         theme_part = slide_master_part.part_related_by(RT.THEME)
         theme = fromstring(theme_part.blob)
 
-        theme_colors = self._theme.colors.theme_color_mapping
         nsmap = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
 
         for color_name, hex_value in theme_colors.items():
-            if color_name:
-                color_element = theme.xpath(
-                    f"a:themeElements/a:clrScheme/a:{color_name}/a:srgbClr",
-                    namespaces=nsmap,
-                )[0]
-                color_element.set("val", hex_value.encode("utf-8"))
+            if color_name not in THEME_COLOR_NAMES:
+                continue
+            scheme_color = theme.xpath(
+                f"a:themeElements/a:clrScheme/a:{color_name}", namespaces=nsmap
+            )[0]
+            # dk1 and lt1 of the default theme are system colors, not srgbClr
+            for each in list(scheme_color):
+                scheme_color.remove(each)
+            etree.SubElement(
+                scheme_color,
+                A_SRGB_CLR,
+                val=str(RGBColor.from_string(sanitize_hex_color(hex_value))),
+            )
 
         theme_part._blob = tostring(theme)
 
-    def add_and_populate_slide(self, slide_model: PptxSlideModel):
-        slide = self._ppt.slides.add_slide(self._ppt.slide_layouts[BLANK_SLIDE_LAYOUT])
+    def add_and_populate_slide(self, slide_model: PptxSlideModel) -> Slide:
+        slide = self._ppt.slides.add_slide(self._blank_layout)
 
         if self._slide_fill:
             self.apply_fill_to_shape(slide.background, self._slide_fill)
@@ -171,6 +325,8 @@ class PptxPresentationCreator:
         # Adding watermark
         # self.add_picture(slide, self.get_watermark_box_model())
 
+        return slide
+
     def add_connector(self, slide: Slide, connector_model: PptxConnectorModel):
         if connector_model.thickness == 0:
             return
@@ -300,52 +456,177 @@ class PptxPresentationCreator:
         chart_data.add_series("", graph.series[0].data)
         return chart_data
 
+    def render_pictures(self, executor: Executor, workers: int = 1):
+        """
+        Process the pictures of every slide on ``executor`` before assembly.
+
+        Slides are still assembled sequentially afterwards, so the document is
+        identical to a sequential export.
+        """
+        start = time.perf_counter()
+        stats = PictureRenderStats(workers=workers)
+        jobs = {}
+        pending = []
+
+        for index, slide_model in enumerate(self._slide_models):
+            # Reused slides already carry their processed pictures
+            if index in self._reused_slides:
+                continue
+            for shape_model in slide_model.shapes:
+                if type(shape_model) is not PptxPictureBoxModel:
+                    continue
+
+                image_path = shape_model.picture.path
+                transform_plan = self.get_picture_transform_plan(shape_model, image_path)
+                if not transform_plan:
+                    continue
+                stats.pictures += 1
+
+                cache_key = self.get_picture_cache_key(image_path, transform_plan)
+                cached_path = (
+                    self._image_cache.get(cache_key, self._temp_dir) if cache_key else None
+                )
+                if cached_path:
+                    stats.cached += 1
+                    self._rendered_pictures[id(shape_model)] = cached_path
+                    continue
+
+                # Identical pictures within the deck are processed once
+                job_key = cache_key or (image_path, transform_plan.model_dump_json())
+                if job_key not in jobs:
+                    future = None
+                    if executor:
+                        try:
+                            future = executor.submit(
+                                render_picture,
+                                image_path,
+                                transform_plan,
+                                self._output_policy,
+                                os.path.join(self._temp_dir, str(uuid.uuid4())),
+                            )
+                        except BrokenProcessPool as e:
+                            print(f"Picture workers stopped, processing in this process: {e}")
+                            executor = None
+                    jobs[job_key] = (cache_key, image_path, transform_plan, future)
+                pending.append((shape_model, job_key))
+
+        results = {}
+        for job_key, (cache_key, image_path, transform_plan, future) in jobs.items():
+            if future:
+                try:
+                    output_path, busy_time = future.result()
+                except BrokenProcessPool as e:
+                    print(f"Picture workers stopped, processing in this process: {e}")
+                    future = None
+                except Exception as e:
+                    print(f"Could not process image: {e}")
+                    results[job_key] = None
+                    stats.failed += 1
+                    continue
+
+            if not future:
+                # A crashed worker breaks the whole pool, its pictures are
+                # processed here instead of being left out of the deck
+                results[job_key] = self.get_processed_picture(image_path, transform_plan)
+                stats.rendered_in_process += 1
+                continue
+
+            if output_path and cache_key:
+                output_path = self._image_cache.put(cache_key, output_path)
+            results[job_key] = output_path
+            stats.rendered += 1
+            stats.busy_time += busy_time
+
+        for shape_model, job_key in pending:
+            self._rendered_pictures[id(shape_model)] = results[job_key]
+
+        stats.wall_time = time.perf_counter() - start
+        if stats.wall_time > 0:
+            stats.speedup = stats.busy_time / stats.wall_time
+            stats.speedup_per_core = stats.speedup / max(workers, 1)
+        self.render_stats = stats
+
     def add_picture(self, slide: Slide, picture_model: PptxPictureBoxModel):
         image_path = picture_model.picture.path
-        if (
-            picture_model.clip
-            or picture_model.border_radius
-            or picture_model.overlay
-            or picture_model.object_fit
-            or picture_model.shape
-        ):
-            try:
-                image = Image.open(image_path)
-            except:
-                print(f"Could not open image: {image_path}")
+        rendered_path = None
+        if id(picture_model) in self._rendered_pictures:
+            rendered_path = self._rendered_pictures[id(picture_model)]
+            if not rendered_path:
                 return
 
-            image = image.convert("RGBA")
-            # ? Applying border radius twice to support both clip and object fit
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.object_fit:
-                image = fit_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                    picture_model.object_fit,
-                )
-            elif picture_model.clip:
-                image = clip_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                )
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
-                image = create_circle_image(image)
-            if picture_model.overlay:
-                image = change_image_color(image, picture_model.overlay)
-            image_path = os.path.join(self._temp_dir, f"{str(uuid.uuid4())}.png")
-            image.save(image_path)
+        if rendered_path and os.path.exists(rendered_path):
+            image_path = rendered_path
+        else:
+            # Not rendered ahead, or the rendered file is gone, so the picture
+            # is processed from its source
+            transform_plan = self.get_picture_transform_plan(picture_model, image_path)
+            if transform_plan:
+                image_path = self.get_processed_picture(image_path, transform_plan)
+                if not image_path:
+                    return
 
         margined_position = self.get_margined_position(
             picture_model.position, picture_model.margin
         )
 
-        slide.shapes.add_picture(image_path, *margined_position.to_pt_list())
+        picture = slide.shapes.add_picture(
+            image_path, *margined_position.to_pt_list()
+        )
+        # Describe the picture by its source rather than the processed file name,
+        # which is random or a cache key, so the output does not depend on it
+        picture._element._nvXxPr.cNvPr.set(
+            "descr", os.path.basename(picture_model.picture.path)
+        )
+
+    def get_picture_transform_plan(
+        self, picture_model: PptxPictureBoxModel, image_path: str
+    ) -> Optional[PictureTransformPlan]:
+        transform_plan = PictureTransformPlan.from_picture_box(
+            picture_model, self._output_policy.max_density
+        )
+        if transform_plan:
+            return transform_plan
+
+        # Untransformed pictures are only reprocessed when they carry far more
+        # pixels than their box can show
+        try:
+            with Image.open(image_path) as image:
+                source_size = image.size
+        except:
+            return None
+        return self._output_policy.get_downscale_plan(picture_model, source_size)
+
+    def get_picture_cache_key(
+        self, image_path: str, transform_plan: PictureTransformPlan
+    ) -> Optional[str]:
+        if not self._image_cache:
+            return None
+        try:
+            return self._image_cache.get_key(
+                image_path, transform_plan, self._output_policy
+            )
+        except Exception as e:
+            print(f"Could not look up processed image cache: {e}")
+            return None
+
+    def get_processed_picture(
+        self, image_path: str, transform_plan: PictureTransformPlan
+    ) -> Optional[str]:
+        cache_key = self.get_picture_cache_key(image_path, transform_plan)
+        if cache_key:
+            cached_path = self._image_cache.get(cache_key, self._temp_dir)
+            if cached_path:
+                return cached_path
+
+        output_path, _ = render_picture(
+            image_path,
+            transform_plan,
+            self._output_policy,
+            os.path.join(self._temp_dir, str(uuid.uuid4())),
+        )
+        if output_path and cache_key:
+            return self._image_cache.put(cache_key, output_path)
+        return output_path
 
     def add_autoshape(self, slide: Slide, autoshape_box_model: PptxAutoShapeBoxModel):
         position = autoshape_box_model.position
@@ -383,10 +664,99 @@ class PptxPresentationCreator:
     def add_paragraphs(
         self, textbox: TextFrame, paragraph_models: List[PptxParagraphModel]
     ):
+        if self._direct_text_xml:
+            self.add_paragraph_elements(textbox, paragraph_models)
+            return
+
         for index, paragraph_model in enumerate(paragraph_models):
             paragraph = textbox.add_paragraph() if index > 0 else textbox.paragraphs[0]
             self.populate_paragraph(paragraph, paragraph_model)
 
+    def add_paragraph_elements(
+        self, textbox: TextFrame, paragraph_models: List[PptxParagraphModel]
+    ):
+        """
+        Same XML as ``populate_paragraph`` for every paragraph, but built with
+        lxml directly. Every python-pptx font setter looks up and changes the
+        tree on its own, which made text the slowest part of an export.
+        """
+        if not paragraph_models:
+            return
+
+        text_body = textbox._txBody
+        # A new text frame has one empty paragraph that takes the first model
+        self.populate_paragraph_element(text_body.find(A_P), paragraph_models[0])
+
+        paragraphs = []
+        for paragraph_model in paragraph_models[1:]:
+            paragraph = oxml_parser.makeelement(A_P)
+            self.populate_paragraph_element(paragraph, paragraph_model)
+            paragraphs.append(paragraph)
+        text_body.extend(paragraphs)
+
+    def populate_paragraph_element(
+        self, paragraph: etree._Element, paragraph_model: PptxParagraphModel
+    ):
+        spacing = paragraph_model.spacing
+        alignment = paragraph_model.alignment
+        font = paragraph_model.font
+
+        if spacing or alignment or font:
+            # New paragraphs have no properties or, in autoshapes, an empty pPr
+            properties = paragraph.find(A_PPR)
+            if properties is None:
+                properties = oxml_parser.makeelement(A_PPR)
+                paragraph.insert(0, properties)
+
+            if alignment:
+                properties.set("algn", PP_ALIGN.to_xml(alignment))
+            if spacing:
+                for tag, value in ((A_SPC_BEF, spacing.top), (A_SPC_AFT, spacing.bottom)):
+                    spacing_element = etree.SubElement(properties, tag)
+                    etree.SubElement(
+                        spacing_element, A_SPC_PTS, val=ST_TextSpacingPoint.to_xml(Pt(value))
+                    )
+            if font:
+                properties.append(self.get_font_element(A_DEF_RPR, font))
+
+        text_runs = []
+        if paragraph_model.text:
+            text_runs = self.parse_markdown_text_to_text_runs(font, paragraph_model.text)
+        elif paragraph_model.text_runs:
+            text_runs = paragraph_model.text_runs
+
+        escape = CT_RegularTextRun._escape_ctrl_chars
+        for text_run_model in text_runs:
+            text_run = etree.SubElement(paragraph, A_R)
+            if text_run_model.font:
+                text_run.append(self.get_font_element(A_RPR, text_run_model.font))
+            etree.SubElement(text_run, A_T).text = escape(text_run_model.text)
+
+    def get_font_element(self, tag: str, font: PptxFontModel) -> etree._Element:
+        """Return a new ``tag`` element with the XML ``apply_font`` writes for ``font``."""
+        key = (id(font), tag)
+        cached = self._font_elements.get(key)
+        # The font is kept with its element so its id is not reused meanwhile
+        if cached is None or cached[0] is not font:
+            element = oxml_parser.makeelement(
+                tag,
+                {
+                    "b": XsdBoolean.to_xml(font.bold),
+                    "i": XsdBoolean.to_xml(font.italic),
+                    "sz": ST_TextFontSize.to_xml(Pt(font.size).centipoints),
+                },
+            )
+            fill = etree.SubElement(element, A_SOLID_FILL)
+            etree.SubElement(
+                fill,
+                A_SRGB_CLR,
+                val=str(RGBColor.from_string(sanitize_hex_color(font.color))),
+            )
+            etree.SubElement(element, A_LATIN, typeface=font.name)
+            cached = (font, element)
+            self._font_elements[key] = cached
+        return copy.deepcopy(cached[1])
+
     def populate_paragraph(
         self, paragraph: _Paragraph, paragraph_model: PptxParagraphModel
     ):
@@ -413,75 +783,57 @@ class PptxPresentationCreator:
 
     def parse_markdown_text_to_text_runs(self, font: PptxFontModel, text: str):
         text_runs = []
-        for line in text.split("\n"):
+        lines = text.split("\n")
+        last_line = lines[-1]
+        for line in lines:
             current_pos = 0
-            while current_pos < len(line):
-                # Check for bold and italic (***text***)
-                if (
-                    line[current_pos:].startswith("***")
-                    and "***" in line[current_pos + 3 :]
-                ):
-                    end_pos = line.find("***", current_pos + 3)
-                    text_content = line[current_pos + 3 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["bold"] = True
-                    font_json["italic"] = True
+            for match in MARKDOWN_RUN_PATTERN.finditer(line):
+                if match.start() > current_pos:
                     text_runs.append(
-                        PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
-                        )
-                    )
-                    current_pos = end_pos + 3
-                # Check for bold (**text**)
-                elif (
-                    line[current_pos:].startswith("**")
-                    and "**" in line[current_pos + 2 :]
-                ):
-                    end_pos = line.find("**", current_pos + 2)
-                    text_content = line[current_pos + 2 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["bold"] = True
-                    text_runs.append(
-                        PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
-                        )
+                        PptxTextRunModel(text=line[current_pos : match.start()], font=font)
                     )
-                    current_pos = end_pos + 2
-                # Check for italic (*text*)
-                elif (
-                    line[current_pos:].startswith("__")
-                    and "__" in line[current_pos + 2 :]
-                ):
-                    end_pos = line.find("__", current_pos + 2)
-                    text_content = line[current_pos + 2 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["italic"] = True
-                    text_runs.append(
-                        PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
-                        )
+
+                bold_italic_text, bold_text, italic_text = match.groups()
+                if bold_italic_text is not None:
+                    run_text, run_font = bold_italic_text, self.get_font_variant(
+                        font, bold=True, italic=True
                     )
-                    current_pos = end_pos + 2
+                elif bold_text is not None:
+                    run_text, run_font = bold_text, self.get_font_variant(font, bold=True)
                 else:
-                    # Find the next formatting marker or end of line
-                    next_marker = float("inf")
-                    for marker in ["***", "**", "__"]:
-                        pos = line.find(marker, current_pos)
-                        if pos != -1:
-                            next_marker = min(next_marker, pos)
-
-                    end_pos = next_marker if next_marker != float("inf") else len(line)
-                    text_content = line[current_pos:end_pos]
-                    if text_content:  # Only add non-empty text
-                        text_runs.append(PptxTextRunModel(text=text_content, font=font))
-                    current_pos = end_pos
-
-            # Add newline if not the last line
-            if line != text.split("\n")[-1]:
+                    run_text, run_font = italic_text, self.get_font_variant(
+                        font, italic=True
+                    )
+                text_runs.append(PptxTextRunModel(text=run_text, font=run_font))
+                current_pos = match.end()
+
+            if current_pos < len(line):
+                text_runs.append(PptxTextRunModel(text=line[current_pos:], font=font))
+
+            # Add newline if not the last line, lines equal to the last one
+            # never got one
+            if line != last_line:
                 text_runs.append(PptxTextRunModel(text="\n"))
 
         return text_runs
 
+    def get_font_variant(
+        self, font: PptxFontModel, bold: bool = False, italic: bool = False
+    ) -> PptxFontModel:
+        """Return ``font`` made bold and/or italic, derived once per font."""
+        key = (id(font), bold, italic)
+        cached = self._font_variants.get(key)
+        # The font is kept with its variant so its id is not reused meanwhile
+        if cached is None or cached[0] is not font:
+            update = {}
+            if bold:
+                update["bold"] = True
+            if italic:
+                update["italic"] = True
+            cached = (font, font.model_copy(update=update))
+            self._font_variants[key] = cached
+        return cached[1]
+
     def populate_text_run(self, text_run: _Run, text_run_model: PptxTextRunModel):
         text_run.text = text_run_model.text
         if text_run_model.font:
@@ -616,5 +968,5 @@ class PptxPresentationCreator:
     #         ),
     #     )
 
-    def save(self, path: str):
-        self._ppt.save(path)
+    def save(self, destination: Union[str, IO[bytes]]):
+        write_presentation(self._ppt, destination)
@@ -0,0 +1,68 @@
+import time
+import zipfile
+from typing import IO, Union
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+# Media that is compressed already, deflating it again costs CPU and saves
+# next to nothing
+STORED_CONTENT_TYPES = frozenset({CT.JPEG, CT.PNG})
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def write_member(
+    archive: zipfile.ZipFile, membername: str, blob: bytes, compress_type: int
+):
+    member = zipfile.ZipInfo(membername, date_time=time.localtime(time.time())[:6])
+    member.compress_type = compress_type
+    member.external_attr = 0o600 << 16
+    member.file_size = len(blob)
+
+    # Written in chunks so a large part is never held compressed as a whole
+    data = memoryview(blob)
+    with archive.open(member, "w") as f:
+        for start in range(0, len(data), CHUNK_SIZE):
+            f.write(data[start : start + CHUNK_SIZE])
+
+
+def write_presentation(presentation, destination: Union[str, IO[bytes]]):
+    """
+    Write ``presentation`` as a .pptx package to ``destination``.
+
+    Writes the same members as python-pptx's ``save`` in the same order,
+    part by part, straight into ``destination``. That can be a path or any
+    writable binary stream, including streams that cannot seek such as an
+    upload or an HTTP response. JPEG and PNG media are stored instead of
+    deflated.
+    """
+    package = presentation.part.package
+    parts = tuple(package.iter_parts())
+
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        write_member(
+            archive,
+            CONTENT_TYPES_URI.membername,
+            serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+            zipfile.ZIP_DEFLATED,
+        )
+        write_member(
+            archive, PACKAGE_URI.rels_uri.membername, package._rels.xml, zipfile.ZIP_DEFLATED
+        )
+        for part in parts:
+            compress_type = (
+                zipfile.ZIP_STORED
+                if part.content_type in STORED_CONTENT_TYPES
+                else zipfile.ZIP_DEFLATED
+            )
+            write_member(archive, part.partname.membername, part.blob, compress_type)
+            if part._rels:
+                write_member(
+                    archive,
+                    part.partname.rels_uri.membername,
+                    part.rels.xml,
+                    zipfile.ZIP_DEFLATED,
+                )
@@ -1,12 +1,11 @@
 from typing import Optional
-import os
-from langchain_google_genai import ChatGoogleGenerativeAI
+from api.services.llm_clients import get_default_model_name, llm_clients
+from api.services.llm_response_cache import llm_response_cache
 from ppt_generator.fix_validation_errors import get_validated_response
 from ppt_generator.models.content_type_models import (
     CONTENT_TYPE_MAPPING,
 )
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 
 from ppt_generator.models.other_models import SlideType, SlideTypeModel
@@ -90,48 +89,62 @@ async def get_edited_slide_content_model(
     slide: SlideModel,
     theme: Optional[dict] = None,
     tone: Optional[str] = None,
+    use_cache: bool = True,
 ):
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash" if os.getenv("LLM") == "google" else "gemini-2.0-flash-exp"
-    )
-
     content_type_model_type = CONTENT_TYPE_MAPPING[slide_type]
-    chain = prompt_template_from_slide | model.with_structured_output(
-        content_type_model_type.model_json_schema()
-    )
+    chain = llm_clients.get_chain(content_type_model_type, prompt_template_from_slide)
     slide_data = slide.content.model_dump_json()
-    return await get_validated_response(
-        chain,
+    return await llm_response_cache.get_or_create(
+        "edited_slide_content",
+        get_default_model_name(),
         {
-            "prompt": prompt,
+            "prompt": prompt.strip(),
+            "slide_type": slide_type.value,
+            "slide_data": slide.content.model_dump(mode="json"),
             "tone": tone or "Professional",
             "theme": theme,
-            "slide_data": slide_data,
-            "notes": "",
         },
         content_type_model_type,
+        lambda: get_validated_response(
+            chain,
+            {
+                "prompt": prompt,
+                "tone": tone or "Professional",
+                "theme": theme,
+                "slide_data": slide_data,
+                "notes": "",
+            },
+            content_type_model_type,
+        ),
+        use_cache=use_cache,
     )
 
 
 async def get_slide_type_from_prompt(
     prompt: str,
     slide: SlideModel,
+    use_cache: bool = True,
 ) -> SlideTypeModel:
 
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash" if os.getenv("LLM") == "google" else "gemini-2.0-flash-exp"
-    )
-
-    chain = prompt_template_from_slide_type | model.with_structured_output(
-        SlideTypeModel.model_json_schema()
-    )
+    chain = llm_clients.get_chain(SlideTypeModel, prompt_template_from_slide_type)
     slide_data = slide.content.model_dump_json()
-    return await get_validated_response(
-        chain,
+    return await llm_response_cache.get_or_create(
+        "slide_type",
+        get_default_model_name(),
         {
-            "prompt": prompt,
-            "slide_data": slide_data,
-            "slide_type": slide.type,
+            "prompt": prompt.strip(),
+            "slide_type": slide.type.value,
+            "slide_data": slide.content.model_dump(mode="json"),
         },
         SlideTypeModel,
+        lambda: get_validated_response(
+            chain,
+            {
+                "prompt": prompt,
+                "slide_data": slide_data,
+                "slide_type": slide.type,
+            },
+            SlideTypeModel,
+        ),
+        use_cache=use_cache,
     )
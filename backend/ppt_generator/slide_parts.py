@@ -0,0 +1,120 @@
+import io
+import re
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, PartFactory, XmlPart
+from pptx.oxml import parse_xml
+
+# Namespace of relationship ids referenced from part XML, e.g. r:embed
+R_NAMESPACE = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# Relationships a rendered slide can carry over into another package, anything
+# else (e.g. notes slides, which point back to the slide) is rebuilt instead.
+# The slide layout is not copied, a reused slide takes the new package's layout
+REUSABLE_RELATIONSHIP_TYPES = (RT.IMAGE, RT.CHART, RT.PACKAGE, RT.HYPERLINK)
+
+
+class RenderedRelationship(NamedTuple):
+    rId: str
+    reltype: str
+    # URL of external relationships, empty for the slide layout and the
+    # related part otherwise
+    target: Union[str, "RenderedPart"]
+    is_external: bool = False
+
+
+class RenderedPart(NamedTuple):
+    partname: str
+    content_type: str
+    blob: bytes
+    relationships: Tuple[RenderedRelationship, ...] = ()
+
+
+def get_rendered_part(part: Part) -> Optional[RenderedPart]:
+    """
+    Snapshot ``part`` and the parts it relates to as bytes. Returns None if
+    the part relates to anything other than the reusable relationship types.
+    """
+    relationships = []
+    for rId, relationship in part.rels.items():
+        if relationship.reltype == RT.SLIDE_LAYOUT:
+            relationships.append(RenderedRelationship(rId, RT.SLIDE_LAYOUT, ""))
+            continue
+        if relationship.reltype not in REUSABLE_RELATIONSHIP_TYPES:
+            return None
+
+        if relationship.is_external:
+            target = relationship.target_ref
+        else:
+            target = get_rendered_part(relationship.target_part)
+            if target is None:
+                return None
+        relationships.append(
+            RenderedRelationship(rId, relationship.reltype, target, relationship.is_external)
+        )
+
+    return RenderedPart(
+        str(part.partname), part.content_type, part.blob, tuple(relationships)
+    )
+
+
+def get_partname_template(partname: str) -> str:
+    """'/ppt/charts/chart3.xml' -> '/ppt/charts/chart%d.xml'"""
+    return re.sub(r"\d*(\.\w+)$", r"%d\1", partname)
+
+
+def relate_rendered_part(source_part: Part, relationship: RenderedRelationship) -> str:
+    """Add the target of ``relationship`` to the package of ``source_part``, return its rId."""
+    if relationship.is_external:
+        return source_part.relate_to(relationship.target, relationship.reltype, is_external=True)
+
+    rendered = relationship.target
+    if relationship.reltype == RT.IMAGE and hasattr(source_part, "get_or_add_image_part"):
+        # Images go through the package so identical ones are still stored once
+        _, rId = source_part.get_or_add_image_part(io.BytesIO(rendered.blob))
+        return rId
+
+    package = source_part.package
+    part = PartFactory(
+        package.next_partname(get_partname_template(rendered.partname)),
+        rendered.content_type,
+        package,
+        rendered.blob,
+    )
+    rId_mapping = {
+        each.rId: relate_rendered_part(part, each) for each in rendered.relationships
+    }
+    if isinstance(part, XmlPart):
+        update_relationship_ids(part._element, rId_mapping)
+    return source_part.relate_to(part, relationship.reltype)
+
+
+def update_relationship_ids(element, rId_mapping: Dict[str, str]):
+    for each in element.iter():
+        for name, value in each.attrib.items():
+            if name.startswith(R_NAMESPACE) and value in rId_mapping:
+                each.set(name, rId_mapping[value])
+
+
+def add_rendered_slide(presentation, slide_layout, rendered: RenderedPart):
+    """Add a slide to ``presentation`` with the XML and parts of a rendered slide."""
+    slide = presentation.slides.add_slide(slide_layout)
+    slide_part = slide.part
+
+    rId_mapping = {}
+    for relationship in rendered.relationships:
+        if relationship.reltype == RT.SLIDE_LAYOUT:
+            rId_mapping[relationship.rId] = slide_part.relate_to(
+                slide_layout.part, RT.SLIDE_LAYOUT
+            )
+        else:
+            rId_mapping[relationship.rId] = relate_rendered_part(slide_part, relationship)
+
+    # The new slide element is kept, python-pptx objects of the slide refer to it
+    rendered_element = parse_xml(rendered.blob)
+    update_relationship_ids(rendered_element, rId_mapping)
+    slide_element = slide_part._element
+    slide_element.attrib.update(rendered_element.attrib)
+    slide_element[:] = list(rendered_element)
+    return slide
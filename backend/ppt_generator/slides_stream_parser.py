@@ -0,0 +1,102 @@
+import json
+from typing import List, Optional, Tuple
+
+
+class SlidesStreamParser:
+    """
+    Incremental scanner for the presentation JSON streamed by the LLM.
+
+    Chunks are fed as they arrive and every element of the top level
+    ``slides`` array is returned as soon as its closing brace is seen, long
+    before the whole document is complete. Each character is scanned once.
+    Elements come with their position in the array, which counts elements
+    that could not be parsed as well.
+    """
+
+    def __init__(self, array_key: str = "slides"):
+        self.array_key = array_key
+        self.text = ""
+        self._position = 0
+        # Open containers, "{" or "["
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._object_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._element_start: Optional[int] = None
+        self.element_count = 0
+
+    def feed(self, chunk: str) -> List[Tuple[int, dict]]:
+        """Add ``chunk`` and return the slides it completed with their positions."""
+        self.text += chunk
+        completed = []
+        text = self.text
+
+        while self._position < len(text):
+            position = self._position
+            char = text[position]
+            self._position += 1
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1 and self._array_depth is None:
+                        self._last_string = text[self._string_start : position]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = position + 1
+            elif char == ":":
+                if len(self._stack) == 1:
+                    self._object_key = self._last_string
+            elif char == ",":
+                if len(self._stack) == 1:
+                    self._object_key = None
+            elif char in "{[":
+                if (
+                    char == "["
+                    and self._array_depth is None
+                    and self._stack == ["{"]
+                    and self._object_key == self.array_key
+                ):
+                    self._array_depth = 2
+                elif (
+                    char == "{"
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    self._element_start = position
+                self._stack.append(char)
+            elif char in "}]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if (
+                    char == "}"
+                    and self._element_start is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    element = self._parse(text[self._element_start : position + 1])
+                    self._element_start = None
+                    if element is not None:
+                        completed.append((self.element_count, element))
+                    self.element_count += 1
+                elif char == "]" and len(self._stack) + 1 == self._array_depth:
+                    # The slides array is closed, later arrays are not slides
+                    self._array_depth = -1
+
+        return completed
+
+    def _parse(self, element_text: str) -> Optional[dict]:
+        try:
+            element = json.loads(element_text)
+        except json.JSONDecodeError:
+            return None
+        return element if isinstance(element, dict) else None
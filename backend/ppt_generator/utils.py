@@ -119,35 +119,23 @@ def round_image_corners(image: Image.Image, radii: List[int]) -> Image.Image:
 
 
 def change_image_color(img: Image.Image, color: str) -> Image.Image:
-    # r, g, b, alpha = img.split()
-
-    # color_overlay = Image.new("RGBA", img.size, color=f"#{color}")
-    # return Image.composite(color_overlay, img, alpha)
     if color.startswith("#"):
         color = color[1:]
     r_new = int(color[:2], 16)
     g_new = int(color[2:4], 16)
     b_new = int(color[4:], 16)
 
-    # Get image data
-    data = img.getdata()
-
-    # Process each pixel
-    new_data = []
-    for item in data:
-        # Get current pixel values
-        r, g, b, a = item
-
-        # Apply new color while preserving transparency
-        if a != 0:  # Skip fully transparent pixels
-            new_data.append((r_new, g_new, b_new, a))
-        else:
-            new_data.append((0, 0, 0, 0))
-
-    # Create new image with modified data
-    new_img = Image.new("RGBA", img.size)
-    new_img.putdata(new_data)
-    return new_img
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+
+    # Recolor whole channels at once through lookup tables on the alpha
+    # channel: visible pixels take the overlay color, fully transparent
+    # pixels become (0, 0, 0, 0), and alpha itself is preserved.
+    alpha = img.getchannel("A")
+    channels = [
+        alpha.point([0] + [value] * 255) for value in (r_new, g_new, b_new)
+    ]
+    return Image.merge("RGBA", (*channels, alpha))
 
 
 def create_circle_image(
@@ -151,16 +151,13 @@ async def download_presentation(
     
     # For legacy presentations, serve file directly
     elif presentation.file_path:
-        file_content = file_manager.get_presentation_file_content(presentation)
-        if file_content:
-            from fastapi.responses import Response
-            filename = f"{presentation.title}.pptx"
-            return Response(
-                content=file_content,
+        file_path = file_manager.get_presentation_file_path(presentation)
+        if file_path:
+            # Streamed with Content-Length, ETag and Range support for resumable downloads
+            return FileResponse(
+                path=file_path,
                 media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{filename}"'
-                }
+                filename=f"{presentation.title}.pptx",
             )
     
     raise HTTPException(
@@ -20,7 +20,9 @@ os.environ.setdefault("USER_CONFIG_PATH", os.path.join(data_dir, "config.json"))
 os.environ.setdefault("LLM", "google")
 # Google API key will be loaded from .env file
 
-from api.main import app
-
 if __name__ == "__main__":
+    # Imported here only, processes spawned by the picture render pool run
+    # this module again and must not start a copy of the app
+    from api.main import app
+
     uvicorn.run("api.main:app", host="127.0.0.1", port=8000, reload=True, log_level="info")
@@ -75,20 +75,25 @@ class FileManager:
         self,
         user_id: int,
         title: str,
-        file_content: bytes,
+        file_content: Optional[bytes] = None,
         file_extension: str = ".pptx",
         session: Session = None,
-        use_uploadthing: bool = True
+        use_uploadthing: bool = True,
+        file_path: Optional[str] = None
     ) -> Presentation:
-        """Save a generated presentation (async version for UploadThing support)."""
+        """Save a generated presentation (async version for UploadThing support).
+
+        The presentation is given as ``file_content`` or as ``file_path``, which
+        is streamed from disk instead of being read into memory.
+        """
         
         if use_uploadthing:
             return await self._save_presentation_uploadthing(
-                user_id, title, file_content, file_extension, session
+                user_id, title, file_content, file_extension, session, file_path
             )
         else:
             return self._save_presentation_legacy(
-                user_id, title, file_content, file_extension, session
+                user_id, title, file_content, file_extension, session, file_path
             )
     
     def save_presentation(
@@ -109,9 +114,10 @@ class FileManager:
         self,
         user_id: int,
         title: str,
-        file_content: bytes,
+        file_content: Optional[bytes],
         file_extension: str = ".pptx",
-        session: Session = None
+        session: Session = None,
+        file_path: Optional[str] = None
     ) -> Presentation:
         try:
             filename = f"{title.replace(' ', '_')}{file_extension}"
@@ -119,7 +125,8 @@ class FileManager:
             upload_result = await uploadthing_service.upload_presentation(
                 file_content=file_content,
                 filename=filename,
-                user_id=user_id
+                user_id=user_id,
+                file_path=file_path
             )
             
             if not upload_result or not upload_result.get('url'):
@@ -133,7 +140,7 @@ class FileManager:
                 title=title,
                 uploadthing_url=upload_result['url'],
                 uploadthing_key=upload_result['key'],
-                file_size=len(file_content)
+                file_size=upload_result['size']
             )
             
             if session:
@@ -146,16 +153,17 @@ class FileManager:
         except Exception as e:
             logging.error(f"Failed to save presentation with UploadThing: {str(e)}")
             return self._save_presentation_legacy(
-                user_id, title, file_content, file_extension, session
+                user_id, title, file_content, file_extension, session, file_path
             )
     
     def _save_presentation_legacy(
         self,
         user_id: int,
         title: str,
-        file_content: bytes,
+        file_content: Optional[bytes],
         file_extension: str = ".pptx",
-        session: Session = None
+        session: Session = None,
+        file_path: Optional[str] = None
     ) -> Presentation:
         """Save presentation using legacy local storage method."""
         # Generate unique filename
@@ -163,23 +171,26 @@ class FileManager:
         
         # Get user presentations directory
         presentations_dir = self.get_presentations_directory(user_id)
-        file_path = presentations_dir / unique_filename
+        destination_path = presentations_dir / unique_filename
         
         # Save file
         try:
-            with open(file_path, "wb") as buffer:
-                buffer.write(file_content)
+            if file_path is None:
+                with open(destination_path, "wb") as buffer:
+                    buffer.write(file_content)
+            else:
+                shutil.copyfile(file_path, destination_path)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Could not save presentation: {str(e)}")
         
         # Create database record with legacy file path
         # Ensure consistent forward slash path separators for cross-platform compatibility
-        normalized_path = str(file_path).replace('\\', '/')
+        normalized_path = str(destination_path).replace('\\', '/')
         presentation = Presentation(
             owner_id=user_id,
             title=title,
             file_path=normalized_path,
-            file_size=len(file_content)
+            file_size=os.path.getsize(destination_path)
         )
         
         if session:
@@ -319,14 +330,10 @@ class FileManager:
             return f"/files/presentations/{presentation.id}/download"
         return None
     
-    def get_presentation_file_content(self, presentation: Presentation) -> Optional[bytes]:
-        """Get file content for a presentation (for legacy local files)."""
-        if presentation.file_path and os.path.exists(presentation.file_path):
-            try:
-                with open(presentation.file_path, "rb") as f:
-                    return f.read()
-            except Exception as e:
-                logging.error(f"Error reading presentation file: {str(e)}")
+    def get_presentation_file_path(self, presentation: Presentation) -> Optional[str]:
+        """Get the local file path of a presentation (for legacy local files)."""
+        if presentation.file_path and os.path.isfile(presentation.file_path):
+            return presentation.file_path
         return None
 
 # Global file manager instance
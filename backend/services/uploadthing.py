@@ -4,10 +4,13 @@ from typing import Optional, Dict, Any
 import aiohttp
 from dotenv import load_dotenv
 
+from api.services.http_client import HttpClientRegistry, http_clients
+
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '../../.env'))
 
 class UploadThingService:
-    def __init__(self):
+    def __init__(self, http_client_registry: HttpClientRegistry = http_clients):
+        self.http_clients = http_client_registry
         self.secret_key = os.getenv("UPLOADTHING_SECRET")
         if not self.secret_key:
             raise ValueError("UPLOADTHING_SECRET environment variable is required")
@@ -20,15 +23,22 @@ class UploadThingService:
     
     async def upload_presentation(
         self, 
-        file_content: bytes, 
+        file_content: Optional[bytes], 
         filename: str, 
         user_id: int,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        file_path: Optional[str] = None
     ) -> Dict[str, str]:
+        """Upload a presentation given as bytes or, streamed from disk, as ``file_path``."""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
+            if file_path is None:
+                with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as temp_file:
+                    temp_file.write(file_content)
+                    temp_file_path = temp_file.name
+                upload_path = temp_file_path
+            else:
+                upload_path = file_path
+            file_size = os.path.getsize(upload_path)
             
             upload_metadata = {
                 "user_id": str(user_id),
@@ -37,28 +47,28 @@ class UploadThingService:
                 **(metadata or {})
             }
             
-            async with aiohttp.ClientSession() as session:
-                with open(temp_file_path, 'rb') as f:
-                    data = aiohttp.FormData()
-                    data.add_field('file', f, filename=filename, content_type='application/vnd.openxmlformats-officedocument.presentationml.presentation')
-                    data.add_field('metadata', str(upload_metadata))
-                    
-                    async with session.post(
-                        f"{self.base_url}/upload",
-                        data=data,
-                        headers={"Authorization": f"Bearer {self.secret_key}"}
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            return {
-                                "url": result.get("url", ""),
-                                "key": result.get("key", ""),
-                                "filename": filename,
-                                "size": len(file_content)
-                            }
-                        else:
-                            raise Exception(f"Upload failed with status {response.status}")
-            
+            session = self.http_clients.get("uploadthing")
+            with open(upload_path, 'rb') as f:
+                data = aiohttp.FormData()
+                data.add_field('file', f, filename=filename, content_type='application/vnd.openxmlformats-officedocument.presentationml.presentation')
+                data.add_field('metadata', str(upload_metadata))
+                
+                async with session.post(
+                    f"{self.base_url}/upload",
+                    data=data,
+                    headers={"Authorization": f"Bearer {self.secret_key}"}
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        return {
+                            "url": result.get("url", ""),
+                            "key": result.get("key", ""),
+                            "filename": filename,
+                            "size": file_size
+                        }
+                    else:
+                        raise Exception(f"Upload failed with status {response.status}")
+        
         except Exception as e:
             raise Exception(f"Failed to upload presentation to UploadThing: {str(e)}")
         finally:
@@ -70,12 +80,12 @@ class UploadThingService:
     
     async def delete_file(self, file_key: str) -> bool:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(
-                    f"{self.base_url}/files/{file_key}",
-                    headers=self.headers
-                ) as response:
-                    return response.status == 200
+            session = self.http_clients.get("uploadthing")
+            async with session.delete(
+                f"{self.base_url}/files/{file_key}",
+                headers=self.headers
+            ) as response:
+                return response.status == 200
         except Exception as e:
             print(f"Failed to delete file from UploadThing: {str(e)}")
             return False